@@ -4,7 +4,7 @@ from fastapi.staticfiles import StaticFiles
 import os
 
 from .constants import VIEWER_URL, RESTAPI_URL
-from .server.routers import home, meshing
+from .server.routers import admin, geometry, home, meshing
 from .server.worker.manager import Manager
 
 # check environment variable
@@ -16,6 +16,8 @@ if RESTAPI_URL not in os.environ:
 app = FastAPI()
 app.include_router(home.router)
 app.include_router(meshing.router)
+app.include_router(geometry.router)
+app.include_router(admin.router)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # setup manager with workers
@@ -1,4 +1,5 @@
 # Set as an environment variable
 RESTAPI_URL = "RESTAPI_URL"
 VIEWER_URL = "VIEWER_URL"
+WORKERS = "MESH_WORKERS"  # optional, number of gmsh worker processes
 GITHUB_URL = "https://github.com/thisistheplace/joint_model"
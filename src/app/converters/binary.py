@@ -0,0 +1,133 @@
+"""Binary container for DashVtkModel meshes
+
+Layout (all values little-endian):
+
+    header      40 bytes  struct HEADER_FORMAT
+    name        utf-8 bytes padded to a multiple of 8 bytes
+    points      float64 array of length num_points
+    polys       int32 or int64 array of length num_polys
+    lines       int32 or int64 array of length num_lines
+
+Arrays are decoded as views into the received buffer without copying.
+"""
+import struct
+from typing import Any, Generator
+
+import numpy as np
+
+from ..interfaces import DashVtkModel, NpDashVtkMesh, NpDashVtkModel
+
+MEDIA_TYPE = "application/x-dashvtk"
+MAGIC = b"DVTK"
+VERSION = 1
+# magic, version, index itemsize, name length, num points, num polys, num lines, padding
+HEADER_FORMAT = "<4sHHIQQQ4x"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+POINT_DTYPE = np.dtype("<f8")
+INDEX_DTYPES = {4: np.dtype("<i4"), 8: np.dtype("<i8")}
+CHUNK_SIZE = 1 << 20  # bytes
+
+
+class DashVtkFormatError(Exception):
+    pass
+
+
+def _pad(size: int, align: int = 8) -> int:
+    return -size % align
+
+
+def encode_dash_vtk(model: DashVtkModel | NpDashVtkModel) -> list[Any]:
+    """Encode a mesh into binary sections
+
+    Returns:
+        list of bytes-like sections which concatenate into the binary container
+    """
+    points = np.ascontiguousarray(model.mesh.points, dtype=POINT_DTYPE)
+    polys = np.asarray(model.mesh.polys)
+    lines = np.asarray(model.mesh.lines)
+    largest = max(
+        int(polys.max()) if polys.size else 0, int(lines.max()) if lines.size else 0
+    )
+    index_dtype = INDEX_DTYPES[4 if largest <= np.iinfo(np.int32).max else 8]
+    polys = np.ascontiguousarray(polys, dtype=index_dtype)
+    lines = np.ascontiguousarray(lines, dtype=index_dtype)
+
+    name = model.name.encode("utf-8")
+    header = struct.pack(
+        HEADER_FORMAT,
+        MAGIC,
+        VERSION,
+        index_dtype.itemsize,
+        len(name),
+        points.size,
+        polys.size,
+        lines.size,
+    )
+    return [
+        header,
+        name + b"\0" * _pad(len(name)),
+        memoryview(points).cast("B"),
+        memoryview(polys).cast("B"),
+        memoryview(lines).cast("B"),
+    ]
+
+
+def iter_dash_vtk(
+    model: DashVtkModel | NpDashVtkModel, chunk_size: int = CHUNK_SIZE
+) -> Generator[bytes, None, None]:
+    """Yield the binary container in chunks of at most chunk_size bytes"""
+    for section in encode_dash_vtk(model):
+        view = memoryview(section)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start : start + chunk_size])
+
+
+def decode_dash_vtk(buffer: bytes | bytearray | memoryview) -> NpDashVtkModel:
+    """Decode a binary container without copying the arrays
+
+    Args:
+        buffer: bytes-like object holding the full container
+
+    Returns:
+        NpDashVtkModel with arrays viewing buffer
+
+    Raises:
+        DashVtkFormatError if buffer is not a valid container
+    """
+    buffer = memoryview(buffer)
+    if len(buffer) < HEADER_SIZE:
+        raise DashVtkFormatError(
+            f"Buffer of {len(buffer)} bytes is too small for a mesh header"
+        )
+    magic, version, itemsize, name_len, num_points, num_polys, num_lines = (
+        struct.unpack_from(HEADER_FORMAT, buffer)
+    )
+    if magic != MAGIC:
+        raise DashVtkFormatError(f"Unrecognised mesh format {bytes(magic)}")
+    if version != VERSION:
+        raise DashVtkFormatError(f"Unsupported mesh format version {version}")
+    if itemsize not in INDEX_DTYPES:
+        raise DashVtkFormatError(f"Unsupported index size {itemsize}")
+    index_dtype = INDEX_DTYPES[itemsize]
+
+    offset = HEADER_SIZE
+    name = bytes(buffer[offset : offset + name_len]).decode("utf-8")
+    offset += name_len + _pad(name_len)
+    expected = (
+        offset
+        + num_points * POINT_DTYPE.itemsize
+        + (num_polys + num_lines) * itemsize
+    )
+    if len(buffer) != expected:
+        raise DashVtkFormatError(
+            f"Mesh buffer has {len(buffer)} bytes, expected {expected}"
+        )
+
+    points = np.frombuffer(buffer, POINT_DTYPE, num_points, offset)
+    offset += points.nbytes
+    polys = np.frombuffer(buffer, index_dtype, num_polys, offset)
+    offset += polys.nbytes
+    lines = np.frombuffer(buffer, index_dtype, num_lines, offset)
+    return NpDashVtkModel(
+        name=name, mesh=NpDashVtkMesh(points=points, polys=polys, lines=lines)
+    )
@@ -1,8 +1,8 @@
-from collections import defaultdict
 from enum import Enum
 import gmsh
+import numpy as np
 
-from ..interfaces import DashVtkMesh
+from ..interfaces import DashVtkMesh, NpDashVtkMesh
 
 class ElementType(str, Enum):
     TRIANGLE = "Triangle"
@@ -13,47 +13,74 @@ NUM_NODES = {
     ElementType.QUADRANGLE: 4
 }
 
-def process_mesh(mesh: gmsh.model.mesh, eltype: ElementType):
+def process_mesh(mesh: gmsh.model.mesh, eltype: ElementType) -> tuple[np.ndarray, np.ndarray]:
+    """Find elements with unique faces
+
+    Returns:
+        tuple of (element tags shape (E,), element node tags shape (E, NUM_NODES))
+    """
+    num_nodes = NUM_NODES[eltype]
     elementType = mesh.getElementType(eltype.value, 1)
-    faceNodes = mesh.getElementFaceNodes(elementType, NUM_NODES[eltype])
+    faceNodes = mesh.getElementFaceNodes(elementType, num_nodes)
+
+    faceTags, _ = mesh.getFaces(num_nodes, faceNodes)
+    elementTags, nodeTags = mesh.getElementsByType(elementType)
+    elementTags = np.asarray(elementTags)
+    nodeTags = np.asarray(nodeTags).reshape(-1, num_nodes)
+
+    # first element of each face, in order of first appearance
+    _, first = np.unique(np.asarray(faceTags), return_index=True)
+    first = np.sort(first)
+    return elementTags[first], nodeTags[first]
+
+
+def _remap_nodes(mesh: gmsh.model.mesh, node_tags: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Number nodes by order of first appearance in node_tags
+
+    Returns:
+        tuple of (point coordinates shape (P, 3), point indices with the shape of node_tags)
+    """
+    unique_tags, first, inverse = np.unique(
+        node_tags.ravel(), return_index=True, return_inverse=True
+    )
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    indices = rank[inverse.reshape(-1)].reshape(node_tags.shape)
+
+    allTags, allCoords, _ = mesh.getNodes()
+    allTags = np.asarray(allTags)
+    allCoords = np.asarray(allCoords).reshape(-1, 3)
+    sorter = np.argsort(allTags)
+    positions = sorter[np.searchsorted(allTags, unique_tags[order], sorter=sorter)]
+    return allCoords[positions], indices
 
-    faceTags, _ = mesh.getFaces(NUM_NODES[eltype], faceNodes)
-    elementTags, _ = mesh.getElementsByType(elementType)
 
-    faces2Elements = defaultdict(list)
+def mesh_to_np_dash_vtk(mesh: gmsh.model.mesh, eltype: ElementType) -> NpDashVtkMesh:
+    _, node_tags = process_mesh(mesh, eltype)
+    points, indices = _remap_nodes(mesh, node_tags)
 
-    for i in range(len(faceTags)):
-        faces2Elements[faceTags[i]].append(elementTags[i])
+    num_elements, num_nodes = indices.shape
+    # [N, a, b, c, ...] per element
+    polys = np.empty((num_elements, num_nodes + 1), dtype=np.int64)
+    polys[:, 0] = num_nodes
+    polys[:, 1:] = indices
+    # [N + 1, a, b, c, ..., a] per element to close the outline
+    lines = np.empty((num_elements, num_nodes + 2), dtype=np.int64)
+    lines[:, 0] = num_nodes + 1
+    lines[:, 1:-1] = indices
+    lines[:, -1] = indices[:, 0]
 
-    return faces2Elements
+    return NpDashVtkMesh(
+        points=points.ravel(), polys=polys.ravel(), lines=lines.ravel()
+    )
 
 
 def mesh_to_dash_vtk(mesh: gmsh.model.mesh, eltype: ElementType) -> DashVtkMesh:
-    face2el = process_mesh(mesh, eltype)
-
-    outerfaces = [k for k in face2el.keys()]
-
-    nid2pointidx = {}  # key: node number, value: index in points
-    points = []
-    lines = []
-    polys = []
-
-    for element in outerfaces:
-        _, node_ids = mesh.getElement(element)
-        # if eltype != 2 or len(node_ids) != 3:
-        #     continue
-        line = [len(node_ids) + 1]
-        poly = [len(node_ids)]
-        for nid in node_ids:
-            if nid not in nid2pointidx:
-                coords, _ = mesh.getNode(nid)
-                points += coords.tolist()
-                nid2pointidx[nid] = int(len(points) / 3 - 1)
-            line.append(nid2pointidx[nid])
-            poly.append(nid2pointidx[nid])
-        line.append(line[1])
-
-        lines += line
-        polys += poly
-
-    return DashVtkMesh(points=points, lines=lines, polys=polys)
+    np_mesh = mesh_to_np_dash_vtk(mesh, eltype)
+    # arrays are built with the correct types so skip per item validation
+    return DashVtkMesh.construct(
+        points=np_mesh.points.tolist(),
+        lines=np_mesh.lines.tolist(),
+        polys=np_mesh.polys.tolist(),
+    )
@@ -1,10 +1,26 @@
-from .mesh import mesh_to_dash_vtk, ElementType
+from .mesh import mesh_to_dash_vtk, mesh_to_np_dash_vtk, ElementType
 
 from ..interfaces import *
 from ..modelling.mesher.mesh import mesh_model
+from ..modelling.mesher.session import GmshSession
 
 
-def convert_model_to_dash_vtk(model: Model) -> DashVtkModel:
-    with mesh_model(model, MeshSpecs(size=0.1)) as mesh:
+def convert_model_to_dash_vtk(
+    model: Model, specs: MeshSpecs | None = None, session: GmshSession | None = None
+) -> DashVtkModel:
+    if specs is None:
+        specs = DEFAULT_MESH_SPECS
+    with mesh_model(model, specs, session) as mesh:
         mesh = mesh_to_dash_vtk(mesh, ElementType.QUADRANGLE)
         return DashVtkModel(name=model.name, mesh=mesh)
+
+
+def convert_model_to_np_dash_vtk(
+    model: Model, specs: MeshSpecs | None = None, session: GmshSession | None = None
+) -> NpDashVtkModel:
+    """As convert_model_to_dash_vtk, keeping the mesh as arrays"""
+    if specs is None:
+        specs = DEFAULT_MESH_SPECS
+    with mesh_model(model, specs, session) as mesh:
+        mesh = mesh_to_np_dash_vtk(mesh, ElementType.QUADRANGLE)
+        return NpDashVtkModel(name=model.name, mesh=mesh)
@@ -0,0 +1,34 @@
+from ..interfaces import Model, ModelOutline, SlaveOutline
+from ..modelling.geometry.outline import FlatOutline, joint_outlines
+
+
+def _model_outline(name: str, outlines: dict[str, FlatOutline]) -> ModelOutline:
+    return ModelOutline(
+        name=name,
+        slaves=[
+            SlaveOutline(
+                name=slave,
+                intersect=outline.intersect.tolist(),
+                flat_intersect=outline.flat_intersect.tolist(),
+                weld=outline.weld.ravel().tolist(),
+                hole=outline.hole.ravel().tolist(),
+            )
+            for slave, outline in outlines.items()
+        ],
+    )
+
+
+def convert_models_to_outlines(models: list[Model]) -> list[ModelOutline]:
+    """Weld lines and hole outlines of models without meshing, in one numpy pass
+
+    Raises:
+        IntersectionError if a slave does not intersect the master
+    """
+    outlines = joint_outlines([model.joint for model in models])
+    return [
+        _model_outline(model.name, outline) for model, outline in zip(models, outlines)
+    ]
+
+
+def convert_model_to_outline(model: Model) -> ModelOutline:
+    return convert_models_to_outlines([model])[0]
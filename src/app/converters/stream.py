@@ -0,0 +1,110 @@
+"""Incremental json encoding and compression of DashVtkModel meshes
+
+The json document is written a chunk of array items at a time, so the first bytes are
+sent straight away and memory use does not grow with the size of the mesh. Chunks can
+be compressed with gzip or brotli as they are produced.
+"""
+import json
+from typing import Any, Generator, Iterable
+import zlib
+
+import numpy as np
+
+from ..interfaces import DashVtkModel, NpDashVtkModel
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+CHUNK_ITEMS = 1 << 16  # array items encoded per chunk
+GZIP = "gzip"
+BROTLI = "br"
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4  # higher qualities are too slow to stream large meshes
+
+
+def _iter_array(
+    values: np.ndarray | list, chunk_items: int
+) -> Generator[str, None, None]:
+    """Encode a flat array as a json list"""
+    yield "["
+    for start in range(0, len(values), chunk_items):
+        chunk = values[start : start + chunk_items]
+        if isinstance(chunk, np.ndarray):
+            chunk = chunk.tolist()
+        # json formats floats exactly as json.dump of the whole list would
+        items = json.dumps(chunk)[1:-1]
+        yield items if start == 0 else ", " + items
+    yield "]"
+
+
+def iter_dash_vtk_json(
+    model: DashVtkModel | NpDashVtkModel, chunk_items: int = CHUNK_ITEMS
+) -> Generator[bytes, None, None]:
+    """Yield the json encoding of a mesh in chunks of at most chunk_items array items"""
+    yield f'{{"name": {json.dumps(model.name)}, "mesh": {{'.encode("utf-8")
+    for i, field in enumerate(["points", "polys", "lines"]):
+        separator = ", " if i else ""
+        yield f'{separator}"{field}": '.encode("utf-8")
+        for text in _iter_array(getattr(model.mesh, field), chunk_items):
+            yield text.encode("utf-8")
+    yield b"}}"
+
+
+def accepted_encoding(accept_encoding: str | None) -> str | None:
+    """Preferred supported content encoding of an Accept-Encoding header
+
+    Returns:
+        BROTLI, GZIP or None for no compression
+    """
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, *params = [part.strip() for part in coding.split(";")]
+        weight = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    weight = float(param[2:])
+                except ValueError:
+                    weight = 0.0
+        weights[name.lower()] = weight
+    supported = [BROTLI, GZIP] if brotli is not None else [GZIP]
+    candidates = [
+        coding
+        for coding in supported
+        if weights.get(coding, weights.get("*", 0.0)) > 0
+    ]
+    if not candidates:
+        return None
+    # brotli wins ties as it compresses better
+    return max(candidates, key=lambda coding: weights.get(coding, weights.get("*")))
+
+
+def compress_chunks(
+    chunks: Iterable[Any], encoding: str | None
+) -> Generator[bytes, None, None]:
+    """Compress chunks as they are produced
+
+    Each chunk is flushed so the client can decode it without waiting for the rest.
+
+    Args:
+        chunks: bytes-like chunks
+        encoding: BROTLI, GZIP or None to pass the chunks through
+    """
+    if encoding is None:
+        yield from (bytes(chunk) for chunk in chunks)
+    elif encoding == GZIP:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+    elif encoding == BROTLI and brotli is not None:
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        for chunk in chunks:
+            yield compressor.process(bytes(chunk)) + compressor.flush()
+        yield compressor.finish()
+    else:
+        raise ValueError(f"Unsupported content encoding {encoding}")
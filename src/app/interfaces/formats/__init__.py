@@ -1 +1,2 @@
 from .dash_vtk import *
+from .outline import *
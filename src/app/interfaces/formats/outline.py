@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class SlaveOutline(BaseModel):
+    name: str = ...
+    # 3D point where the slave axis meets the master surface [x, y, z]
+    intersect: list[float] = ...
+    # intersect on the flattened master [x, y, z]
+    flat_intersect: list[float] = ...
+    # Flat list of weld line coordinates on the flattened master
+    # [x1, y1, z1, x2, y2, z2, ..., zN]
+    weld: list[float] = ...
+    # Flat list of the points of the hole curve loop on the flattened master
+    hole: list[float] = ...
+
+
+class ModelOutline(BaseModel):
+    name: str = ...
+    slaves: list[SlaveOutline] = ...
@@ -38,6 +38,18 @@ def _map_model(input: Model):
     return NpModel(name=input.name, joint=map_to_np(input.joint))
 
 
+def _map_dash_vtk_mesh(input: DashVtkMesh):
+    return NpDashVtkMesh(
+        points=np.asarray(input.points, dtype=float),
+        polys=np.asarray(input.polys, dtype=int),
+        lines=np.asarray(input.lines, dtype=int),
+    )
+
+
+def _map_dash_vtk_model(input: DashVtkModel):
+    return NpDashVtkModel(name=input.name, mesh=map_to_np(input.mesh))
+
+
 def _not_found(input: Any):
     raise TypeError(f"Could not match interface type {type(input)} and numpy types")
 
@@ -50,6 +62,8 @@ def map_to_np(input: Any) -> Any:
         Tubular: _map_tubular,
         Joint: _map_joint,
         Model: _map_model,
+        DashVtkMesh: _map_dash_vtk_mesh,
+        DashVtkModel: _map_dash_vtk_model,
         NoneType: lambda input: None,
     }
     return mappers.get(type(input), _not_found)(input)
@@ -1,8 +1,22 @@
 """Defines common specs for meshing"""
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class MeshSpecs(BaseModel):
     # Add some validation here for OneOf
     size: float | None = None
     interval: float | None = None
+    # Element size at the weld lines, defaults to size
+    weld_size: float | None = None
+    # Element size far from the weld lines, towards the tube ends, defaults to size
+    far_size: float | None = None
+    # Distance from the weld lines within which elements are weld_size
+    weld_distance: float | None = None
+    # Distance beyond weld_distance over which elements grow to far_size
+    transition_distance: float | None = None
+    # Threads gmsh meshes with, defaults to the cpus allotted to the worker
+    threads: int | None = Field(default=None, ge=1)
+
+
+# Specs used when a request does not define any
+DEFAULT_MESH_SPECS = MeshSpecs(size=0.1)
@@ -1,2 +1,3 @@
 from .geometry import *
 from .model import *
+from .dash_vtk import *
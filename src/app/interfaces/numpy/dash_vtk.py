@@ -0,0 +1,17 @@
+import numpy as np
+
+from .base import NpBaseModel
+
+
+class NpDashVtkMesh(NpBaseModel):
+    # Flat array of 3D nodal coordinates
+    points: np.ndarray = ...
+    # Flat array of number of nodes, and node indices defining polys
+    polys: np.ndarray = ...
+    # Flat array of number of nodes, and node indices defining lines
+    lines: np.ndarray = ...
+
+
+class NpDashVtkModel(NpBaseModel):
+    name: str = ...
+    mesh: NpDashVtkMesh = ...
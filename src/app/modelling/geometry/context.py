@@ -0,0 +1,84 @@
+"""Geometry shared by the weld, hole and centre of each master and slave pair
+
+The weld ring, hole outline and flattened centre of a slave all start from where the
+slave meets the master. A GeometryContext computes that once per pair for a job and
+shares it, the arrays are read only so they can not be changed by one user for another.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from .intersections import (
+    NpCircle,
+    arc_angle_signed,
+    flatten_intersection,
+    intersection,
+)
+from .vectors import rotate_vectors, unit_vector
+from ...interfaces import NpTubular
+
+Z_AXIS = np.array([0.0, 0.0, 1.0])
+
+
+class PairGeometry(NamedTuple):
+    intersect: np.ndarray  # where the slave axis meets the master surface
+    flat_intersect: np.ndarray  # intersect on the flattened master
+    arc_angle: float  # angle the slave vector is rotated by about the master axis
+    slave_vector: np.ndarray  # unit slave vector on the flattened master
+
+
+def pair_geometry(master: NpTubular, slave: NpTubular) -> PairGeometry:
+    """Intersection of slave with master and its position on the flattened master
+
+    Raises:
+        IntersectionError if the slave does not intersect the master
+    """
+    intersect = intersection(master, slave)
+    flat_intersect = flatten_intersection(master, intersect.copy())
+    # Radius point is on Y axis at radius
+    radius_point = np.array([0.0, master.diameter / 2.0, intersect[2]])
+    circle = NpCircle(master.axis.point.array[:2], master.diameter / 2.0)
+    arc_angle = arc_angle_signed(circle, radius_point) + arc_angle_signed(
+        circle, intersect
+    )
+    # Adjust slave vector angle by arc angle (rotate about Z axis)
+    slave_vector = rotate_vectors(
+        unit_vector(slave.axis.vector.array), Z_AXIS, np.array([arc_angle * -1.0])
+    )[0]
+    for values in [intersect, flat_intersect, slave_vector]:
+        values.setflags(write=False)
+    return PairGeometry(intersect, flat_intersect, arc_angle, slave_vector)
+
+
+def _pair_key(master: NpTubular, slave: NpTubular) -> tuple:
+    # names are not guaranteed to be unique so the geometry is part of the key
+    return tuple(
+        [master.name, slave.name, master.diameter, slave.diameter]
+        + master.axis.point.array.tolist()
+        + master.axis.vector.array.tolist()
+        + slave.axis.point.array.tolist()
+        + slave.axis.vector.array.tolist()
+    )
+
+
+class GeometryContext:
+    """PairGeometry of each master and slave pair of a job, computed once"""
+
+    def __init__(self):
+        self._pairs: dict[tuple, PairGeometry] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"pairs": len(self._pairs), "hits": self._hits, "misses": self._misses}
+
+    def pair(self, master: NpTubular, slave: NpTubular) -> PairGeometry:
+        key = _pair_key(master, slave)
+        geometry = self._pairs.get(key)
+        if geometry is None:
+            self._misses += 1
+            geometry = self._pairs[key] = pair_geometry(master, slave)
+        else:
+            self._hits += 1
+        return geometry
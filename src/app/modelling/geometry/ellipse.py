@@ -1,16 +1,18 @@
 from typing import Generator
-import gmsh
 import math
 import numpy as np
-from scipy import optimize
+from scipy import optimize, special
 import sympy
 
 from .exceptions import GeometryException
 
-FACTORY = gmsh.model.occ
-
 # TODO: review this https://www.maplesoft.com/applications/Preview.aspx?id=3773
 
+# Number of samples used to build the arc length lookup table over a half ellipse
+ARC_TABLE_SIZE = 2049
+# Maximum number of batched Newton iterations used to refine the chord points
+MAX_NEWTON_ITERATIONS = 50
+
 
 def ellipse_quadrant_points(
     centre: np.ndarray,
@@ -19,10 +21,12 @@ def ellipse_quadrant_points(
     interval: int | None = None,
     size: float | None = None,
     rtol: float = 1.0e-6,
+    use_sympy: bool = False,
 ) -> Generator[np.ndarray, np.ndarray, None]:
     """Creates points around an ellipse at interval frequency or size within the first quadrant.
 
-    TODO: use a deterministic, non-iterative method to improve performance!
+    Points are spaced by equal chord lengths starting at angle 0.0. The point at angle pi / 2
+    is returned (not yielded) by the generator.
 
     Args:
         centre: numpy array defining ellipse centre, shape (2,)
@@ -31,6 +35,8 @@ def ellipse_quadrant_points(
         interval: number of intervals within a quadrant of the ellipse
         size: size of distances between intermediary points
         rtol: relative tolerance used to determine if first and last points are the same
+        use_sympy: if True the iterative sympy / scipy solver is used instead of the
+            numpy engine (slow, kept for cross-checking)
 
     Returns:
         Generator of np.ndarray objects including all points (points and intermediary)
@@ -46,30 +52,207 @@ def ellipse_quadrant_points(
     if radius_y is None:
         radius_y = radius_x
 
-    # figure out start point
-    start_point = sympy.Point2D([centre[0] + float(radius_x), centre[1]])
-    start_angle = 0.0
-    # Ellipse is 2D
-    ellipse = sympy.Ellipse(centre[:2], radius_x, radius_y)
-    # setup parametric next point
-    param_angle = sympy.symbols("param_angle")
-    param_point = ellipse.arbitrary_point(param_angle)
-    # determine increment size / segment length
+    if use_sympy:
+        return (
+            yield from _sympy_ellipse_quadrant_points(
+                centre, radius_x, radius_y, interval, size, rtol
+            )
+        )
+
+    points = ellipse_quadrant_array(centre, radius_x, radius_y, interval, size, rtol)
+    yield from points
+    return np.array(
+        [float(centre[0]), float(centre[1]) + float(radius_y)], dtype=float
+    )
+
+
+def ellipse_quadrant_array(
+    centre: np.ndarray,
+    radius_x: float,
+    radius_y: float | None = None,
+    interval: int | None = None,
+    size: float | None = None,
+    rtol: float = 1.0e-6,
+) -> np.ndarray:
+    """Creates all equal chord points within the first quadrant of an ellipse in one batch
+
+    The start point at angle 0.0 is included, the end point at angle pi / 2 is not.
+
+    Args:
+        centre: numpy array defining ellipse centre, shape (2,)
+        radius_x: float defining the radius in the x direction
+        radius_y: float defining the radius in the y direction (if None, radius_x is taken)
+        interval: number of intervals within a quadrant of the ellipse
+        size: size of distances between intermediary points
+        rtol: numerical tolerance of chord lengths
+
+    Returns:
+        np.ndarray of points with shape (N, 2)
+
+    Raises:
+        GeometryException if the chord points could not be found
+    """
+    if (interval is not None and size is not None) or (
+        interval is None and size is None
+    ):
+        raise ValueError(
+            "Cannot provide values for intervals and size to add_line method"
+        )
+    if radius_y is None:
+        radius_y = radius_x
+    radius_x = float(radius_x)
+    radius_y = float(radius_y)
+
     if interval is not None:
-        size = ellipse.circumference.evalf() / 4.0 / abs(interval)
-    # TODO: stop being lazy and calculate points at quadrant 1 then rotate 3 times to get the remaining
-    # which should avoid scipy.optimize needing to be called so frequently
-    yield np.array(start_point, dtype=float)
-    while True:
-        pnt_angle = ellipse_segment_angle(ellipse, start_point, start_angle, size, rtol)
-        if pnt_angle >= math.pi / 2.0:
-            pnt_angle = math.pi / 2.0
-            next_point: sympy.Point2D = param_point.subs(param_angle, pnt_angle)
-            return np.array(next_point.coordinates, dtype=float)
-        next_point: sympy.Point2D = param_point.subs(param_angle, pnt_angle)
-        yield np.array(next_point.coordinates, dtype=float)
-        start_point = next_point
-        start_angle = pnt_angle
+        size = ellipse_quadrant_length(radius_x, radius_y) / abs(interval)
+
+    angles = ellipse_chord_angles(radius_x, radius_y, float(size), rtol)
+    angles = angles[angles < math.pi / 2.0]
+
+    points = np.empty((len(angles), 2))
+    points[:, 0] = float(centre[0]) + radius_x * np.cos(angles)
+    points[:, 1] = float(centre[1]) + radius_y * np.sin(angles)
+    return points
+
+
+def ellipse_points(
+    centre: np.ndarray,
+    radius_x: float,
+    radius_y: float | None = None,
+    interval: int | None = None,
+    size: float | None = None,
+    rtol: float = 1.0e-6,
+) -> Generator[np.ndarray, np.ndarray, None]:
+    """Creates points around a full ellipse, anticlockwise from angle 0.0
+
+    The first quadrant is solved once and mirrored to create the remaining three quadrants.
+
+    Args:
+        centre: numpy array defining ellipse centre, shape (2,)
+        radius_x: float defining the radius in the x direction
+        radius_y: float defining the radius in the y direction (if None, radius_x is taken)
+        interval: number of intervals within a quadrant of the ellipse
+        size: size of distances between intermediary points
+        rtol: numerical tolerance of chord lengths
+
+    Returns:
+        Generator of np.ndarray objects of shape (2,), the first point is not repeated
+    """
+    if centre is None or radius_x is None:
+        raise ValueError("Cannot create ellipse loop if centre or radius_x are None.")
+    if radius_y is None:
+        radius_y = radius_x
+
+    quadrant = ellipse_quadrant_array(centre, radius_x, radius_y, interval, size, rtol)
+    centre = np.array(centre[:2], dtype=float)
+    top = np.array([centre[0], centre[1] + float(radius_y)])
+    # local coordinates make mirroring about the ellipse axes trivial
+    local = np.vstack([quadrant, top]) - centre
+    mirror_x = np.array([-1.0, 1.0])
+    mirror_y = np.array([1.0, -1.0])
+    yield from quadrant
+    # quadrant 2 runs from pi / 2 to pi, skip the shared point at angle 0.0
+    yield from (local[::-1] * mirror_x + centre)[:-1]
+    # quadrant 3 runs from pi to 3 pi / 2
+    yield from (local * -1.0 + centre)[:-1]
+    # quadrant 4 runs from 3 pi / 2 to 2 pi
+    yield from (local[::-1] * mirror_y + centre)[:-1]
+
+
+def ellipse_quadrant_length(radius_x: float, radius_y: float) -> float:
+    """Length of the circumference of a quarter of an ellipse"""
+    major = max(abs(radius_x), abs(radius_y))
+    minor = min(abs(radius_x), abs(radius_y))
+    if major == 0.0:
+        return 0.0
+    return float(major * special.ellipe(1.0 - (minor / major) ** 2))
+
+
+def ellipse_chord_angles(
+    radius_x: float, radius_y: float, size: float, rtol: float = 1.0e-6
+) -> np.ndarray:
+    """Parametric angles of consecutive points separated by chord length size
+
+    The first angle is 0.0 and enough angles are returned to reach (or pass) pi / 2.
+    The initial guess is found by inverting an arc length table and is refined using
+    Newton's method on all points at once. The Jacobian of the chord equations is lower
+    bidiagonal so each Newton step is a linear recurrence solved with cumulative products.
+
+    Args:
+        radius_x: float defining the radius in the x direction
+        radius_y: float defining the radius in the y direction
+        size: float defining the target chord length between points
+        rtol: numerical tolerance of chord lengths
+
+    Returns:
+        np.ndarray of angles in radians with shape (N,)
+
+    Raises:
+        GeometryException if the chord lengths could not be solved
+    """
+    if size <= 0.0:
+        raise ValueError(f"Chord size must be positive, got {size}")
+
+    # arc length table over a half ellipse so the final point can overshoot pi / 2
+    table_angles = np.linspace(0.0, math.pi, ARC_TABLE_SIZE)
+    speed = np.hypot(radius_x * np.sin(table_angles), radius_y * np.cos(table_angles))
+    table_lengths = np.zeros_like(table_angles)
+    table_lengths[1:] = np.cumsum(
+        (speed[1:] + speed[:-1]) / 2.0 * np.diff(table_angles)
+    )
+    quadrant_length = np.interp(math.pi / 2.0, table_angles, table_lengths)
+
+    # chords are shorter than arcs so num_points steps always reach pi / 2
+    num_points = max(int(math.ceil(quadrant_length / size - rtol)), 1)
+    if num_points * size > table_lengths[-1]:
+        raise GeometryException(
+            f"Chord length {size} is too large for ellipse with radii {radius_x}, {radius_y}"
+        )
+    angles = np.zeros(num_points + 1)
+    angles[1:] = np.interp(
+        size * np.arange(1, num_points + 1), table_lengths, table_angles
+    )
+
+    for _ in range(MAX_NEWTON_ITERATIONS):
+        residual, diag, sub = _chord_residuals(angles, radius_x, radius_y, size)
+        if np.abs(residual).max() < rtol * 1e-3:
+            break
+        # J dt = -F with J lower bidiagonal: dt_k = a_k * dt_k-1 + b_k, dt_0 = 0
+        a = -sub / diag
+        b = -residual / diag
+        products = np.cumprod(a)
+        steps = products * np.cumsum(b / products)
+        angles[1:] += steps
+
+    residual, _, _ = _chord_residuals(angles, radius_x, radius_y, size)
+    if not np.all(np.isfinite(angles)) or np.abs(residual).max() > rtol:
+        idx = int(np.nanargmax(np.abs(residual)))
+        msg = (
+            f"Could not find point along tubular insect with details:\n"
+            f"\tradii: {radius_x}, {radius_y}\n"
+            f"\tangle: {angles[idx + 1]}\n"
+            f"\tlength: {size}"
+        )
+        raise GeometryException(msg)
+    return angles
+
+
+def _chord_residuals(
+    angles: np.ndarray, radius_x: float, radius_y: float, size: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Chord length errors and their derivatives for consecutive angles
+
+    Returns:
+        tuple of (residuals, d residual / d angle_k, d residual / d angle_k-1)
+    """
+    cos, sin = np.cos(angles), np.sin(angles)
+    points = np.stack([radius_x * cos, radius_y * sin], axis=1)
+    tangents = np.stack([-radius_x * sin, radius_y * cos], axis=1)
+    chords = np.diff(points, axis=0)
+    lengths = np.linalg.norm(chords, axis=1)
+    diag = np.einsum("ij,ij->i", chords, tangents[1:]) / lengths
+    sub = -np.einsum("ij,ij->i", chords, tangents[:-1]) / lengths
+    return lengths - size, diag, sub
 
 
 def ellipse_segment_angle(
@@ -136,6 +319,39 @@ def rotate_points(points: np.ndarray, angle: float) -> np.ndarray:
     return points.dot(R.T)
 
 
+def _sympy_ellipse_quadrant_points(
+    centre: np.ndarray,
+    radius_x: float,
+    radius_y: float,
+    interval: int | None,
+    size: float | None,
+    rtol: float,
+) -> Generator[np.ndarray, np.ndarray, None]:
+    """Iterative sympy / scipy implementation of ellipse_quadrant_points"""
+    # figure out start point
+    start_point = sympy.Point2D([centre[0] + float(radius_x), centre[1]])
+    start_angle = 0.0
+    # Ellipse is 2D
+    ellipse = sympy.Ellipse(centre[:2], radius_x, radius_y)
+    # setup parametric next point
+    param_angle = sympy.symbols("param_angle")
+    param_point = ellipse.arbitrary_point(param_angle)
+    # determine increment size / segment length
+    if interval is not None:
+        size = ellipse.circumference.evalf() / 4.0 / abs(interval)
+    yield np.array(start_point, dtype=float)
+    while True:
+        pnt_angle = ellipse_segment_angle(ellipse, start_point, start_angle, size, rtol)
+        if pnt_angle >= math.pi / 2.0:
+            pnt_angle = math.pi / 2.0
+            next_point: sympy.Point2D = param_point.subs(param_angle, pnt_angle)
+            return np.array(next_point.coordinates, dtype=float)
+        next_point: sympy.Point2D = param_point.subs(param_angle, pnt_angle)
+        yield np.array(next_point.coordinates, dtype=float)
+        start_point = next_point
+        start_angle = pnt_angle
+
+
 def _iter_ellipse_angle(
     input: float,
     para_point: sympy.Point2D,
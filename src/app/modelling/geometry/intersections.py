@@ -9,27 +9,55 @@ Process is:
 - unfold main tube and intersecting vectors
 - calculate shape of intersection of plane and vector / tube (this should be an oval)
 - create holes in planar surface
+
+Calculations use float64 numpy arithmetic. The original sympy implementation is kept
+behind the use_sympy flag for cross-checking. The *_many functions work on many master
+and slave pairs at once, the single pair functions call them with one pair.
 """
 from copy import deepcopy
 import math
 import numpy as np
 import sympy
-from typing import Any
+from typing import Any, NamedTuple
 
 from ...interfaces import *
-from .vectors import angle_between_vectors
+from .vectors import unit_vectors
+
+# Tolerance used to determine whether a line is tangent to a circle
+TANGENT_TOL = 1e-12
 
 
 class IntersectionError(Exception):
     pass
 
 
-def intersection(master: NpTubular, slave: NpTubular) -> np.ndarray:
+class NpCircle(NamedTuple):
+    """2D circle in the X/Y plane"""
+
+    center: np.ndarray
+    radius: float
+
+    @property
+    def circumference(self) -> float:
+        return 2.0 * math.pi * self.radius
+
+
+class NpPlane(NamedTuple):
+    """3D plane defined by a point on the plane and a normal vector"""
+
+    point: np.ndarray
+    normal: np.ndarray
+
+
+def intersection(
+    master: NpTubular, slave: NpTubular, use_sympy: bool = False
+) -> np.ndarray:
     """Calculate 3D points where slaves intersect master
 
     Args:
         master: 3D tubular which slave tube may intersect
         slave: 3D tubular which may intersect master
+        use_sympy: if True use sympy geometry objects (slow, kept for cross-checking)
 
     Returns:
         Dict of np.ndarray where slaves intersect with master (key: NpTubular.name)
@@ -44,6 +72,7 @@ def intersection(master: NpTubular, slave: NpTubular) -> np.ndarray:
         master.diameter,
         slave.axis.point.array,
         slave.axis.vector.array,
+        use_sympy,
     )
 
     if len(intersect2D_array) == 0:
@@ -52,12 +81,11 @@ def intersection(master: NpTubular, slave: NpTubular) -> np.ndarray:
         )
 
     # Use point to determine side of circle intersect to use
-    for intersect2D in intersect2D_array:
-        intersect_vector = intersect2D - master.axis.point.array[:2]
-        point_vector = slave.axis.point.array[:2] - master.axis.point.array[:2]
-        angle2D = angle_between_vectors(intersect_vector, point_vector)
-        if angle2D <= math.pi / 2:
-            break
+    intersect2D = nearest_intersect_many(
+        master.axis.point.array[None, :2],
+        slave.axis.point.array[None, :2],
+        np.asarray(intersect2D_array, dtype=float)[None, [0, -1]],
+    )[0]
 
     # Determine intersection of vector with plane
     plane_point = np.array([intersect2D[0], intersect2D[1], slave.axis.point.array[2]])
@@ -68,16 +96,23 @@ def intersection(master: NpTubular, slave: NpTubular) -> np.ndarray:
     else:
         p2[1] += 1.0
     p3[2] += 1.0
-    plane: sympy.Plane = sympy.Plane(
-        sympy.Point3D(plane_point), sympy.Point3D(p2), sympy.Point3D(p3)
-    )
+    if use_sympy:
+        plane = sympy.Plane(
+            sympy.Point3D(plane_point), sympy.Point3D(p2), sympy.Point3D(p3)
+        )
+    else:
+        plane = NpPlane(plane_point, np.cross(p2 - plane_point, p3 - plane_point))
     intersect3D = plane_intersect(slave.axis.vector.array, plane_point, plane)
 
     return intersect3D
 
 
 def circle_intersect(
-    center: np.ndarray, diameter: float, point: np.ndarray, vector: np.ndarray
+    center: np.ndarray,
+    diameter: float,
+    point: np.ndarray,
+    vector: np.ndarray,
+    use_sympy: bool = False,
 ) -> np.ndarray:
     """Calculate 2D point where slave intersects master tube
 
@@ -86,24 +121,106 @@ def circle_intersect(
     Args:
         master: 3D tubular with slave tube which may intersect
         slave: 3D tubular which may intersect master
+        use_sympy: if True use sympy geometry objects (slow, kept for cross-checking)
 
     Returns:
-        numpy array where slave intersects with master
+        numpy array where slave intersects with master, shape (N, 2) ordered by X then Y
 
     Raises:
         IntersectionError if the slave does not intersect the master
     """
-    # Find intersection with circle in 2D plane
-    center = sympy.Point2D(center[:2])
-    circle = sympy.Circle(center, diameter / 2.0)
-    line = get_sympy_line(point, vector, sympy.Line2D)
-    try:
-        intersect = circle.intersection(line)
-        return np.array(intersect, dtype=float)
-    except Exception as e:
-        # Handle some specific exception here where an intersection is not found
-        msg = f"Could not find intersection point of line {line} with circle {circle}.\nEncountered error:\n{e}"
+    if use_sympy:
+        return _sympy_circle_intersect(center, diameter, point, vector)
+
+    center = np.asarray(center[:2], dtype=float)
+    radius = diameter / 2.0
+    start = np.asarray(point[:2], dtype=float)
+    direction = np.asarray(vector[:2], dtype=float)
+    if not direction.any():
+        msg = (
+            f"Could not find intersection point of line through {start} with vector "
+            f"{direction} with circle at {center} of radius {radius}.\n"
+            f"Encountered error:\nLine vector has zero length in the X/Y plane"
+        )
         raise IntersectionError(msg)
+    points, count = circle_intersect_many(
+        center[None], np.array([radius]), start[None], direction[None]
+    )
+    return points[0, : count[0]]
+
+
+def circle_intersect_many(
+    center: np.ndarray, radius: np.ndarray, start: np.ndarray, direction: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate 2D points where lines intersect circles in the X/Y plane
+
+    Args:
+        center: center of each circle, shape (S, 2)
+        radius: radius of each circle, shape (S,)
+        start: point on each line, shape (S, 2)
+        direction: vector of each line, shape (S, 2)
+
+    Returns:
+        (intersections shape (S, 2, 2) ordered by X then Y, number of intersections
+        of each line shape (S,)). A tangent line has one intersection which is given
+        twice, a line which misses or has zero length has none.
+    """
+    # as np.allclose for each line
+    same = np.all(np.abs(start - direction) <= 1e-8 + 1e-5 * np.abs(direction), axis=1)
+    direction = np.where(same[:, None], direction * 2, direction)
+
+    # Solve |start + t * direction - center| = radius for t
+    a = np.einsum("ij,ij->i", direction, direction)
+    offset = start - center
+    b = 2.0 * np.einsum("ij,ij->i", direction, offset)
+    c = np.einsum("ij,ij->i", offset, offset) - radius**2
+    discriminant = b**2 - 4.0 * a * c
+
+    tol = TANGENT_TOL * np.maximum(b**2, 1.0)
+    count = np.where(discriminant < -tol, 0, np.where(discriminant <= tol, 1, 2))
+    count = np.where(a == 0.0, 0, count)
+    a = np.where(a == 0.0, 1.0, a)
+    sqrt_disc = np.sqrt(np.where(count == 2, discriminant, 0.0))
+    first = start + ((-b - sqrt_disc) / (2.0 * a))[:, None] * direction
+    second = start + ((-b + sqrt_disc) / (2.0 * a))[:, None] * direction
+    # match ordering of sympy intersections (sorted by X then Y)
+    swap = (second[:, 0] < first[:, 0]) | (
+        (second[:, 0] == first[:, 0]) & (second[:, 1] < first[:, 1])
+    )
+    return (
+        np.stack(
+            [
+                np.where(swap[:, None], second, first),
+                np.where(swap[:, None], first, second),
+            ],
+            axis=1,
+        ),
+        count,
+    )
+
+
+def nearest_intersect_many(
+    center: np.ndarray, start: np.ndarray, points: np.ndarray
+) -> np.ndarray:
+    """Choose the intersection on the side of the circle each line start is on
+
+    Args:
+        center: center of each circle, shape (S, 2)
+        start: point on each line, shape (S, 2)
+        points: two intersections of each line with its circle, shape (S, 2, 2)
+
+    Returns:
+        the first intersection if it is within 90 degrees of the start about the
+        center, otherwise the second, shape (S, 2)
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cos = np.einsum(
+            "ij,ij->i", unit_vectors(points[:, 0] - center), unit_vectors(start - center)
+        )
+        angle = np.arccos(np.clip(cos, -1.0, 1.0))
+    # a start at the center has no side so the first intersection is used
+    near = np.isnan(angle) | (angle <= math.pi / 2)
+    return np.where(near[:, None], points[:, 0], points[:, 1])
 
 
 def get_sympy_line(point: np.ndarray, vector: np.ndarray, line_type: Any) -> sympy.Line:
@@ -124,7 +241,9 @@ def get_sympy_line(point: np.ndarray, vector: np.ndarray, line_type: Any) -> sym
     return line_type(point, point + vector, evaluate=False)
 
 
-def flat_tube_intersection(master: NpTubular, slave: NpTubular) -> np.ndarray:
+def flat_tube_intersection(
+    master: NpTubular, slave: NpTubular, use_sympy: bool = False
+) -> np.ndarray:
     """Get the intersection points of slaves on master if master was unfurled to a plane
 
     Assumes circle can be constructed from X/Y coordinates. Plane is X/Z. Midpoint of tube
@@ -133,6 +252,7 @@ def flat_tube_intersection(master: NpTubular, slave: NpTubular) -> np.ndarray:
     Args:
         master: 3D tubular which slave tube may intersect
         slaves: 3D tubular which may intersect master
+        use_sympy: if True use sympy geometry objects (slow, kept for cross-checking)
 
     Returns:
         Dict of (point: np.ndarray) where point is coordinate slaves
@@ -142,7 +262,30 @@ def flat_tube_intersection(master: NpTubular, slave: NpTubular) -> np.ndarray:
         IntersectionError if any of the slaves don't intersect the master
     """
     # Get intersections on master surface
-    point = intersection(master, slave)
+    point = intersection(master, slave, use_sympy)
+    return flatten_intersection(master, point, use_sympy)
+
+
+def flatten_intersection(
+    master: NpTubular, point: np.ndarray, use_sympy: bool = False
+) -> np.ndarray:
+    """Move a point on the surface of master to the flattened master
+
+    Args:
+        master: 3D tubular the point is on
+        point: 3D point on the master surface, updated in place
+        use_sympy: if True use sympy geometry objects (slow, kept for cross-checking)
+
+    Returns:
+        point on the flattened master
+    """
+    if not use_sympy:
+        point[:2] = flatten_intersection_many(
+            master.axis.point.array[None, :2],
+            np.array([master.diameter / 2.0]),
+            np.asarray(point, dtype=float)[None],
+        )[0, :2]
+        return point
     master_circle = sympy.Circle(master.axis.point.array[:2], master.diameter / 2.0)
     angle = arc_angle_signed(master_circle, point) * -1.0  # -1 since rotation is X to Y
     if angle > math.pi:
@@ -156,24 +299,66 @@ def flat_tube_intersection(master: NpTubular, slave: NpTubular) -> np.ndarray:
     return point
 
 
-def arc_angle_signed(circle: sympy.Circle, point: np.ndarray) -> float:
+def flatten_intersection_many(
+    center: np.ndarray, radius: np.ndarray, points: np.ndarray
+) -> np.ndarray:
+    """Move points on the surface of masters to the flattened masters
+
+    Args:
+        center: center of each master in the X/Y plane, shape (S, 2)
+        radius: radius of each master, shape (S,)
+        points: 3D point on the surface of each master, shape (S, 3)
+
+    Returns:
+        points on the flattened masters, shape (S, 3)
+    """
+    # -1 since rotation is X to Y
+    angle = arc_angle_signed_many(center, radius, points) * -1.0
+    angle = np.where(angle > math.pi, 2 * math.pi - angle, angle)
+    angle = np.where(angle < -1 * math.pi, -2 * math.pi - angle, angle)
+    circ_length = (2.0 * math.pi * radius / 2.0) * angle / math.pi
+    # Y coordinate is at tube radius
+    return np.column_stack([circ_length, radius, points[:, 2]])
+
+
+def arc_angle_signed(circle: NpCircle | sympy.Circle, point: np.ndarray) -> float:
     """Seam (0 rads) is aligned with Y axis
 
     Positive rotation from X to Y axis (clockwise!)
 
     Circle is in 2D X/Y plane
     """
-    seam = sympy.Point2D(0.0, circle.radius)
-    seg_vector = np.empty((3,))
-    seg_vector[:2] = point[:2] - np.array(seam.coordinates)
-    seg_vector[2] = 0.0
-    seg_length = np.linalg.norm(seg_vector)
-    sub_angle = math.acos(seg_length / 2.0 / circle.radius)
-    return np.sign(circle.center[0] - point[0]) * (math.pi - 2 * sub_angle)
+    if isinstance(circle, sympy.Circle):
+        return _sympy_arc_angle_signed(circle, point)
+    return float(
+        arc_angle_signed_many(
+            np.asarray(circle.center, dtype=float)[None, :2],
+            np.array([float(circle.radius)]),
+            np.asarray(point, dtype=float)[None],
+        )[0]
+    )
+
+
+def arc_angle_signed_many(
+    center: np.ndarray, radius: np.ndarray, points: np.ndarray
+) -> np.ndarray:
+    """arc_angle_signed of a point on each circle
+
+    Args:
+        center: center of each circle, shape (S, 2)
+        radius: radius of each circle, shape (S,)
+        points: point on each circle, shape (S, 2) or (S, 3)
+
+    Returns:
+        angles in radians, shape (S,)
+    """
+    seg_length = np.hypot(points[:, 0], points[:, 1] - radius)
+    sub_angle = np.arccos(np.clip(seg_length / 2.0 / radius, -1.0, 1.0))
+    return np.sign(center[:, 0] - points[:, 0]) * (math.pi - 2 * sub_angle)
 
 
 def plane_intersect(
-    axis: np.ndarray, point: np.ndarray, plane: sympy.Plane
+    axis: np.ndarray, point: np.ndarray, plane: NpPlane | sympy.Plane
 ) -> np.ndarray:
     """Calculate 3D point where slave intersects plane
 
@@ -189,8 +374,12 @@ def plane_intersect(
     Raises:
         IntersectionError if the slave does not intersect the master
     """
-    plane_point = np.array(plane.p1, dtype=float)
-    plane_normal = np.array(plane.normal_vector, dtype=float)
+    if isinstance(plane, sympy.Plane):
+        plane_point = np.array(plane.p1, dtype=float)
+        plane_normal = np.array(plane.normal_vector, dtype=float)
+    else:
+        plane_point = np.asarray(plane.point, dtype=float)
+        plane_normal = np.asarray(plane.normal, dtype=float)
     epsilon = 1e-6
 
     try:
@@ -206,3 +395,65 @@ def plane_intersect(
         # Handle some specific exception here where an intersection is not found
         msg = f"Could not find intersection point of vector {axis} with plane {plane}.\nEncountered error:\n{e}"
         raise IntersectionError(msg)
+
+
+def plane_intersect_many(
+    axis: np.ndarray, points: np.ndarray, plane: NpPlane
+) -> np.ndarray:
+    """Calculate 3D points where parallel rays through points intersect a plane
+
+    Leading axes broadcast, e.g. an axis and plane for each of S pairs, shape (S, 3),
+    with the points of each pair, shape (S, N, 3).
+
+    Args:
+        axis: 3D numpy array defining the direction of all rays, shape (3,)
+        points: 3D numpy array of points on the rays, shape (N, 3)
+        plane: plane to intersect
+
+    Returns:
+        numpy array of intersection points, shape (N, 3)
+
+    Raises:
+        IntersectionError if the rays are parallel to the plane
+    """
+    plane_point = np.asarray(plane.point, dtype=float)[..., None, :]
+    plane_normal = np.asarray(plane.normal, dtype=float)[..., None, :]
+    axis = np.asarray(axis, dtype=float)[..., None, :]
+    epsilon = 1e-6
+
+    ndotu = np.sum(plane_normal * axis, axis=-1, keepdims=True)
+    if np.any(np.abs(ndotu) < epsilon):
+        raise IntersectionError(
+            f"Cannot compute intersect of vector {axis} which lies in plane {plane}"
+        )
+    w = points - plane_point
+    si = -np.sum(w * plane_normal, axis=-1, keepdims=True) / ndotu
+    return w + si * axis + plane_point
+
+
+def _sympy_circle_intersect(
+    center: np.ndarray, diameter: float, point: np.ndarray, vector: np.ndarray
+) -> np.ndarray:
+    """sympy implementation of circle_intersect"""
+    # Find intersection with circle in 2D plane
+    center = sympy.Point2D(center[:2])
+    circle = sympy.Circle(center, diameter / 2.0)
+    line = get_sympy_line(point, vector, sympy.Line2D)
+    try:
+        intersect = circle.intersection(line)
+        return np.array(intersect, dtype=float)
+    except Exception as e:
+        # Handle some specific exception here where an intersection is not found
+        msg = f"Could not find intersection point of line {line} with circle {circle}.\nEncountered error:\n{e}"
+        raise IntersectionError(msg)
+
+
+def _sympy_arc_angle_signed(circle: sympy.Circle, point: np.ndarray) -> float:
+    """sympy implementation of arc_angle_signed"""
+    seam = sympy.Point2D(0.0, circle.radius)
+    seg_vector = np.empty((3,))
+    seg_vector[:2] = point[:2] - np.array(seam.coordinates)
+    seg_vector[2] = 0.0
+    seg_length = np.linalg.norm(seg_vector)
+    sub_angle = math.acos(seg_length / 2.0 / circle.radius)
+    return np.sign(circle.center[0] - point[0]) * (math.pi - 2 * sub_angle)
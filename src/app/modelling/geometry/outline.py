@@ -0,0 +1,174 @@
+"""Weld lines and hole outlines of joints without meshing
+
+Screening a design only needs where the slaves meet the master and the shape of the
+holes on the flattened master. pair_outlines runs the steps of intersection,
+flat_tube_intersection and get_weld_intersect_array through their *_many kernels for
+every master and slave pair of a batch at once, so thousands of joints take a fraction
+of a second. Nothing here imports gmsh so it can run in the REST API process itself.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from .context import Z_AXIS
+from .intersections import (
+    IntersectionError,
+    arc_angle_signed_many,
+    circle_intersect_many,
+    flatten_intersection_many,
+    nearest_intersect_many,
+)
+from .vectors import rotate_vectors, unit_vectors
+from .weld import get_weld_intersect_many, weld_angles
+from ...interfaces import Joint, Tubular
+
+WELD_ANGLE_INC = 10  # degrees, as used by the mesher
+PLANE_TOL = 1e-6  # as plane_intersect
+
+
+class FlatOutline(NamedTuple):
+    intersect: np.ndarray  # where the slave axis meets the master surface, shape (3,)
+    flat_intersect: np.ndarray  # intersect on the flattened master, shape (3,)
+    weld: np.ndarray  # weld line on the flattened master, shape (N, 3)
+    hole: np.ndarray  # points of the hole curve loop, shape (N - 1, 3)
+
+
+def hole_outline(pnts: np.ndarray) -> np.ndarray:
+    """Points of the hole curve loop
+
+    The last weld point is replaced by the first point to close the loop.
+    """
+    return pnts[:-1]
+
+
+def _tube_arrays(tubes: list[Tubular]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Axis points (S, 3), axis vectors (S, 3) and diameters (S,) of tubes"""
+    values = np.array(
+        [
+            [
+                tube.axis.point.x,
+                tube.axis.point.y,
+                tube.axis.point.z,
+                tube.axis.vector.x,
+                tube.axis.vector.y,
+                tube.axis.vector.z,
+                tube.diameter,
+            ]
+            for tube in tubes
+        ],
+        dtype=float,
+    ).reshape(-1, 7)
+    return values[:, :3], values[:, 3:6], values[:, 6]
+
+
+def _check(
+    failed: np.ndarray, masters: list[Tubular], slaves: list[Tubular], reason: str
+):
+    if failed.any():
+        i = int(np.argmax(failed))
+        raise IntersectionError(
+            f"No intersections found for {slaves[i].name} on {masters[i].name}: "
+            f"{reason}"
+        )
+
+
+def pair_outlines(
+    masters: list[Tubular], slaves: list[Tubular], angle_inc: float = WELD_ANGLE_INC
+) -> FlatOutline:
+    """Outlines of the holes each slave cuts in its master, for all pairs at once
+
+    Args:
+        masters: master of each pair
+        slaves: slave of each pair
+        angle_inc: increment in degrees between points around the weld
+
+    Returns:
+        FlatOutline of arrays with a leading axis of pairs, e.g. weld shape (S, N, 3)
+
+    Raises:
+        IntersectionError if a slave does not intersect its master
+    """
+    if len(masters) != len(slaves):
+        raise ValueError(f"Got {len(masters)} masters for {len(slaves)} slaves")
+    master_point, master_vector, master_diameter = _tube_arrays(masters)
+    slave_point, slave_vector, slave_diameter = _tube_arrays(slaves)
+    radius = master_diameter / 2.0
+    center = master_point[:, :2]
+
+    # intersection
+    _check(
+        ~slave_vector[:, :2].any(axis=1),
+        masters,
+        slaves,
+        "line vector has zero length in the X/Y plane",
+    )
+    points, count = circle_intersect_many(
+        center, radius, slave_point[:, :2], slave_vector[:, :2]
+    )
+    _check(count == 0, masters, slaves, "slave axis misses the master")
+    intersect2D = nearest_intersect_many(center, slave_point[:, :2], points)
+    intersect = np.column_stack([intersect2D, slave_point[:, 2]])
+    # the vertical plane through the intersect is normal to X or Y as in intersection
+    ndotu = np.where(
+        np.abs(slave_vector[:, 0]) < 1e-12, slave_vector[:, 1], slave_vector[:, 0]
+    )
+    _check(
+        np.abs(ndotu) < PLANE_TOL,
+        masters,
+        slaves,
+        "slave vector lies in the intersection plane",
+    )
+
+    # flat_tube_intersection and the slave vector rotated onto the flattened master as
+    # pair_geometry
+    flat_intersect = flatten_intersection_many(center, radius, intersect)
+    arc_angle = arc_angle_signed_many(center, radius, intersect)
+    flat_vector = rotate_vectors(unit_vectors(slave_vector), Z_AXIS, arc_angle * -1.0)
+
+    # get_weld_intersect_array
+    _check(
+        np.abs(flat_vector[:, 1]) < PLANE_TOL,
+        masters,
+        slaves,
+        "slave is parallel to the flattened master",
+    )
+    weld = get_weld_intersect_many(
+        master_vector,
+        master_diameter,
+        slave_diameter,
+        flat_intersect,
+        flat_vector,
+        weld_angles(angle_inc),
+    )
+    return FlatOutline(intersect, flat_intersect, weld, weld[:, :-1])
+
+
+def joint_outlines(
+    joints: list[Joint], angle_inc: float = WELD_ANGLE_INC
+) -> list[dict[str, FlatOutline]]:
+    """Outline of each slave by slave name, for each joint
+
+    Raises:
+        IntersectionError if a slave does not intersect the master
+    """
+    masters = [joint.master for joint in joints for _ in joint.slaves]
+    slaves = [slave for joint in joints for slave in joint.slaves]
+    outlines = pair_outlines(masters, slaves, angle_inc)
+    result = []
+    i = 0
+    for joint in joints:
+        result.append(
+            {
+                slave.name: FlatOutline(*(values[i + j] for values in outlines))
+                for j, slave in enumerate(joint.slaves)
+            }
+        )
+        i += len(joint.slaves)
+    return result
+
+
+def joint_outline(
+    joint: Joint, angle_inc: float = WELD_ANGLE_INC
+) -> dict[str, FlatOutline]:
+    """Outline of each slave of joint by slave name"""
+    return joint_outlines([joint], angle_inc)[0]
@@ -0,0 +1,45 @@
+"""Split the flattened master tube into bands which can be meshed independently
+
+gmsh meshes separate surfaces in parallel, so the flat tube is cut across its
+circumference in the gaps between groups of holes. Each band holds whole holes with
+their radial rings and the cut lines are shared by neighbouring bands, so the mesh
+stays conformal.
+"""
+import numpy as np
+
+
+def hole_extent(
+    points: list[np.ndarray] | np.ndarray, axis: int = 2
+) -> tuple[float, float]:
+    """(min, max) of points along the tube axis"""
+    values = np.concatenate([np.asarray(p).reshape(-1, 3)[:, axis] for p in points])
+    return float(values.min()), float(values.max())
+
+
+def partition_cuts(
+    extents: list[tuple[float, float]], start: float, end: float, margin: float = 0.0
+) -> list[float]:
+    """Positions along the tube which separate the holes into independent bands
+
+    Args:
+        extents: (min, max) along the tube of each hole including its radial rings
+        start: position of the start of the tube
+        end: position of the end of the tube
+        margin: smallest distance from a cut to a hole
+
+    Returns:
+        sorted cut positions at the middle of each gap between holes
+    """
+    merged: list[list[float]] = []
+    for low, high in sorted(extents):
+        if merged and low - merged[-1][1] < 2 * margin:
+            merged[-1][1] = max(merged[-1][1], high)
+        else:
+            merged.append([low, high])
+    cuts = [(below[1] + above[0]) / 2 for below, above in zip(merged, merged[1:])]
+    return [cut for cut in cuts if start < cut < end]
+
+
+def band_index(cuts: list[float], extent: tuple[float, float]) -> int:
+    """Index of the band between cuts holding a hole"""
+    return int(np.searchsorted(cuts, (extent[0] + extent[1]) / 2))
@@ -0,0 +1,133 @@
+"""Radial rings of points around holes in the flattened master tube
+
+Radial rings are used to constrain the mesh around weld lines. Where the rings of
+neighbouring slaves overlap they are pulled back to the midpoint between the slaves.
+"""
+import numpy as np
+from scipy.spatial import cKDTree
+
+# Radial distances of rings away from the weld points
+RADIAL_DISTANCES = [0.05, 0.1, 0.15, 0.2]
+# Relative margin applied to the broad phase so float rounding never prunes a real overlap
+ENVELOPE_MARGIN = 1e-6
+
+
+def radial_rings(
+    points: np.ndarray, center: np.ndarray, distances: list[float] | None = None
+) -> list[np.ndarray]:
+    """Create rings of points at radial distances away from hole points
+
+    Args:
+        points: weld points around the hole, shape (N, 3)
+        center: centre of the hole, shape (3,)
+        distances: radial distances of each ring away from the weld points
+
+    Returns:
+        list of rings, one per distance, each of shape (N, 3)
+    """
+    if distances is None:
+        distances = RADIAL_DISTANCES
+    # Vectors from center points to points
+    vectors = points - center
+    unit_vectors = vectors / np.linalg.norm(vectors, axis=1)[:, None]
+    rings = points + unit_vectors * np.asarray(distances, dtype=float)[:, None, None]
+    return list(rings)
+
+
+def radial_candidate_pairs(
+    rings: list[np.ndarray], centers: list[np.ndarray]
+) -> list[list[int]]:
+    """Broad phase: find slaves whose radial rings may overlap
+
+    Each ring is bounded by a circle about its centre of radius R (max distance of a ring
+    point from the centre). By the triangle inequality every point of a ring is at least
+    d / 2 - R from the midpoint of two centres d apart, so if d > 4 * R for both slaves the
+    rings can not reach the midpoint and the narrow phase would skip the pair.
+
+    Args:
+        rings: ring of each slave at the same radial index, each of shape (N, 3)
+        centers: centre of each slave hole, each of shape (3,)
+
+    Returns:
+        sorted indices of candidate neighbours for each slave
+    """
+    neighbours = [[] for _ in rings]
+    if len(rings) < 2:
+        return neighbours
+    centers = np.asarray(centers, dtype=float)
+    envelopes = np.array(
+        [np.linalg.norm(ring - center, axis=1).max() for ring, center in zip(rings, centers)]
+    )
+    reach = 4.0 * envelopes * (1.0 + ENVELOPE_MARGIN)
+    tree = cKDTree(centers)
+    for this, other in tree.query_pairs(r=reach.max()):
+        distance = np.linalg.norm(centers[this] - centers[other])
+        if distance <= max(reach[this], reach[other]):
+            neighbours[this].append(other)
+            neighbours[other].append(this)
+    return [sorted(found) for found in neighbours]
+
+
+def resolve_radial_overlaps(
+    radial_lines: dict[str, list[np.ndarray]], centers: dict[str, np.ndarray]
+) -> None:
+    """Pull overlapping radial rings of neighbouring slaves back to their midpoints
+
+    Rings are updated in place, starting with the biggest ring and working inwards.
+
+    Args:
+        radial_lines: rings of each slave (key: NpTubular.name)
+        centers: flattened intersection point of each slave (key: NpTubular.name)
+    """
+    if not radial_lines:
+        return
+    names = list(radial_lines.keys())
+    slave_centers = [centers[name] for name in names]
+    num_radials = len(radial_lines[names[0]])
+    # Start biggest to smallest
+    for line_idx in range(num_radials - 1, -1, -1):
+        rings = [radial_lines[name][line_idx] for name in names]
+        neighbours = radial_candidate_pairs(rings, slave_centers)
+        for this_idx, this in enumerate(names):
+            for other_idx in neighbours[this_idx]:
+                other = names[other_idx]
+                _average_radial_pair(
+                    radial_lines[this][line_idx],
+                    radial_lines[other][line_idx],
+                    centers[this],
+                    centers[other],
+                )
+
+
+def _average_radial_pair(
+    this_line: np.ndarray,
+    other_line: np.ndarray,
+    this_center: np.ndarray,
+    other_center: np.ndarray,
+) -> None:
+    """Narrow phase: clamp ring points which pass the midpoint between two slaves"""
+    diff_center = (this_center + other_center) / 2.0
+
+    # check if slaves are too far away from each other for radials to intersect each other
+    this_center_distances = np.linalg.norm(this_line - this_center, axis=1).max()
+    this_diff_center_distances = np.linalg.norm(this_line - diff_center, axis=1).min()
+    other_center_distances = np.linalg.norm(other_line - other_center, axis=1).max()
+    other_diff_center_distances = np.linalg.norm(other_line - diff_center, axis=1).min()
+
+    if (
+        this_center_distances < this_diff_center_distances
+        and other_center_distances < other_diff_center_distances
+    ):
+        return
+
+    this_diff_y_direction = np.sign(diff_center[0] - this_center[0])
+    other_diff_y_direction = np.sign(diff_center[0] - other_center[0])
+
+    this_diffs_y_sign = np.sign(diff_center[0] - this_line[:, 0])
+    other_diffs_y_sign = np.sign(diff_center[0] - other_line[:, 0])
+
+    this_no_change = this_diffs_y_sign == this_diff_y_direction
+    other_no_change = other_diffs_y_sign == other_diff_y_direction
+
+    this_line[:, 0] = np.where(this_no_change, this_line[:, 0], diff_center[0])
+    other_line[:, 0] = np.where(other_no_change, other_line[:, 0], diff_center[0])
@@ -0,0 +1,73 @@
+"""Element sizes requested by MeshSpecs
+
+Elements are weld_size within weld_distance of a weld line and grow linearly to
+far_size over the transition distance beyond it. Hot spot stresses are read close to
+the weld so the rest of the tube, in particular towards the ends of long chords, can be
+meshed much more coarsely.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from .radials import RADIAL_DISTANCES
+from ...interfaces import DEFAULT_MESH_SPECS, MeshSpecs
+
+# the radial rings are meshed at the weld size
+DEFAULT_WELD_DISTANCE = RADIAL_DISTANCES[-1]
+# largest increase in element size per unit distance from the weld
+MAX_SIZE_GRADIENT = 0.5
+
+
+class MeshSizing(NamedTuple):
+    weld_size: float
+    far_size: float
+    weld_distance: float
+    transition_distance: float
+
+    @property
+    def graded(self) -> bool:
+        """True if elements grow away from the welds"""
+        return self.far_size > self.weld_size
+
+    def size_at(self, distance: np.ndarray | float) -> np.ndarray | float:
+        """Element size at distance from the nearest weld line"""
+        return np.interp(
+            distance,
+            [self.weld_distance, self.weld_distance + self.transition_distance],
+            [self.weld_size, self.far_size],
+        )
+
+
+def mesh_sizing(specs: MeshSpecs | None = None) -> MeshSizing:
+    """Resolve the element sizes of specs, unset sizes default to specs.size
+
+    Raises:
+        ValueError if a size or distance is not positive, or weld_size > far_size
+    """
+    if specs is None:
+        specs = DEFAULT_MESH_SPECS
+    size = specs.size if specs.size is not None else DEFAULT_MESH_SPECS.size
+    weld_size = specs.weld_size if specs.weld_size is not None else size
+    far_size = specs.far_size if specs.far_size is not None else max(size, weld_size)
+    sizes = {"size": size, "weld_size": weld_size, "far_size": far_size}
+    for name, value in sizes.items():
+        if value <= 0:
+            raise ValueError(f"Mesh {name} must be positive, got {value}")
+    if weld_size > far_size:
+        raise ValueError(
+            f"Mesh weld_size {weld_size} must not be larger than far_size {far_size}"
+        )
+
+    weld_distance = (
+        specs.weld_distance
+        if specs.weld_distance is not None
+        else DEFAULT_WELD_DISTANCE
+    )
+    transition_distance = (
+        specs.transition_distance
+        if specs.transition_distance is not None
+        else (far_size - weld_size) / MAX_SIZE_GRADIENT
+    )
+    if weld_distance < 0 or transition_distance < 0:
+        raise ValueError("Mesh sizing distances must not be negative")
+    return MeshSizing(weld_size, far_size, weld_distance, transition_distance)
@@ -8,6 +8,11 @@ def unit_vector(vector: list[Any]):
     return vector / np.linalg.norm(vector)
 
 
+def unit_vectors(vectors: np.ndarray) -> np.ndarray:
+    """Returns the unit vector of each row of vectors, shape (..., 3)."""
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
 def angle_between_vectors(v1, v2):
     """Returns the angle in radians between vectors 'v1' and 'v2'::
 
@@ -31,3 +36,28 @@ def rotate(point: np.ndarray, axis: np.ndarray, angle: float) -> np.ndarray:
     rpoint = np.zeros((4,))
     rpoint[:3] = point[:3]
     return np.dot(rotation, rpoint)[:3]
+
+
+def rotate_vectors(vector: np.ndarray, axis: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """Rotate a vector about an axis through the origin by many angles (Rodrigues' formula)
+
+    The arguments broadcast against each other, e.g. vectors and axes of shape (S, 1, 3)
+    rotated by N angles give shape (S, N, 3).
+
+    Args:
+        vector: 3D vector to rotate, shape (3,) or (..., 3)
+        axis: 3D vector defining the axis of rotation, shape (3,) or (..., 3)
+        angles: right-handed rotation angles in radians, shape (N,) or (...,)
+
+    Returns array of rotated vectors shape (N, 3) for a single vector and axis
+    """
+    unit = unit_vectors(np.asarray(axis, dtype=float))
+    vector = np.asarray(vector, dtype=float)[..., :3]
+    angles = np.asarray(angles, dtype=float)
+    cos = np.cos(angles)[..., None]
+    sin = np.sin(angles)[..., None]
+    return (
+        vector * cos
+        + np.cross(unit, vector) * sin
+        + unit * np.sum(unit * vector, axis=-1, keepdims=True) * (1.0 - cos)
+    )
@@ -1,67 +1,113 @@
-from copy import deepcopy
 import math
-import sympy
+import numpy as np
 from typing import Generator
 
-from .vectors import rotate, unit_vector
-from .intersections import (
-    flat_tube_intersection,
-    plane_intersect,
-    intersection,
-    arc_angle_signed,
-)
+from .context import GeometryContext, pair_geometry
+from .vectors import rotate_vectors, unit_vectors
+from .intersections import NpPlane, plane_intersect_many
 from ...interfaces import *
 
 # TODO: look into https://mathcurve.com/courbes2d.gb/alain/alain.shtml
 # TODO:https://math.stackexchange.com/questions/141593/formula-for-cylinder?newreg=52c6b3d9cb1d47c1aaa3ff0706aa2298
 # Plane is XZ so X = Z, Y = offset
 
+# Tolerance used to exclude the 360 degree angle which duplicates 0 degrees
+ANGLE_TOL = 1e-8  # degrees
 
-def get_weld_intersect_points(
-    master: NpTubular, slave: NpTubular, angle_inc: int = 10
-) -> Generator[np.ndarray, np.ndarray, None]:
-    """X/Z plane"""
-    intersect = intersection(master, slave)
-    # Radius point is on Y axis at radius
-    radius_point = np.array([0.0, master.diameter / 2.0, intersect[2]])
-    # Create X/Z plane at radius point
-    p2 = deepcopy(radius_point)
-    p2[0] += 1.0
-    p3 = deepcopy(radius_point)
-    p3[2] += 1.0
-    plane: sympy.Plane = sympy.Plane(
-        sympy.Point3D(radius_point), sympy.Point3D(p2), sympy.Point3D(p3)
-    )
-    # Adjust slave vector angle by arc angle (rotate about Z axis)
-    circle = sympy.Circle(master.axis.point.array[:2], master.diameter / 2.0)
-    radius_arc_angle = arc_angle_signed(circle, radius_point)
-    intersect_arc_angle = arc_angle_signed(circle, intersect)
-    arc_angle = radius_arc_angle + intersect_arc_angle
-    slave_vector = rotate(
-        unit_vector(slave.axis.vector.array),
-        np.array([0.0, 0.0, 1.0]),
-        arc_angle * -1.0,
+
+def weld_angles(angle_inc: float = 10) -> np.ndarray:
+    """Angles in radians around a weld at increments of angle_inc degrees
+
+    Starts at 0.0 and stops before a full revolution. angle_inc does not have to be a
+    whole number of degrees.
+    """
+    if angle_inc <= 0:
+        raise ValueError(f"Angle increment must be positive, got {angle_inc}")
+    num_angles = math.ceil((360.0 - ANGLE_TOL) / angle_inc)
+    return np.radians(np.arange(num_angles) * float(angle_inc))
+
+
+def get_weld_intersect_array(
+    master: NpTubular,
+    slave: NpTubular,
+    angle_inc: float = 10,
+    angles: np.ndarray | None = None,
+    context: GeometryContext | None = None,
+) -> np.ndarray:
+    """Calculate the weld ring of slave on the flattened master in one vectorized pass
+
+    X/Z plane
+
+    Args:
+        master: 3D tubular which slave tube intersects
+        slave: 3D tubular which intersects master
+        angle_inc: increment in degrees between points around the weld
+        angles: optional array of angles in radians, overrides angle_inc
+        context: shares the intersection of the pair with other calls of a job
+
+    Returns:
+        np.ndarray of weld points, shape (N, 3)
+    """
+    if angles is None:
+        angles = weld_angles(angle_inc)
+    if context is None:
+        pair = pair_geometry(master, slave)
+    else:
+        pair = context.pair(master, slave)
+    return get_weld_intersect_many(
+        master.axis.vector.array[None],
+        np.array([master.diameter]),
+        np.array([slave.diameter]),
+        pair.flat_intersect[None],
+        pair.slave_vector[None],
+        angles,
+    )[0]
+
+
+def get_weld_intersect_many(
+    master_vector: np.ndarray,
+    master_diameter: np.ndarray,
+    slave_diameter: np.ndarray,
+    flat_intersect: np.ndarray,
+    slave_vector: np.ndarray,
+    angles: np.ndarray,
+) -> np.ndarray:
+    """Calculate the weld rings of many slaves on their flattened masters
+
+    X/Z plane
+
+    Args:
+        master_vector: axis vector of each master, shape (S, 3)
+        master_diameter: diameter of each master, shape (S,)
+        slave_diameter: diameter of each slave, shape (S,)
+        flat_intersect: slave intersect on each flattened master, shape (S, 3)
+        slave_vector: unit slave vector on each flattened master, shape (S, 3)
+        angles: angles in radians around the welds, shape (N,)
+
+    Returns:
+        np.ndarray of weld points, shape (S, N, 3)
+    """
+    # Radius point is on Y axis at radius, intersects are flattened at the same Z
+    radius_point = np.column_stack(
+        [np.zeros_like(master_diameter), master_diameter / 2.0, flat_intersect[:, 2]]
     )
+    # X/Z plane at radius point
+    plane = NpPlane(radius_point, np.array([0.0, -1.0, 0.0]))
     perp = (
-        unit_vector(np.cross(master.axis.vector.array, slave_vector))
-        * slave.diameter
-        / 2.0
+        unit_vectors(np.cross(master_vector, slave_vector))
+        * (slave_diameter / 2.0)[:, None]
     )
 
-    # Get intersect on flattened tube plane
-    flat_intersect = flat_tube_intersection(master, slave)
-
-    def pnt_intersect_at_angle(angle):
-        # calculate new vector and point
-        rotated_point = flat_intersect + rotate(perp, slave_vector, angle)
-        pnt_intersect = plane_intersect(slave_vector, rotated_point, plane)
-        pnt_intersect = np.array(pnt_intersect, dtype=float)
-        return pnt_intersect
+    rotated_points = flat_intersect[:, None, :] + rotate_vectors(
+        perp[:, None, :], slave_vector[:, None, :], angles
+    )
+    return plane_intersect_many(slave_vector, rotated_points, plane)
 
-    for degrees in range(0, 361, angle_inc):
-        angle = degrees * math.pi / 180.0
-        if abs(degrees - 360) < 1e-8 or degrees > 360:
-            continue
-        yield pnt_intersect_at_angle(angle)
 
-    return pnt_intersect_at_angle(0.0)
+def get_weld_intersect_points(
+    master: NpTubular, slave: NpTubular, angle_inc: float = 10
+) -> Generator[np.ndarray, np.ndarray, None]:
+    """X/Z plane"""
+    points = get_weld_intersect_array(master, slave, angle_inc)
+    yield from points
+    return points[0]
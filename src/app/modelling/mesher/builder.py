@@ -0,0 +1,132 @@
+"""Collect points and line segments in numpy arrays and create them in gmsh in bulk
+
+The OCC kernel only creates points one at a time, so calls into gmsh are reduced by
+deduplicating coincident points and shared segments before anything is created, and
+by creating every curve loop of a surface in a single pass.
+"""
+import gmsh
+import numpy as np
+
+FACTORY = gmsh.model.occ
+
+# Distance below which points are considered coincident
+POINT_TOL = 1e-9
+
+
+class GeometryBuilder:
+    """Accumulates closed polylines and creates them as gmsh curve loops
+
+    Usage:
+        builder = GeometryBuilder()
+        outer = builder.add_loop(perimeter_points)
+        hole = builder.add_loop(hole_points)
+        loops = builder.build()
+        surface = FACTORY.addPlaneSurface([loops[outer], loops[hole]])
+    """
+
+    def __init__(self, tol: float = POINT_TOL):
+        self._tol = tol
+        self._loops: list[np.ndarray] = []
+        self._point_tags: np.ndarray | None = None
+        self._line_tags: list[list[int]] = []
+
+    @property
+    def num_loops(self) -> int:
+        return len(self._loops)
+
+    @property
+    def line_tags(self) -> list[list[int]]:
+        """Signed line tags of each loop, available after build"""
+        return self._line_tags
+
+    def add_loop(self, points: np.ndarray) -> int:
+        """Add a closed polyline through points
+
+        The first point does not have to be repeated at the end, if it is then the
+        duplicate is merged.
+
+        Args:
+            points: array of 3D points, shape (N, 3)
+
+        Returns:
+            int index of the loop in the output of build()
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        if len(points) < 2:
+            raise ValueError("Cannot create a loop from less than 2 points")
+        self._loops.append(points)
+        return len(self._loops) - 1
+
+    def plan(self) -> tuple[np.ndarray, list[np.ndarray], np.ndarray, list[np.ndarray]]:
+        """Deduplicate points and segments without calling gmsh
+
+        Returns:
+            tuple of:
+                unique points, shape (P, 3)
+                point indices (into unique points) of each loop
+                unique segments as pairs of point indices, shape (S, 2)
+                signed 1-based segment indices of each loop (negative is reversed)
+        """
+        if not self._loops:
+            return np.empty((0, 3)), [], np.empty((0, 2), dtype=int), []
+        all_points = np.vstack(self._loops)
+        keys = np.round(all_points / self._tol).astype(np.int64)
+        _, first, inverse = np.unique(
+            keys, axis=0, return_index=True, return_inverse=True
+        )
+        inverse = inverse.reshape(-1)
+        # number unique points in order of first appearance so tags follow input order
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        unique_points = all_points[first[order]]
+        point_ids = rank[inverse]
+
+        loop_ids = np.split(point_ids, np.cumsum([len(l) for l in self._loops])[:-1])
+        loop_segments = []
+        for ids in loop_ids:
+            segments = np.stack([ids, np.roll(ids, -1)], axis=1)
+            # drop degenerate segments from repeated or coincident points
+            loop_segments.append(segments[segments[:, 0] != segments[:, 1]])
+
+        all_segments = np.vstack(loop_segments)
+        canonical = np.sort(all_segments, axis=1)
+        _, seg_first, seg_inverse = np.unique(
+            canonical, axis=0, return_index=True, return_inverse=True
+        )
+        seg_inverse = seg_inverse.reshape(-1)
+        seg_order = np.argsort(seg_first)
+        seg_rank = np.empty_like(seg_order)
+        seg_rank[seg_order] = np.arange(len(seg_order))
+        unique_segments = all_segments[seg_first[seg_order]]
+        seg_ids = seg_rank[seg_inverse]
+        # reversed segments are used with a negative sign in curve loops
+        signs = np.where(all_segments[:, 0] == unique_segments[seg_ids, 0], 1, -1)
+        signed = np.split(
+            signs * (seg_ids + 1), np.cumsum([len(s) for s in loop_segments])[:-1]
+        )
+        return unique_points, loop_ids, unique_segments, signed
+
+    def build(self) -> list[int]:
+        """Create points, lines and curve loops in gmsh
+
+        Returns:
+            list of curve loop tags in the order loops were added
+        """
+        unique_points, _, unique_segments, signed = self.plan()
+        point_tags = np.array(
+            [FACTORY.addPoint(x, y, z) for x, y, z in unique_points.tolist()],
+            dtype=int,
+        )
+        line_tags = np.array(
+            [
+                FACTORY.addLine(start, end)
+                for start, end in point_tags[unique_segments].tolist()
+            ],
+            dtype=int,
+        )
+        self._point_tags = point_tags
+        self._line_tags = [
+            (np.sign(ids) * line_tags[np.abs(ids) - 1]).tolist() for ids in signed
+        ]
+        return [FACTORY.addCurveLoop(tags) for tags in self._line_tags]
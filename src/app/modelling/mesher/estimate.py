@@ -0,0 +1,79 @@
+"""Predict the size of a mesh before meshing
+
+The master tube is unrolled into a flat surface of area pi * diameter * length and
+meshed with quadrangles of the size requested by the specs, refined around each slave
+by the weld and radial lines. Graded meshes are integrated over rings around each hole.
+Memory is estimated from the element count, the constants are rough upper bounds and
+should be tuned against the RSS reported by workers.
+"""
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from ..geometry.radials import RADIAL_DISTANCES
+from ..geometry.sizing import MeshSizing, mesh_sizing
+from ...interfaces import MeshSpecs, Model
+
+# weld points at 10 degree increments on each radial ring and the weld line
+ELEMENTS_PER_SLAVE = 2 * 36 * (len(RADIAL_DISTANCES) + 1)
+BASE_RSS = 200 * 1024**2  # bytes of a worker with gmsh initialized
+RSS_PER_ELEMENT = 4 * 1024  # bytes per element including gmsh, OCC and conversion
+GRADING_RINGS = 32  # rings integrated over the transition around each hole
+
+
+class MeshEstimate(NamedTuple):
+    nodes: int
+    elements: int
+    rss: int  # peak resident memory in bytes
+
+
+def element_size(specs: MeshSpecs) -> float:
+    """Size of elements far from the welds"""
+    return mesh_sizing(specs).far_size
+
+
+def _graded_elements(area: float, radii: list[float], sizing: MeshSizing) -> float:
+    """Elements on a surface of area with holes of radii, overlaps are ignored"""
+    far = area / sizing.far_size**2
+    if not sizing.graded:
+        return far
+    # rings from the weld out to where elements reach the far size
+    edges = np.concatenate(
+        [
+            [0.0],
+            sizing.weld_distance
+            + np.linspace(0.0, sizing.transition_distance, GRADING_RINGS + 1),
+        ]
+    )
+    middles = (edges[:-1] + edges[1:]) / 2
+    density = 1.0 / sizing.size_at(middles) ** 2
+    ring_area = 0.0
+    ring_elements = 0.0
+    for radius in radii:
+        areas = math.pi * ((radius + edges[1:]) ** 2 - (radius + edges[:-1]) ** 2)
+        ring_area += areas.sum()
+        ring_elements += (areas * density).sum()
+    if ring_area > area:
+        # rings cover the whole surface
+        return ring_elements * area / ring_area
+    return ring_elements + (area - ring_area) / sizing.far_size**2
+
+
+def estimate_mesh(model: Model, specs: MeshSpecs | None = None) -> MeshEstimate:
+    """Estimate node and element counts and peak memory of meshing model"""
+    sizing = mesh_sizing(specs)
+    master = model.joint.master
+    vector = master.axis.vector
+    length = float(np.linalg.norm([vector.x, vector.y, vector.z]))
+    area = math.pi * master.diameter * length
+    radii = [slave.diameter / 2 for slave in model.joint.slaves]
+
+    elements = math.ceil(_graded_elements(area, radii, sizing)) + (
+        ELEMENTS_PER_SLAVE * len(model.joint.slaves)
+    )
+    # a quadrangle mesh has about one node per element plus the open edges
+    nodes = elements + math.ceil(math.pi * master.diameter / sizing.far_size)
+    return MeshEstimate(
+        nodes=nodes, elements=elements, rss=BASE_RSS + elements * RSS_PER_ELEMENT
+    )
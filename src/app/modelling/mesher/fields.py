@@ -0,0 +1,45 @@
+"""gmsh size fields grading elements away from the weld lines
+
+Options are set for every job because a session keeps them between models.
+"""
+import gmsh
+
+from ..geometry.sizing import MeshSizing
+
+# samples along each weld curve used to compute distances
+DISTANCE_SAMPLING = 100
+
+
+def apply_sizing_options(sizing: MeshSizing):
+    """Set the global size options of a mesh"""
+    gmsh.option.setNumber("Mesh.MeshSizeMax", sizing.far_size)
+    # a background field alone controls graded meshes, otherwise sizes extend from
+    # the boundary points as before
+    uniform = 0 if sizing.graded else 1
+    gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", uniform)
+    gmsh.option.setNumber("Mesh.MeshSizeFromPoints", uniform)
+    gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
+
+
+def add_weld_field(curves: list[int], sizing: MeshSizing) -> int | None:
+    """Grade element sizes with distance from the weld curves
+
+    Returns:
+        tag of the background field, None if the mesh is not graded
+    """
+    if not sizing.graded or not curves:
+        return None
+    distance = gmsh.model.mesh.field.add("Distance")
+    gmsh.model.mesh.field.setNumbers(distance, "CurvesList", curves)
+    gmsh.model.mesh.field.setNumber(distance, "Sampling", DISTANCE_SAMPLING)
+
+    threshold = gmsh.model.mesh.field.add("Threshold")
+    gmsh.model.mesh.field.setNumber(threshold, "InField", distance)
+    gmsh.model.mesh.field.setNumber(threshold, "SizeMin", sizing.weld_size)
+    gmsh.model.mesh.field.setNumber(threshold, "SizeMax", sizing.far_size)
+    gmsh.model.mesh.field.setNumber(threshold, "DistMin", sizing.weld_distance)
+    gmsh.model.mesh.field.setNumber(
+        threshold, "DistMax", sizing.weld_distance + sizing.transition_distance
+    )
+    gmsh.model.mesh.field.setAsBackgroundMesh(threshold)
+    return threshold
@@ -6,9 +6,14 @@ import numpy as np
 from app.interfaces.numpy.model import NpTubular
 
 from ..geometry.line import line_points
-from .holes import hole_curve
+from .builder import GeometryBuilder
+from .fields import add_weld_field
+from ..geometry.outline import hole_outline
+from .incremental import SlaveGeometry, slave_geometry
 from ..geometry.weld import get_weld_intersect_points
-from ..geometry.intersections import flat_tube_intersection
+from ..geometry.partition import band_index, hole_extent, partition_cuts
+from ..geometry.radials import resolve_radial_overlaps
+from ..geometry.sizing import mesh_sizing
 
 from ...interfaces.geometry import *
 from ...interfaces.mapper import map_to_np
@@ -17,10 +22,33 @@ from ...interfaces.mesh import *
 
 FACTORY = gmsh.model.occ
 
+
+def _cross_points(
+    centre: np.ndarray, circumference: float, interval: int | None, size: float | None
+) -> np.ndarray:
+    """Points across the flat tube through centre, from the left seam to the right"""
+    left = deepcopy(centre)
+    left[0] -= circumference / 2.0
+    right = deepcopy(centre)
+    right[0] += circumference / 2.0
+    return np.array(
+        list(line_points([left, centre, right], interval, size, loop=False))
+    )
+
+
+def _seam_points(
+    start: np.ndarray, end: np.ndarray, interval: int | None, size: float | None
+) -> np.ndarray:
+    return np.array(list(line_points([start, end], interval, size, loop=False)))
+
+
 # scipolate.Rbf()
 def add_flat_tube(
-    master: Tubular, slaves: list[Tubular], specs: MeshSpecs
-) -> list[int, int]:
+    master: Tubular,
+    slaves: list[Tubular],
+    specs: MeshSpecs,
+    geometry: dict[str, SlaveGeometry] | None = None,
+) -> tuple[int, list[int]]:
     """Make a flat mesh out of a tubular
 
     Initially create it in the X/Z plane where 1 is at
@@ -28,8 +56,7 @@ def add_flat_tube(
 
         5-------4-------3
         |               |
-        |               |
-        |               |
+        7---------------8   cut between groups of holes
         |               |
         6-------1-------2
     Z
@@ -37,6 +64,18 @@ def add_flat_tube(
     |
     ------ x
 
+    The tube is cut across into bands between groups of holes so gmsh can mesh the
+    bands in parallel, a tube without gaps between its holes is a single band.
+
+    Args:
+        master: tube to flatten
+        slaves: tubes cutting holes in the master
+        specs: mesh specs
+        geometry: flattened geometry of each slave (key: Tubular.name), generated
+            if not given
+
+    Returns:
+        tuple of (2, surface tags of the bands)
     """
     nptube: NpTubular = map_to_np(master)
     length = np.linalg.norm(nptube.axis.vector.array)
@@ -45,143 +84,99 @@ def add_flat_tube(
     pt1 = nptube.axis.point.array
     pt1[1] = nptube.diameter / 2.0
 
-    pt2 = deepcopy(pt1)
-    pt2[0] += circumference / 2.0
-
-    pt3 = deepcopy(pt1)
-    pt3[0] += circumference / 2.0
-    pt3[2] += length
-
-    pt4 = deepcopy(pt1)
-    pt4[2] += length
+    # the perimeter is far from the welds, its lines are refined where the size
+    # field requires
+    sizing = mesh_sizing(specs)
+    interval = specs.interval
+    size = sizing.far_size if interval is None else None
 
-    pt5 = deepcopy(pt1)
-    pt5[0] -= circumference / 2.0
-    pt5[2] += length
-
-    pt6 = deepcopy(pt1)
-    pt6[0] -= circumference / 2.0
-
-    # closed loop
-    # NOTE: point order may need to be clockwise!
-    key_points = [pt1, pt2, pt3, pt4, pt5, pt6, pt1]
-
-    line_of_points = list(
-        line_points(key_points, interval=specs.interval, size=specs.size)
+    # get curves defining holes
+    # TODO: check that slave names are unique!
+    if geometry is None:
+        geometry = {slave.name: slave_geometry(master, slave) for slave in slaves}
+    hole_pnts = {slave.name: geometry[slave.name].hole for slave in slaves}
+    # rings are pulled back in place so the shared geometry is copied
+    radial_lines = {
+        slave.name: [ring.copy() for ring in geometry[slave.name].radials]
+        for slave in slaves
+    }
+    centers = {slave.name: geometry[slave.name].center for slave in slaves}
+
+    # Pull back radial lines which overlap between neighbouring slaves
+    resolve_radial_overlaps(radial_lines, centers)
+
+    # Cut across the tube in the gaps between holes and their radial rings
+    extents = {
+        name: hole_extent([hole_pnts[name]] + list(radial_lines[name]))
+        for name in hole_pnts
+    }
+    cuts = partition_cuts(
+        list(extents.values()), pt1[2], pt1[2] + length, margin=sizing.far_size
     )
-
-    pnt_tags = [FACTORY.addPoint(*pnt.tolist()) for pnt in line_of_points]
-    lines = [
-        FACTORY.addLine(pnt, pnt_tags[idx + 1]) for idx, pnt in enumerate(pnt_tags[:-1])
+    heights = [pt1[2]] + cuts + [pt1[2] + length]
+
+    # Collect all curves in numpy and create them in gmsh together, the points
+    # across each cut are shared by the bands either side of it
+    builder = GeometryBuilder()
+    crossings = []
+    for height in heights:
+        centre = deepcopy(pt1)
+        centre[2] = height
+        crossings.append(_cross_points(centre, circumference, interval, size))
+    band_idxs = [
+        builder.add_loop(
+            np.vstack(
+                [
+                    bottom,
+                    _seam_points(bottom[-1], top[-1], interval, size),
+                    top[::-1],
+                    _seam_points(top[0], bottom[0], interval, size),
+                ]
+            )
+        )
+        for bottom, top in zip(crossings[:-1], crossings[1:])
     ]
-    perimeter = FACTORY.addCurveLoop(lines)
 
-    # get curves defining holes
-    # TODO: check that slave names are unique!
-    holes = []
-    radial_lines = {}
-    hole_points = []
-    for slave in slaves:
-        hole, hole_pnts, rad_lines = hole_curve(master, slave)
-        holes.append(hole)
-        hole_points += hole_pnts
-        radial_lines[slave.name] = rad_lines
-
-    # TODO: this bit!
-    # Figure out if any radial lines are going to overlap with the holes.
-    # Find max "radius" of each hole and radial lines.
-
-    # Get centres
-    centers = {}
-    for slave in slaves:
-        centers[slave.name] = flat_tube_intersection(map_to_np(master), map_to_np(slave))
-
-    # Start biggest to smallest
-    num_radials = len(list(radial_lines.values())[0])
-    for idx in range(num_radials, 0, -1):
-        line_idx = idx - 1
-        for this, this_lines in radial_lines.items():
-            this_line = this_lines[line_idx]
-            # find distance to centers
-            for other, other_lines in radial_lines.items():
-                other_line = other_lines[line_idx]
-                # reverse the order of other_lines to find intersect
-
-                if this == other:
-                    continue
-
-                diff_center = (centers[this] + centers[other]) / 2.
-
-                # check if slaves are too far away from each other for radials to intersect each other
-                # TODO: make this more exact! bounding ellipse?
-                this_center_distances = np.linalg.norm(this_line - centers[this], axis=1).max()
-                this_diff_center_distances = np.linalg.norm(this_line - diff_center, axis=1).min()
-                other_center_distances = np.linalg.norm(other_line - centers[other], axis=1).max()
-                other_diff_center_distances = np.linalg.norm(other_line - diff_center, axis=1).min()
-
-                if this_center_distances < this_diff_center_distances and other_center_distances < other_diff_center_distances:
-                    continue
-
-                this_diff_y_direction = np.sign(diff_center[0] - centers[this][0])
-                other_diff_y_direction = np.sign(diff_center[0] - centers[other][0])
-
-                this_diffs_y = diff_center[0] - this_line[:, 0]
-                other_diffs_y = diff_center[0] - other_line[:, 0]
-
-                this_diffs_y_sign = np.sign(this_diffs_y)
-                other_diffs_y_sign = np.sign(other_diffs_y)
-
-                this_no_change = this_diffs_y_sign == this_diff_y_direction
-                other_no_change = other_diffs_y_sign == other_diff_y_direction
-
-                this_average_y = this_line[:, 0] * this_no_change + diff_center[0] * (this_no_change == False)
-                other_average_y = other_line[:, 0] * other_no_change + diff_center[0] * (other_no_change == False)
-
-                radial_lines[this][line_idx][:, 0] = this_average_y
-                radial_lines[other][line_idx][:, 0] = other_average_y
-
-    # weld_pnts = []
-    # for radials in radial_lines.values():
-    #     for radial in radials:
-    #         for pnt in radial:
-    #             weld_pnts.append(pnt)
-    # points = line_of_points + weld_pnts + hole_points
-    # x = [pnt[0] for pnt in points]
-    # y = [pnt[1] for pnt in points]
-    # z = [pnt[2] for pnt in points]
-    # import plotly.express as px
-    # fig = px.scatter_3d(x=x, y=y, z=z)
-    # fig.show()
-
-    # raise TypeError()
-
-    # Create curves to apply mesh contraints at radial positions around holes
-    mesh_constraints = []
-    all_points = []
-    for radials in radial_lines.values():
-        for radial in radials:
-            rad_pnt_tags = [FACTORY.addPoint(*pnt.tolist()) for pnt in radial]
-            rad_pnt_tags.append(rad_pnt_tags[0])
-            all_points += rad_pnt_tags
-            rad_line = [
-                FACTORY.addLine(pnt, rad_pnt_tags[idx + 1])
-                for idx, pnt in enumerate(rad_pnt_tags[:-1])
-            ]
-            mesh_constraints.append(FACTORY.addCurveLoop(rad_line))
+    band_holes: list[list[int]] = [[] for _ in band_idxs]
+    band_radials: list[list[int]] = [[] for _ in band_idxs]
+    for name, pnts in hole_pnts.items():
+        band = band_index(cuts, extents[name])
+        band_holes[band].append(builder.add_loop(hole_outline(pnts)))
+        # Create curves to apply mesh contraints at radial positions around holes
+        band_radials[band] += [builder.add_loop(radial) for radial in radial_lines[name]]
+
+    loops = builder.build()
 
     FACTORY.synchronize()
 
-    surface = FACTORY.addPlaneSurface([perimeter] + holes)
+    surfaces = [
+        FACTORY.addPlaneSurface([loops[band]] + [loops[idx] for idx in holes])
+        for band, holes in zip(band_idxs, band_holes)
+    ]
     FACTORY.synchronize()
 
-    # Embed radial curves in surface so they become meshed
-    gmsh.model.mesh.embed(1, mesh_constraints + holes, 2, surface)
+    for surface, hole_idxs, radial_idxs in zip(surfaces, band_holes, band_radials):
+        holes = [loops[idx] for idx in hole_idxs]
+        mesh_constraints = [loops[idx] for idx in radial_idxs]
+        if holes:
+            # Embed radial curves in surface so they become meshed
+            gmsh.model.mesh.embed(1, mesh_constraints + holes, 2, surface)
+
+    # Keep elements fine around the welds and coarse towards the tube ends
+    weld_curves = [
+        abs(tag)
+        for hole_idxs in band_holes
+        for idx in hole_idxs
+        for tag in builder.line_tags[idx]
+    ]
+    add_weld_field(weld_curves, sizing)
 
     # We delete the source geometry, and increase the number of sub-edges for a
     # nicer display of the geometry:
-    for l in lines:
-        FACTORY.remove([(1, l)])
-    FACTORY.remove([(1, perimeter)])
+    # cut lines are shared by two bands so are only removed once
+    perimeter_lines = {abs(l) for band in band_idxs for l in builder.line_tags[band]}
+    FACTORY.remove([(1, l) for l in sorted(perimeter_lines)])
+    FACTORY.remove([(1, loops[band]) for band in band_idxs])
     FACTORY.synchronize()
     # gmsh.option.setNumber("Geometry.NumSubEdges", 20)
-    return [2, surface]
\ No newline at end of file
+    return 2, surfaces
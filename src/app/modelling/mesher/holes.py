@@ -1,49 +1,52 @@
 import gmsh
 import numpy as np
 
+from .builder import GeometryBuilder
 from ...interfaces import *
 from ...interfaces.mapper import map_to_np
-from ..geometry.weld import get_weld_intersect_points
-from ..geometry.intersections import flat_tube_intersection
+from ..geometry.weld import get_weld_intersect_array
+from ..geometry.context import GeometryContext
+from ..geometry.outline import hole_outline
+from ..geometry.radials import radial_rings
 
 FACTORY = gmsh.model.occ
 
 
-def hole_curve(master: Tubular, slave: Tubular) -> dict[str, np.ndarray]:
+def hole_geometry(
+    master: Tubular, slave: Tubular, context: GeometryContext | None = None
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    """Calculate hole outline and radial rings on the flattened master without gmsh
+
+    Args:
+        master: tube with the hole
+        slave: tube cutting the hole
+        context: shares the intersection of the pair with other calls of a job
+
+    Returns:
+        tuple of (weld points around the hole shape (N, 3), list of radial rings)
+    """
+    if context is None:
+        context = GeometryContext()
     npmaster = map_to_np(master)
     npslave = map_to_np(slave)
 
     angle = 10
-    num_points = int(360 / angle)
-    hole_pnt_tags = []
-    pnts = np.empty((num_points, 3))
-    hole_points = []
-    for idx, pnt in enumerate(
-        get_weld_intersect_points(npmaster, npslave, angle_inc=angle)
-    ):
-        hole_points.append(pnt)
-        hole_pnt_tags.append(FACTORY.addPoint(*pnt.tolist()))
-        pnts[idx, :] = pnt
-
-    flat_intersect = flat_tube_intersection(npmaster, npslave)
-
-    # Vectors from center points to points
-    vectors = pnts - flat_intersect
-    unit_vectors = (vectors.T / np.linalg.norm(vectors, axis=1)).T
+    pnts = get_weld_intersect_array(
+        npmaster, npslave, angle_inc=angle, context=context
+    )
+
+    flat_intersect = context.pair(npmaster, npslave).flat_intersect
 
     # create points at radial distances away from hole points
-    distances = [0.05, 0.1, 0.15, 0.2]
-    rad_lines = []
-    for distance in distances:
-        radial = pnts + unit_vectors * distance
-        rad_lines.append(radial)
-
-    # make sure last point is the same as the first point
-    hole_pnt_tags[-1] = hole_pnt_tags[0]
-    FACTORY.synchronize()
-    lines = [
-        FACTORY.addLine(pnt, hole_pnt_tags[idx + 1])
-        for idx, pnt in enumerate(hole_pnt_tags[:-1])
-    ]
-    hole = FACTORY.addCurveLoop(lines)
+    rad_lines = radial_rings(pnts, flat_intersect)
+    return pnts, rad_lines
+
+
+def hole_curve(master: Tubular, slave: Tubular) -> dict[str, np.ndarray]:
+    pnts, rad_lines = hole_geometry(master, slave)
+    hole_points = list(pnts)
+
+    builder = GeometryBuilder()
+    builder.add_loop(hole_outline(pnts))
+    hole = builder.build()[0]
     return hole, hole_points, rad_lines
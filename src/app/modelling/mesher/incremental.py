@@ -0,0 +1,114 @@
+"""Reuse the flattened geometry of slaves which have not changed
+
+Design iterations resubmit the whole model after moving a single brace. The flattened
+hole, radial rings and centre of each slave only depend on the master and that slave,
+so they are kept per joint name and reused for every slave whose definition is
+unchanged. Only the holes and rings of changed slaves are generated again, overlaps
+between rings are always resolved afresh as they depend on the neighbours.
+"""
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+
+from .holes import hole_geometry
+from ..geometry.context import GeometryContext
+from ...interfaces import Joint, Tubular
+from ...interfaces.mapper import map_to_np
+
+MAX_CACHED_JOINTS = 32  # joints whose geometry is kept
+
+
+class SlaveGeometry(NamedTuple):
+    hole: np.ndarray  # weld points around the hole, shape (N, 3)
+    radials: list[np.ndarray]  # radial rings before overlaps are resolved
+    center: np.ndarray  # flattened intersection point, shape (3,)
+
+
+def slave_geometry(
+    master: Tubular, slave: Tubular, context: GeometryContext | None = None
+) -> SlaveGeometry:
+    """Flattened geometry of a slave on the master
+
+    Arrays are read only as they may be shared between jobs.
+    """
+    if context is None:
+        context = GeometryContext()
+    hole, radials = hole_geometry(master, slave, context)
+    center = context.pair(map_to_np(master), map_to_np(slave)).flat_intersect
+    for values in [hole, *radials]:
+        values.setflags(write=False)
+    return SlaveGeometry(hole, radials, center)
+
+
+class GeometryCache:
+    """Flattened slave geometry of recently meshed joints, by joint and slave name"""
+
+    def __init__(self, max_joints: int = MAX_CACHED_JOINTS):
+        self._max_joints = max_joints
+        # joint name to (master, slave name to (slave, geometry))
+        self._joints: OrderedDict[
+            str, tuple[Tubular, dict[str, tuple[Tubular, SlaveGeometry]]]
+        ] = OrderedDict()
+        self._reused = 0
+        self._generated = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "joints": len(self._joints),
+            "reused": self._reused,
+            "generated": self._generated,
+        }
+
+    def clear(self):
+        self._joints.clear()
+
+    def joint_geometry(
+        self, joint: Joint, context: GeometryContext | None = None
+    ) -> dict[str, SlaveGeometry]:
+        """Geometry of each slave, generating only slaves which changed
+
+        Everything is generated again if the master changed.
+        """
+        master, previous = self._joints.pop(joint.name, (None, {}))
+        if master != joint.master:
+            previous = {}
+        current = {}
+        for slave in joint.slaves:
+            cached = previous.get(slave.name)
+            if cached is not None and cached[0] == slave:
+                self._reused += 1
+                current[slave.name] = cached
+            else:
+                self._generated += 1
+                current[slave.name] = (
+                    slave.copy(deep=True),
+                    slave_geometry(joint.master, slave, context),
+                )
+        self._joints[joint.name] = (joint.master.copy(deep=True), current)
+        while len(self._joints) > self._max_joints:
+            self._joints.popitem(last=False)
+        return {name: geometry for name, (_, geometry) in current.items()}
+
+
+def joint_geometry(
+    joint: Joint,
+    cache: GeometryCache | None = None,
+    context: GeometryContext | None = None,
+) -> dict[str, SlaveGeometry]:
+    """Geometry of each slave of joint, reusing unchanged slaves if cache is set
+
+    Args:
+        joint: joint to flatten
+        cache: geometry of previous jobs
+        context: intersections of this job, created if not given
+    """
+    if context is None:
+        context = GeometryContext()
+    if cache is None:
+        return {
+            slave.name: slave_geometry(joint.master, slave, context)
+            for slave in joint.slaves
+        }
+    return cache.joint_geometry(joint, context)
@@ -34,26 +34,38 @@ import gmsh
 from itertools import combinations
 
 from .cylinder import add_cylinder
+from .fields import apply_sizing_options
 from .flat import add_flat_tube
+from .incremental import GeometryCache, SlaveGeometry, joint_geometry
+from .session import (
+    GmshSession,
+    apply_mesh_options,
+    apply_thread_options,
+    available_cpus,
+)
 
 from ...interfaces.geometry import *
 from ...interfaces.model import *
 from ...interfaces.mesh import *
 from ...interfaces.mapper import map_to_np
 
+from ..geometry.context import GeometryContext
 from ..geometry.intersections import intersection
+from ..geometry.sizing import mesh_sizing
 
 FACTORY = gmsh.model.occ
 
-# TODO: need to handle memory exceptions!!! Or try and predict memory usage!
 
 
 def mesh_master(
-    tube: Tubular, slaves: list[Tubular], specs: MeshSpecs
-) -> tuple[int, int]:
+    tube: Tubular,
+    slaves: list[Tubular],
+    specs: MeshSpecs,
+    geometry: dict[str, SlaveGeometry] | None = None,
+) -> tuple[int, list[int]]:
     """Adds tubular geometry and returns tag id"""
     # return add_cylinder(tube)
-    return add_flat_tube(tube, slaves, specs)
+    return add_flat_tube(tube, slaves, specs, geometry)
 
 
 def mesh_slaves(tube: Tubular, specs: MeshSpecs) -> tuple[int, int]:
@@ -62,9 +74,21 @@ def mesh_slaves(tube: Tubular, specs: MeshSpecs) -> tuple[int, int]:
     # return add_flat_tube(tube, specs)
 
 
-def mesh_joint(joint: Joint, specs: MeshSpecs) -> dict[str, tuple[int, int]]:
+def mesh_joint(
+    joint: Joint,
+    specs: MeshSpecs,
+    cache: GeometryCache | None = None,
+    context: GeometryContext | None = None,
+) -> dict[str, tuple[int, int | list[int]]]:
+    """Add the joint to gmsh
+
+    With a cache only the geometry of slaves which changed since the joint was last
+    meshed is generated. Pass a context to profile the intersections of the joint
+    with GeometryContext.stats.
+    """
     joint_mesh = {}
-    master_surface = mesh_master(joint.master, joint.slaves, specs)
+    geometry = joint_geometry(joint, cache, context)
+    master_surface = mesh_master(joint.master, joint.slaves, specs, geometry)
     joint_mesh.update(
         {joint.master.name: master_surface}
     )
@@ -72,26 +96,41 @@ def mesh_joint(joint: Joint, specs: MeshSpecs) -> dict[str, tuple[int, int]]:
     # TODO: move map to decorator?
     FACTORY.synchronize()
     for k, (dim, mesh) in joint_mesh.items():
-        gid = gmsh.model.addPhysicalGroup(dim, [mesh])
+        # the master is split into bands which are meshed in parallel
+        tags = mesh if isinstance(mesh, list) else [mesh]
+        gid = gmsh.model.addPhysicalGroup(dim, tags)
         gmsh.model.setPhysicalName(dim, gid, k)
     return joint_mesh
 
 
 @contextmanager
-def mesh_model(model: Model, specs: MeshSpecs) -> gmsh.model.mesh:
+def mesh_model(
+    model: Model, specs: MeshSpecs, session: GmshSession | None = None
+) -> gmsh.model.mesh:
+    """Mesh model, yielding the gmsh mesh
+
+    Without a session gmsh is initialized and finalized around the mesh, with a
+    session the model is cleared and gmsh stays initialized afterwards.
+    """
     try:
-        gmsh.initialize()
+        if session is None:
+            gmsh.initialize()
+            apply_mesh_options()
+        else:
+            session.reset()
         # set messaging level to errors
         # gmsh.option.setNumber("General.Verbosity", 1)
 
-        meshed_tubes = mesh_joint(model.joint, specs)
+        meshed_tubes = mesh_joint(
+            model.joint, specs, session.geometry if session is not None else None
+        )
 
         FACTORY.synchronize()
-        
-        gmsh.option.setNumber("Mesh.RecombineAll", 1)
-        gmsh.option.setNumber("Mesh.RecombinationAlgorithm", 3)
 
-        gmsh.option.setNumber("Mesh.MeshSizeMax", 0.1)
+        apply_sizing_options(mesh_sizing(specs))
+        apply_thread_options(
+            specs.threads if specs.threads is not None else available_cpus()
+        )
         # gmsh.option.setNumber("Mesh.Smoothing", 100)
         # gmsh.option.setNumber("Mesh.Algorithm", 8)
         gmsh.model.mesh.generate(2)
@@ -105,4 +144,5 @@ def mesh_model(model: Model, specs: MeshSpecs) -> gmsh.model.mesh:
 
         yield gmsh.model.mesh
     finally:
-        gmsh.finalize()
+        if session is None:
+            gmsh.finalize()
@@ -0,0 +1,107 @@
+"""Long lived gmsh session for a worker process
+
+Initializing gmsh loads the OCC kernel and default options, so a worker initializes
+gmsh once and clears the model between jobs. Memory held by gmsh and OCC is not always
+returned after clearing, so the session reports when the process should be recycled.
+"""
+import os
+import resource
+
+import gmsh
+
+from .incremental import GeometryCache
+
+# options which are the same for every mesh, applied once per session
+MESH_OPTIONS = {
+    "Mesh.RecombineAll": 1,
+    "Mesh.RecombinationAlgorithm": 3,
+}
+MAX_SESSION_JOBS = 50  # jobs meshed before the process is recycled
+MAX_SESSION_RSS = 2 * 1024**3  # bytes of resident memory before recycling
+
+
+def available_cpus() -> int:
+    """Number of cpus this process may run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # not available on all platforms
+        return os.cpu_count() or 1
+
+
+def process_rss() -> int:
+    """Resident memory of this process in bytes"""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # peak rather than current memory where /proc is not available
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def apply_mesh_options():
+    for name, value in MESH_OPTIONS.items():
+        gmsh.option.setNumber(name, value)
+
+
+def apply_thread_options(threads: int):
+    """Mesh separate surfaces on up to threads threads"""
+    gmsh.option.setNumber("General.NumThreads", threads)
+    gmsh.option.setNumber("Mesh.MaxNumThreads2D", threads)
+
+
+class GmshSession:
+    """gmsh initialized once and reset between jobs
+
+    Usage:
+        session = GmshSession()
+        session.start()
+        with mesh_model(model, specs, session) as mesh:
+            ...
+        if session.should_recycle():
+            session.stop()
+    """
+
+    def __init__(
+        self, max_jobs: int = MAX_SESSION_JOBS, max_rss: int = MAX_SESSION_RSS
+    ):
+        self._max_jobs = max_jobs
+        self._max_rss = max_rss
+        self._jobs = 0
+        # flattened slave geometry reused between jobs of the session
+        self._geometry = GeometryCache()
+
+    @property
+    def jobs(self) -> int:
+        """Number of jobs started in this session"""
+        return self._jobs
+
+    @property
+    def geometry(self) -> GeometryCache:
+        return self._geometry
+
+    @property
+    def is_running(self) -> bool:
+        return bool(gmsh.isInitialized())
+
+    def start(self):
+        if not self.is_running:
+            gmsh.initialize()
+            apply_mesh_options()
+        self._jobs = 0
+
+    def reset(self):
+        """Start a new empty model, keeping the options"""
+        if not self.is_running:
+            self.start()
+        gmsh.clear()
+        self._jobs += 1
+
+    def stop(self):
+        if self.is_running:
+            gmsh.finalize()
+        self._geometry.clear()
+
+    def should_recycle(self) -> bool:
+        return self._jobs >= self._max_jobs or process_rss() > self._max_rss
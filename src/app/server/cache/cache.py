@@ -1,10 +1,54 @@
-"""Threadsafe dictionary accessors"""
+"""Threadsafe dictionary accessors
+
+Jobs are held until they expire. Finished jobs are removed once they are older than the
+time to live, once their mesh has been fetched, or when the meshes held exceed the
+memory budget, oldest first. Pinned jobs, such as the jobs of a batch, are kept until
+they are unpinned. The ids of removed jobs are remembered so they report as EXPIRED
+rather than NOTFOUND.
+
+Other stores holding meshes, such as the result cache, charge them to the same budget
+with hold and drop. A mesh shared between stores is counted once, and when over budget
+the other stores give up their oldest meshes before finished jobs are removed.
+
+Reads return shallow snapshots of jobs, meshes are shared and never copied.
+"""
+from collections import OrderedDict
 from contextlib import contextmanager
-import copy
 import threading
+import time
+from typing import Callable
+
+import numpy as np
 
 from ..singleton import Singleton
 from ..worker.jobs.job import Job, JobStatus
+from ...interfaces import DashVtkModel, NpDashVtkModel
+
+JOB_TTL = 600  # seconds a finished job is kept
+MEMORY_BUDGET = 512 * 1024**2  # bytes of mesh data kept
+MAX_EXPIRED = 10000  # number of expired job ids remembered
+# approximate bytes per item of a mesh list, a pointer plus a boxed number
+LIST_ITEM_SIZE = 32
+
+FINISHED = [
+    JobStatus.COMPLETE,
+    JobStatus.ERROR,
+    JobStatus.CANCELLED,
+    JobStatus.TIMEOUT,
+]
+
+
+def mesh_size(mesh: DashVtkModel | NpDashVtkModel | None) -> int:
+    """Approximate size of the mesh data in bytes"""
+    if mesh is None:
+        return 0
+    size = 0
+    for values in (mesh.mesh.points, mesh.mesh.polys, mesh.mesh.lines):
+        if isinstance(values, np.ndarray):
+            size += values.nbytes
+        else:
+            size += len(values) * LIST_ITEM_SIZE
+    return size
 
 
 class Cache(Singleton):
@@ -12,6 +56,21 @@ class Cache(Singleton):
         super(Cache, self).__init__()
         if not hasattr(self, "_data"):
             self._data: dict[str, Job] = {}
+            # id of each mesh held to [size, number of references]
+            self._meshes: dict[int, list[int]] = {}
+            # callbacks returning the oldest mesh another store gives up, or None
+            self._reclaimers: list[
+                Callable[[], DashVtkModel | NpDashVtkModel | None]
+            ] = []
+            # finished job ids in order of completion with their completion time
+            self._finished: OrderedDict[str, float] = OrderedDict()
+            self._expired: OrderedDict[str, None] = OrderedDict()
+            self._pinned: set[str] = set()
+            self._footprint = 0
+            self._ttl = JOB_TTL
+            self._budget = MEMORY_BUDGET
+            # callbacks for job status changes
+            self._watchers: dict[str, list[Callable[[JobStatus], None]]] = {}
             self._lock = threading.RLock()
 
     @property
@@ -20,18 +79,232 @@ class Cache(Singleton):
         with self._lock:
             yield self._data
 
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: float):
+        with self._lock:
+            self._ttl = value
+            self._evict()
+
+    @property
+    def budget(self) -> int:
+        return self._budget
+
+    @budget.setter
+    def budget(self, value: int):
+        with self._lock:
+            self._budget = value
+            self._evict()
+
+    @property
+    def footprint(self) -> int:
+        """Approximate bytes of mesh data held by jobs and the other stores"""
+        return self._footprint
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "jobs": len(self._data),
+                "meshes": len(self._meshes),
+                "expired": len(self._expired),
+                "pinned": len(self._pinned),
+                "footprint": self._footprint,
+                "budget": self._budget,
+            }
+
+    def put(self, job: Job):
+        with self._lock:
+            self._expired.pop(job.id, None)
+            previous = self._data.get(job.id)
+            self._hold(job.mesh)
+            if previous is not None:
+                self._drop(previous.mesh)
+            self._data[job.id] = job
+            if job.status in FINISHED and job.id not in self._finished:
+                self._finished[job.id] = time.monotonic()
+            if previous is None or previous.status != job.status:
+                self._notify(job.id, job.status)
+            self._evict()
+
+    def get(self, job_id: str) -> Job:
+        """Snapshot of the job, the mesh is shared rather than copied"""
+        with self._lock:
+            self._evict()
+            if job_id not in self._data:
+                missing = Job(None, job_id)
+                missing.status = self._missing_status(job_id)
+                return missing
+            return self._data[job_id].snapshot()
+
+    def status(self, job_id: str) -> JobStatus:
+        with self._lock:
+            self._evict()
+            if job_id not in self._data:
+                return self._missing_status(job_id)
+            return self._data[job_id].status
+
+    def watch(
+        self, job_id: str, callback: Callable[[JobStatus], None]
+    ) -> JobStatus:
+        """Call callback with the new status each time the status of job_id changes
+
+        callback is called from the thread changing the status while holding the
+        cache lock, so it must return quickly and not access the cache.
+
+        Returns:
+            current status of the job
+        """
+        with self._lock:
+            self._watchers.setdefault(job_id, []).append(callback)
+            return self.status(job_id)
+
+    def unwatch(self, job_id: str, callback: Callable[[JobStatus], None]):
+        with self._lock:
+            callbacks = self._watchers.get(job_id, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                self._watchers.pop(job_id, None)
+
+    def release(self, job_id: str):
+        """Remove a job once its mesh is no longer needed, pinned jobs are kept"""
+        with self._lock:
+            if job_id not in self._pinned:
+                self._remove(job_id)
+
+    def pin(self, job_id: str):
+        """Keep a job whatever its age or the memory budget until it is unpinned"""
+        with self._lock:
+            self._pinned.add(job_id)
+
+    def unpin(self, job_id: str):
+        with self._lock:
+            self._pinned.discard(job_id)
+            self._evict()
+
+    def hold(self, mesh: DashVtkModel | NpDashVtkModel):
+        """Charge a mesh kept by another store to the budget"""
+        with self._lock:
+            self._hold(mesh)
+            self._evict()
+
+    def drop(self, mesh: DashVtkModel | NpDashVtkModel):
+        """Stop charging a mesh another store no longer keeps"""
+        with self._lock:
+            self._drop(mesh)
+
+    def add_reclaimer(
+        self, callback: Callable[[], DashVtkModel | NpDashVtkModel | None]
+    ):
+        """Register a store which gives up meshes when over budget
+
+        callback is called holding the cache lock and returns the oldest mesh the store
+        removed, which is then dropped, or None if the store is empty. It must not
+        access the cache.
+        """
+        with self._lock:
+            self._reclaimers.append(callback)
+
+    def clear(self):
+        with self._lock:
+            for job in self._data.values():
+                self._drop(job.mesh)
+            self._data.clear()
+            self._finished.clear()
+            self._expired.clear()
+            self._pinned.clear()
+
+    def _missing_status(self, job_id: str) -> JobStatus:
+        if job_id in self._expired:
+            return JobStatus.EXPIRED
+        return JobStatus.NOTFOUND
+
+    def _notify(self, job_id: str, status: JobStatus):
+        for callback in self._watchers.get(job_id, []):
+            callback(status)
+
+    def _hold(self, mesh: DashVtkModel | NpDashVtkModel | None):
+        if mesh is None:
+            return
+        # counted by identity as stores share meshes rather than copying them
+        held = self._meshes.get(id(mesh))
+        if held is None:
+            held = self._meshes[id(mesh)] = [mesh_size(mesh), 0]
+            self._footprint += held[0]
+        held[1] += 1
+
+    def _drop(self, mesh: DashVtkModel | NpDashVtkModel | None):
+        if mesh is None or id(mesh) not in self._meshes:
+            return
+        held = self._meshes[id(mesh)]
+        held[1] -= 1
+        if held[1] <= 0:
+            del self._meshes[id(mesh)]
+            self._footprint -= held[0]
+
+    def _remove(self, job_id: str):
+        if job_id not in self._data:
+            return
+        self._drop(self._data.pop(job_id).mesh)
+        self._finished.pop(job_id, None)
+        self._expired[job_id] = None
+        while len(self._expired) > MAX_EXPIRED:
+            self._expired.popitem(last=False)
+        self._notify(job_id, JobStatus.EXPIRED)
+
+    def _evict(self):
+        # finished jobs older than the time to live
+        cutoff = time.monotonic() - self._ttl
+        for job_id, finished in list(self._finished.items()):
+            if finished > cutoff:
+                break
+            if job_id not in self._pinned:
+                self._remove(job_id)
+        # meshes kept for reuse by other stores, then the oldest finished jobs holding
+        # meshes, until within budget
+        for reclaim in self._reclaimers:
+            while self._footprint > self._budget:
+                mesh = reclaim()
+                if mesh is None:
+                    break
+                self._drop(mesh)
+        if self._footprint > self._budget:
+            for job_id in list(self._finished):
+                if self._footprint <= self._budget:
+                    break
+                if job_id not in self._pinned and self._data[job_id].mesh is not None:
+                    self._remove(job_id)
+
 
 def store_job(job: Job):
     cache = Cache()  # singleton
-    with cache.store as store:
-        store[job.id] = job
+    cache.put(job)
+
+
+def get_job(job_id: str) -> Job:
+    cache = Cache()  # singleton
+    return cache.get(job_id)
+
+
+def get_job_status(job_id: str) -> JobStatus:
+    cache = Cache()  # singleton
+    return cache.status(job_id)
+
+
+def release_job(job_id: str):
+    cache = Cache()  # singleton
+    cache.release(job_id)
+
+
+def pin_job(job_id: str):
+    cache = Cache()  # singleton
+    cache.pin(job_id)
 
 
-def get_job(job_id: str):
+def unpin_job(job_id: str):
     cache = Cache()  # singleton
-    with cache.store as store:
-        if job_id not in store:
-            not_found = Job(None, job_id)
-            not_found.status = JobStatus.NOTFOUND
-            return not_found
-        return copy.deepcopy(store[job_id])
+    cache.unpin(job_id)
@@ -0,0 +1,149 @@
+"""Content-addressed cache of completed meshes
+
+Meshes are keyed by a hash of the normalized Model and MeshSpecs so that submitting the
+same model twice returns the previous mesh without running gmsh again. At most
+MAX_RESULTS meshes are kept and they are charged to the memory budget of the job store,
+which removes the least recently used results first when over budget.
+"""
+from collections import OrderedDict
+from contextlib import contextmanager
+import hashlib
+import json
+import threading
+from typing import Any
+
+from .cache import Cache
+from ..singleton import Singleton
+from ...interfaces import DashVtkModel, MeshSpecs, Model, NpDashVtkModel
+
+MAX_RESULTS = 32  # number of meshes held in the cache
+FLOAT_TOL = 1e-9  # floats closer than this are considered equal
+
+
+def _normalize(value: Any, tol: float) -> Any:
+    """Round floats to tol and sort dictionary keys so equal models serialize equally"""
+    if isinstance(value, float):
+        # integers avoid float formatting and -0.0 differences
+        return int(round(value / tol))
+    if isinstance(value, dict):
+        return {k: _normalize(v, tol) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v, tol) for v in value]
+    return value
+
+
+def result_key(model: Model, specs: MeshSpecs, tol: float = FLOAT_TOL) -> str:
+    """Stable hash of a model and the specs used to mesh it
+
+    Slaves are sorted by name so the order they are defined in does not matter.
+    """
+    data = model.dict()
+    data["joint"]["slaves"] = sorted(
+        data["joint"]["slaves"], key=lambda slave: slave["name"]
+    )
+    # threads change how fast a mesh is made but not the mesh
+    specs_data = specs.dict(exclude={"threads"})
+    canonical = {"model": _normalize(data, tol), "specs": _normalize(specs_data, tol)}
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResultCache(Singleton):
+    def __init__(self):
+        super(ResultCache, self).__init__()
+        if not hasattr(self, "_data"):
+            self._data: OrderedDict[str, DashVtkModel | NpDashVtkModel] = OrderedDict()
+            self._lock = threading.RLock()
+            self._max_size = MAX_RESULTS
+            self._hits = 0
+            self._misses = 0
+            Cache().add_reclaimer(self._pop_oldest)
+
+    @property
+    @contextmanager
+    def store(self) -> OrderedDict[str, DashVtkModel | NpDashVtkModel]:
+        with self._lock:
+            yield self._data
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        with self._lock:
+            self._max_size = value
+            evicted = self._evict()
+        self._drop(evicted)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._data),
+                "max_size": self._max_size,
+            }
+
+    def get(self, key: str) -> DashVtkModel | NpDashVtkModel | None:
+        with self._lock:
+            if key not in self._data:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: str, mesh: DashVtkModel | NpDashVtkModel):
+        # charged before it can be reclaimed, and outside our lock as the job store
+        # calls _pop_oldest holding its lock
+        Cache().hold(mesh)
+        with self._lock:
+            previous = self._data.get(key)
+            self._data[key] = mesh
+            self._data.move_to_end(key)
+            evicted = self._evict()
+        if previous is not None:
+            evicted.append(previous)
+        self._drop(evicted)
+
+    def clear(self):
+        with self._lock:
+            evicted = list(self._data.values())
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+        self._drop(evicted)
+
+    def _evict(self) -> list[DashVtkModel | NpDashVtkModel]:
+        evicted = []
+        while len(self._data) > max(self._max_size, 0):
+            evicted.append(self._data.popitem(last=False)[1])
+        return evicted
+
+    def _pop_oldest(self) -> DashVtkModel | NpDashVtkModel | None:
+        with self._lock:
+            if not self._data:
+                return None
+            return self._data.popitem(last=False)[1]
+
+    @staticmethod
+    def _drop(meshes: list[DashVtkModel | NpDashVtkModel]):
+        cache = Cache()  # singleton
+        for mesh in meshes:
+            cache.drop(mesh)
+
+
+def get_result(
+    model: Model, specs: MeshSpecs
+) -> DashVtkModel | NpDashVtkModel | None:
+    cache = ResultCache()  # singleton
+    return cache.get(result_key(model, specs))
+
+
+def store_result(
+    model: Model, specs: MeshSpecs, mesh: DashVtkModel | NpDashVtkModel
+):
+    cache = ResultCache()  # singleton
+    cache.put(result_key(model, specs), mesh)
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from ..cache.cache import Cache
+from ..cache.results import ResultCache
+
+router = APIRouter()
+
+
+@router.get("/admin/cache")
+def get_cache_stats():
+    return {"jobs": Cache().stats, "results": ResultCache().stats}
@@ -0,0 +1,35 @@
+from fastapi import APIRouter, HTTPException
+
+from ...converters.outline import convert_model_to_outline, convert_models_to_outlines
+from ...interfaces import Model, ModelOutline
+from ...interfaces.examples.joints import EXAMPLE_MODELS
+from ...modelling.geometry.intersections import IntersectionError
+
+router = APIRouter()
+
+
+@router.get("/geometry/examples/{modelname}", response_model=ModelOutline)
+def outline_example(modelname: str):
+    if modelname not in EXAMPLE_MODELS:
+        raise HTTPException(
+            status_code=404, detail=f"Joint model {modelname} not found"
+        )
+    return convert_model_to_outline(EXAMPLE_MODELS[modelname])
+
+
+@router.post("/geometry/outline", response_model=ModelOutline)
+def outline_model(model: Model):
+    """Weld lines and hole outlines of the joint, calculated without meshing"""
+    try:
+        return convert_model_to_outline(model)
+    except IntersectionError as e:
+        raise HTTPException(status_code=422, headers={"toast": str(e)})
+
+
+@router.post("/geometry/batch/outline", response_model=list[ModelOutline])
+def outline_batch(models: list[Model]):
+    """Weld lines and hole outlines of each model, in order"""
+    try:
+        return convert_models_to_outlines(models)
+    except IntersectionError as e:
+        raise HTTPException(status_code=422, headers={"toast": str(e)})
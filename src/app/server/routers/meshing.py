@@ -1,28 +1,41 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Request
 
-from ..worker.jobs.interfaces import MeshJob
+from ..worker.jobs.interfaces import MeshBatch, MeshJob
 from ..worker.manager import Manager
 
 from ...interfaces import Model
 from ...interfaces.examples.joints import EXAMPLE_MODELS
 
+MAX_WAIT = 60  # seconds
+
 router = APIRouter()
 manager = Manager()
 
 
+def client_id(request: Request) -> str:
+    """Identifies the caller for fair sharing of workers"""
+    return request.client.host if request.client is not None else ""
+
+
 @router.get("/examples/{modelname}")
-def mesh_example(modelname: str):
+def mesh_example(modelname: str, request: Request):
     if modelname not in EXAMPLE_MODELS:
         raise HTTPException(
             status_code=404, detail=f"Joint model {modelname} not found"
         )
-    return manager.submit_job(EXAMPLE_MODELS[modelname])
+    return manager.submit_job(EXAMPLE_MODELS[modelname], client=client_id(request))
 
 
 @router.post("/meshmodel/submit", response_model=MeshJob)
-def submit_model_to_mesher(model: Model):
+def submit_model_to_mesher(model: Model, request: Request):
     # do some validation here!
-    return manager.submit_job(model)
+    return manager.submit_job(model, client=client_id(request))
+
+
+@router.delete("/meshmodel/{job_id}", response_model=MeshJob)
+def cancel_job(job_id: str):
+    """Cancel a job, ending the mesh if it is in progress"""
+    return manager.cancel_job(job_id)
 
 
 @router.get("/meshmodel/monitor/{job_id}", response_model=MeshJob)
@@ -30,6 +43,40 @@ def get_job_status(job_id: str):
     return manager.monitor_job(job_id)
 
 
+@router.get("/meshmodel/wait/{job_id}", response_model=MeshJob)
+async def wait_for_job_status(
+    job_id: str, timeout: float = Query(default=30, ge=0, le=MAX_WAIT)
+):
+    """Long-poll which returns once the job has finished or after timeout seconds"""
+    return await manager.long_poll_job(job_id, timeout)
+
+
+@router.get("/meshmodel/events/{job_id}")
+async def get_job_events(job_id: str):
+    """Stream job status changes as server-sent events"""
+    return manager.job_events(job_id)
+
+
 @router.get("/meshmodel/mesh/{job_id}")
-def get_model_from_mesher(job_id: str):
-    return manager.get_job(job_id)
+def get_model_from_mesher(
+    job_id: str,
+    accept: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+):
+    return manager.get_job(job_id, accept, accept_encoding)
+
+
+@router.post("/meshmodel/batch/submit", response_model=MeshBatch)
+def submit_batch_to_mesher(models: list[Model], request: Request):
+    return manager.submit_batch(models, client=client_id(request))
+
+
+@router.get("/meshmodel/batch/monitor/{batch_id}", response_model=MeshBatch)
+def get_batch_status(batch_id: str):
+    return manager.monitor_batch(batch_id)
+
+
+@router.get("/meshmodel/batch/mesh/{batch_id}")
+def get_batch_from_mesher(batch_id: str):
+    """Stream the meshes of a batch as they complete"""
+    return manager.get_batch(batch_id)
@@ -0,0 +1,151 @@
+"""Route job outputs from the worker pool to waiting callers
+
+One reader thread per worker blocks on that worker's out queue, stores each output and
+resolves the future of the job when it finishes. The cost of a job is one dictionary
+entry, regardless of how many jobs are in flight.
+"""
+from concurrent.futures import CancelledError, Future, TimeoutError as FutureTimeoutError
+import queue
+import threading
+import time
+from typing import Callable
+
+from .jobs.job import Job, JobStatus
+from .pool import WorkerPool
+from .transport import SharedMesh, attach_mesh
+from .worker import RECYCLE
+from ..cache.cache import FINISHED, get_job_status, store_job
+from ..cache.results import store_result
+from ...converters.binary import DashVtkFormatError
+
+TIMEOUT = 120  # seconds
+# jobs stopped by the server, later outputs from the worker are ignored
+STOPPED = [JobStatus.CANCELLED, JobStatus.TIMEOUT]
+READ_TIMEOUT = 0.5  # seconds, how often readers check for stop or a replaced worker
+
+
+class Dispatcher:
+    def __init__(
+        self, pool: WorkerPool, on_finished: Callable[[], None] | None = None
+    ):
+        """
+        Args:
+            pool: workers to read outputs from
+            on_finished: called after a job finishes, once the worker has capacity
+        """
+        self._pool = pool
+        self._on_finished = on_finished
+        self._futures: dict[str, Future] = {}
+        self._started: dict[str, float] = {}  # job id to time meshing started
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._readers: list[threading.Thread] = []
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting for an output"""
+        with self._lock:
+            return len(self._futures)
+
+    def start(self):
+        self._stop_event.clear()
+        self._readers = [
+            threading.Thread(target=self._read, args=(idx,), daemon=True)
+            for idx in range(self._pool.size)
+        ]
+        for reader in self._readers:
+            reader.start()
+
+    def stop(self):
+        self._stop_event.set()
+        for reader in self._readers:
+            reader.join()
+        self._readers = []
+        with self._lock:
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+            self._started.clear()
+
+    def track(self, job_id: str) -> Future:
+        """Future which resolves to the finished job"""
+        with self._lock:
+            # a job submitted again has not started meshing yet
+            self._started.pop(job_id, None)
+            if job_id not in self._futures:
+                self._futures[job_id] = Future()
+            return self._futures[job_id]
+
+    def future(self, job_id: str) -> Future | None:
+        with self._lock:
+            return self._futures.get(job_id)
+
+    def wait(self, job_id: str, timeout: float = TIMEOUT) -> Job | None:
+        """Block until job_id finishes
+
+        Returns:
+            finished job, or None if the job is not tracked or timeout is reached
+        """
+        future = self.future(job_id)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout)
+        except (CancelledError, FutureTimeoutError):
+            return None
+
+    def overdue(self, timeout: float) -> list[str]:
+        """Ids of jobs which have been meshing for longer than timeout seconds"""
+        cutoff = time.monotonic() - timeout
+        with self._lock:
+            return [id for id, started in self._started.items() if started < cutoff]
+
+    def dispatch(self, output: Job):
+        """Store an output and resolve the future of its job once finished"""
+        if isinstance(output.mesh, SharedMesh):
+            self._attach(output)
+        with self._lock:
+            if get_job_status(output.id) in STOPPED:
+                return
+            store_job(output)
+            if output.status == JobStatus.RUNNING:
+                self._started[output.id] = time.monotonic()
+            if output.status == JobStatus.COMPLETE:
+                store_result(output.data, output.specs, output.mesh)
+            finished = output.status in FINISHED
+            if finished:
+                self._pool.finish(output.id)
+                self._started.pop(output.id, None)
+                future = self._futures.pop(output.id, None)
+                if future is not None:
+                    future.set_result(output.snapshot())
+        # outside the lock as the callback may submit jobs
+        if finished and self._on_finished is not None:
+            self._on_finished()
+
+    @staticmethod
+    def _attach(output: Job):
+        """Replace the shared mesh descriptor of an output with the mapped mesh"""
+        try:
+            output.mesh = attach_mesh(output.mesh)
+        except (OSError, DashVtkFormatError) as e:
+            output.mesh = None
+            output.error = f"Could not read mesh from worker: {e}"
+
+    def _read(self, idx: int):
+        while not self._stop_event.is_set():
+            # the worker is replaced if it crashes so look up its queue each time
+            outqueue = self._pool.workers[idx].outqueue
+            try:
+                output = outqueue.get(timeout=READ_TIMEOUT)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError, ValueError):
+                # queue of a crashed worker, wait for it to be replaced
+                self._stop_event.wait(READ_TIMEOUT)
+                continue
+            if isinstance(output, Job):
+                self.dispatch(output)
+            elif output == RECYCLE:
+                # every output of the old worker has been read
+                self._pool.recycle(idx)
@@ -6,3 +6,9 @@ from .job import JobStatus
 class MeshJob(BaseModel):
     id: str = ...
     status: JobStatus = ...
+
+
+class MeshBatch(BaseModel):
+    id: str = ...
+    status: JobStatus = ...
+    jobs: list[MeshJob] = ...
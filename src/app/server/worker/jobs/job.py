@@ -1,7 +1,14 @@
+import copy
 from enum import Enum
 import uuid
 
-from ....interfaces import DashVtkModel, Model
+from ....interfaces import (
+    DashVtkModel,
+    Model,
+    MeshSpecs,
+    NpDashVtkModel,
+    DEFAULT_MESH_SPECS,
+)
 
 
 class JobStatus(str, Enum):
@@ -11,15 +18,21 @@ class JobStatus(str, Enum):
     COMPLETE = "COMPLETE"
     ERROR = "ERROR"
     NOTFOUND = "NOTFOUND"
+    EXPIRED = "EXPIRED"
+    CANCELLED = "CANCELLED"
+    TIMEOUT = "TIMEOUT"
 
 
 class Job:
-    def __init__(self, model: Model, id: str | None = None):
+    def __init__(
+        self, model: Model, id: str | None = None, specs: MeshSpecs | None = None
+    ):
         if id is None:
             self._id = str(uuid.uuid4())
         else:
             self._id = id
         self._data = model
+        self._specs = DEFAULT_MESH_SPECS if specs is None else specs
         self._mesh = None
         self._error = None
         self._status = JobStatus.PENDING
@@ -32,6 +45,10 @@ class Job:
     def data(self) -> Model:
         return self._data
 
+    @property
+    def specs(self) -> MeshSpecs:
+        return self._specs
+
     @property
     def error(self) -> str:
         return self._error
@@ -42,11 +59,12 @@ class Job:
         self._error = value
 
     @property
-    def mesh(self) -> DashVtkModel:
+    def mesh(self) -> DashVtkModel | NpDashVtkModel:
+        """Mesh of a completed job, a SharedMesh while passed from a worker"""
         return self._mesh
 
     @mesh.setter
-    def mesh(self, value: DashVtkModel):
+    def mesh(self, value: DashVtkModel | NpDashVtkModel):
         self._mesh = value
 
     @property
@@ -57,5 +75,13 @@ class Job:
     def status(self, value: JobStatus):
         self._status = value
 
+    def snapshot(self) -> "Job":
+        """Copy of the job sharing the model and mesh
+
+        Status and error can be changed on the copy without affecting this job, the
+        model and mesh are shared and must not be modified.
+        """
+        return copy.copy(self)
+
     def __str__(self):
         return f"id: {self.id}\nstatus: {self.status}\nerror: {self.error}"
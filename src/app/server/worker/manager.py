@@ -2,24 +2,62 @@
 from fastapi import HTTPException
 from fastapi.responses import StreamingResponse
 
-import io
+import asyncio
+from collections import OrderedDict
 import json
 import threading
 import time
+from typing import AsyncGenerator
+import uuid
 
+from app.converters.binary import MEDIA_TYPE as BINARY_MEDIA_TYPE, iter_dash_vtk
 from app.converters.encoder import NpEncoder
-from app.server.worker.worker import Worker
+from app.converters.stream import (
+    accepted_encoding,
+    compress_chunks,
+    iter_dash_vtk_json,
+)
+from app.server.worker.pool import WorkerPool
 from app.server.worker.jobs.job import Job, JobStatus
-from app.server.worker.jobs.interfaces import MeshJob
+from app.server.worker.jobs.interfaces import MeshBatch, MeshJob
 
-from .runner import RunJob
+from .dispatcher import Dispatcher, STOPPED, TIMEOUT
+from .scheduler import Priority, Scheduler
+from .transport import remove_worker_meshes
 from ..singleton import SingletonThread
-from ..cache.cache import Cache, get_job
-from ...interfaces import Model
+from ..cache.cache import (
+    FINISHED,
+    Cache,
+    get_job,
+    get_job_status,
+    pin_job,
+    release_job,
+    store_job,
+    unpin_job,
+)
+from ..cache.results import get_result
+from ...interfaces import Model, MeshSpecs
+from ...modelling.mesher.estimate import MeshEstimate, estimate_mesh
 from ...interfaces.examples.joints import EXAMPLE_MODELS
 
 SENTINEL = "STOP"
 DELAY = 5  # ms
+EVENT_MEDIA_TYPE = "text/event-stream"
+BATCH_MEDIA_TYPE = "application/x-ndjson"
+MAX_BATCHES = 1000  # number of batches remembered
+BATCH_TIMEOUT = 3600  # seconds to wait for each job of a batch download
+# statuses after which a job no longer changes
+FINAL_STATUSES = [
+    JobStatus.COMPLETE,
+    JobStatus.ERROR,
+    JobStatus.NOTFOUND,
+    JobStatus.EXPIRED,
+    JobStatus.CANCELLED,
+    JobStatus.TIMEOUT,
+]
+JOB_TIMEOUT = TIMEOUT  # seconds a job may mesh for before it is stopped
+# jobs handed to each worker at once, the rest wait in the scheduler
+WORKER_QUEUE_DEPTH = 1
 
 
 class Manager(SingletonThread):
@@ -28,60 +66,321 @@ class Manager(SingletonThread):
     def __init__(self):
         super(Manager, self).__init__()
         self._cache = Cache()  # singleton
-        if not hasattr(self, "_runners"):
-            self._runners = {}  # hold runner threads
-        self._worker = Worker()
+        if not hasattr(self, "_batches"):
+            self._batches: OrderedDict[str, list[str]] = OrderedDict()
+        self._pool = WorkerPool()
+        self._dispatcher = Dispatcher(self._pool, self._schedule)
+        self._scheduler = Scheduler()
+        self._schedule_lock = threading.RLock()
         self._stop_event = threading.Event()
 
     @property
-    def runners(self):
-        return self._runners
+    def pool(self) -> WorkerPool:
+        return self._pool
 
     @property
-    def worker(self):
-        return self._worker
+    def dispatcher(self) -> Dispatcher:
+        return self._dispatcher
+
+    @property
+    def scheduler(self) -> Scheduler:
+        return self._scheduler
 
     def start(self, *args, **kwargs):
-        self._worker.start()
+        self._pool.start()
+        self._dispatcher.start()
         super(Manager, self).start(*args, **kwargs)
 
     def run(self):
         while True:
             if self._stop_event.is_set():
                 break
-            if not self._worker.is_alive():
-                # Reset worker singleton
-                worker = Worker()
-                # Set all cached jobs as errors
-                with self._cache.store as store:
-                    for job in store.values():
-                        if job.status in [JobStatus.RUNNING]:
-                            job.error = "Job failed due to worker process crashing"
-                        worker.outqueue.put(job)
-                self._worker = worker
-                self.worker.start()
-            time.sleep(DELAY)
+            for id in self._dispatcher.overdue(JOB_TIMEOUT):
+                self.cancel_job(id, JobStatus.TIMEOUT)
+            for _, job_ids in self._pool.recover():
+                for job_id in job_ids:
+                    job = get_job(job_id)
+                    if job.status == JobStatus.RUNNING:
+                        # Only the job being meshed is lost with the worker
+                        job.error = "Job failed due to worker process crashing"
+                        self._dispatcher.dispatch(job)
+                    elif job.status == JobStatus.SUBMITTED:
+                        # Queued jobs are sent to another worker
+                        self._submit(job)
+            # workers may have been replaced
+            self._schedule()
+            time.sleep(DELAY / 1000)
 
     def stop(self):
-        for runner in self.runners.values():
-            runner.stop()
-        self._runners = {}
-        self.worker.stop()
-        del self._worker
+        self.dispatcher.stop()
+        self.pool.stop()
+        del self._dispatcher
+        del self._pool
         import gc
 
         gc.collect()
         self._stop_event.set()
 
-    def submit_job(self, model: Model) -> MeshJob:
-        job: Job = Job(model)
-        self._runners[job.id] = RunJob(self, job, True)
-        return MeshJob(id=job.id, status=JobStatus.SUBMITTED)
+    def admit(self, model: Model, specs: MeshSpecs | None = None) -> MeshEstimate:
+        """Reject models which are predicted to need more memory than a worker has
+
+        Returns:
+            estimated size of the mesh
+
+        Raises:
+            HTTPException 413 if the model is too large, 422 if specs are invalid
+        """
+        try:
+            estimate = estimate_mesh(model, specs)
+        except ValueError as e:
+            raise HTTPException(status_code=422, headers={"toast": str(e)})
+        if estimate.rss > self._pool.max_rss:
+            raise HTTPException(
+                status_code=413,
+                headers={
+                    "toast": f"Model {model.name} needs about {estimate.elements} "
+                    f"elements and {estimate.rss / 1024**2:.0f} MB, more than the "
+                    f"{self._pool.max_rss / 1024**2:.0f} MB limit of a worker"
+                },
+            )
+        return estimate
+
+    def submit_job(
+        self,
+        model: Model,
+        specs: MeshSpecs | None = None,
+        priority: Priority = Priority.INTERACTIVE,
+        client: str = "",
+    ) -> MeshJob:
+        """Submit a job to the scheduler
+
+        Args:
+            model: model to mesh
+            specs: mesh specs, DEFAULT_MESH_SPECS if not defined
+            priority: priority class of the job
+            client: identifies who submitted the job for fair sharing of workers
+        """
+        estimate = self.admit(model, specs)
+        return self._enqueue(model, specs, priority, client, estimate)
+
+    def _enqueue(
+        self,
+        model: Model,
+        specs: MeshSpecs | None,
+        priority: Priority,
+        client: str,
+        estimate: MeshEstimate,
+    ) -> MeshJob:
+        job: Job = Job(model, specs=specs)
+        # return previously generated mesh for identical model and specs
+        mesh = get_result(job.data, job.specs)
+        if mesh is not None:
+            job.mesh = mesh
+            job.status = JobStatus.COMPLETE
+            store_job(job)
+            return MeshJob(id=job.id, status=job.status)
+        if not self._pool.is_alive():
+            job.error = (
+                "Worker performing gmsh operations is not running, "
+                "please contact the administrator"
+            )
+            store_job(job)
+            return MeshJob(id=job.id, status=job.status)
+        # track and store before scheduling so outputs are never lost
+        self._dispatcher.track(job.id)
+        store_job(job.snapshot())
+        self._scheduler.push(job, priority, client, estimate.elements)
+        self._schedule()
+        return MeshJob(id=job.id, status=get_job_status(job.id))
+
+    def _schedule(self):
+        """Hand waiting jobs to workers with free capacity"""
+        with self._schedule_lock:
+            while self._pool.has_capacity(WORKER_QUEUE_DEPTH):
+                job = self._scheduler.pop()
+                if job is None:
+                    break
+                self._submit(job)
+
+    def _submit(self, job: Job):
+        # track and store before submitting so outputs are never lost or overwritten
+        self._dispatcher.track(job.id)
+        job.status = JobStatus.SUBMITTED
+        store_job(job.snapshot())
+        self._pool.submit(job)
+
+    def submit_batch(
+        self, models: list[Model], specs: MeshSpecs | None = None, client: str = ""
+    ) -> MeshBatch:
+        """Submit a bulk priority job per model"""
+        # reject the whole batch before submitting anything
+        estimates = [self.admit(model, specs) for model in models]
+        jobs = [
+            self._enqueue(model, specs, Priority.BULK, client, estimate)
+            for model, estimate in zip(models, estimates)
+        ]
+        batch_id = str(uuid.uuid4())
+        # kept whatever their age so the batch can be downloaded again
+        for job in jobs:
+            pin_job(job.id)
+        self._batches[batch_id] = [job.id for job in jobs]
+        while len(self._batches) > MAX_BATCHES:
+            _, evicted = self._batches.popitem(last=False)
+            # jobs still meshing are released by the time to live once finished
+            for id in evicted:
+                unpin_job(id)
+                if get_job_status(id) in FINISHED:
+                    release_job(id)
+        return MeshBatch(id=batch_id, status=batch_status(jobs), jobs=jobs)
+
+    def _batch_job_ids(self, batch_id: str) -> list[str]:
+        if batch_id not in self._batches:
+            raise HTTPException(
+                status_code=404,
+                headers={"toast": f"Batch {batch_id.split('-')[0]} not found"},
+            )
+        return self._batches[batch_id]
+
+    def monitor_batch(self, batch_id: str) -> MeshBatch:
+        jobs = [self.monitor_job(id) for id in self._batch_job_ids(batch_id)]
+        return MeshBatch(id=batch_id, status=batch_status(jobs), jobs=jobs)
+
+    def get_batch(self, batch_id: str) -> StreamingResponse:
+        """Stream the jobs of a batch as newline delimited json in order of completion
+
+        Each line holds the job id, status, error and mesh, the mesh is null unless
+        the job completed. The jobs are pinned in the job store until more than
+        MAX_BATCHES newer batches are submitted, so a batch can be downloaded again.
+        """
+        job_ids = self._batch_job_ids(batch_id)
+
+        async def finished(id: str) -> Job:
+            await self.long_poll_job(id, BATCH_TIMEOUT)
+            return get_job(id)
+
+        def to_line(job: Job) -> str:
+            mesh = job.mesh.dict() if job.status == JobStatus.COMPLETE else None
+            line = dict(id=job.id, status=job.status, error=job.error, mesh=mesh)
+            return json.dumps(line, cls=NpEncoder) + "\n"
+
+        async def lines():
+            for next_job in asyncio.as_completed([finished(id) for id in job_ids]):
+                job = await next_job
+                # serialize off the event loop, meshes can be large
+                yield await asyncio.to_thread(to_line, job)
+
+        return StreamingResponse(lines(), media_type=BATCH_MEDIA_TYPE)
+
+    def cancel_job(
+        self, id: str, status: JobStatus = JobStatus.CANCELLED
+    ) -> MeshJob:
+        """Stop a job, killing its worker if the job is being meshed
+
+        The worker is replaced straight away and the pool submits the other jobs it
+        had not finished to the replacement.
+
+        Args:
+            id: job id
+            status: CANCELLED or TIMEOUT
+        """
+        if status not in STOPPED:
+            raise ValueError(f"Cannot stop a job with status {status}")
+        # hold scheduling so the job cannot move from the scheduler to a worker
+        with self._schedule_lock:
+            job = get_job(id)
+            if job.status in FINAL_STATUSES:
+                return MeshJob(id=id, status=job.status)
+            idx = self._pool.owner(id)
+            queued = self._scheduler.remove(id) or (
+                job.status == JobStatus.SUBMITTED and self._pool.remove_queued(id)
+            )
+
+            job.error = f"Job was stopped with status {status.value}"
+            job.status = status
+            self._dispatcher.dispatch(job)
+
+            if idx is not None and not queued:
+                # the job may be running, killing the worker is the only way to stop
+                # gmsh
+                pid = self._pool.workers[idx].pid
+                for output in self._pool.kill(idx):
+                    self._dispatcher.dispatch(output)
+                # meshes the worker wrote but did not put on its queue
+                remove_worker_meshes(pid)
+        self._schedule()
+        return MeshJob(id=id, status=status)
 
     def monitor_job(self, id: str) -> MeshJob:
-        return MeshJob(id=id, status=get_job(id).status)
+        return MeshJob(id=id, status=get_job_status(id))
+
+    async def watch_job(
+        self, id: str, timeout: float = TIMEOUT
+    ) -> AsyncGenerator[JobStatus, None]:
+        """Yield the current status of a job and then each change of status
+
+        Stops once the job reaches one of FINAL_STATUSES or after timeout seconds,
+        waiting does not block a thread.
+        """
+        loop = asyncio.get_running_loop()
+        statuses: asyncio.Queue[JobStatus] = asyncio.Queue()
+
+        def callback(status: JobStatus):
+            try:
+                loop.call_soon_threadsafe(statuses.put_nowait, status)
+            except RuntimeError:
+                # event loop has closed
+                pass
+
+        status = self._cache.watch(id, callback)
+        deadline = loop.time() + timeout
+        try:
+            yield status
+            while status not in FINAL_STATUSES:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    new_status = await asyncio.wait_for(statuses.get(), remaining)
+                except asyncio.TimeoutError:
+                    return
+                if new_status != status:
+                    status = new_status
+                    yield status
+        finally:
+            self._cache.unwatch(id, callback)
+
+    async def long_poll_job(self, id: str, timeout: float = TIMEOUT) -> MeshJob:
+        """Status of a job once it has finished or timeout seconds have passed"""
+        async for status in self.watch_job(id, timeout):
+            pass
+        return MeshJob(id=id, status=status)
+
+    def job_events(self, id: str, timeout: float = TIMEOUT) -> StreamingResponse:
+        """Server-sent events stream of the status changes of a job"""
+
+        async def events():
+            async for status in self.watch_job(id, timeout):
+                job = MeshJob(id=id, status=status)
+                yield f"event: status\ndata: {job.json()}\n\n"
+
+        return StreamingResponse(
+            events(),
+            media_type=EVENT_MEDIA_TYPE,
+            headers={"Cache-Control": "no-cache"},
+        )
 
-    def get_job(self, id: str) -> StreamingResponse:
+    def get_job(
+        self, id: str, accept: str | None = None, accept_encoding: str | None = None
+    ) -> StreamingResponse:
+        """Stream the mesh of a completed job
+
+        Args:
+            id: job id
+            accept: value of the request Accept header, the binary mesh format is
+                returned if it includes BINARY_MEDIA_TYPE otherwise json is returned
+            accept_encoding: value of the request Accept-Encoding header, the mesh is
+                compressed with brotli or gzip if accepted
+        """
         job = get_job(id)
         if job.status == JobStatus.ERROR:
             raise HTTPException(
@@ -90,19 +389,37 @@ class Manager(SingletonThread):
             )
         elif job.status == JobStatus.COMPLETE:
             try:
-
-                def iterfile():
-                    with io.StringIO() as file_like:
-                        json.dump(job.mesh.dict(), file_like, cls=NpEncoder)
-                        file_like.seek(0)
-                        yield from file_like
-
-                return StreamingResponse(iterfile(), media_type="application/json")
+                if accept is not None and BINARY_MEDIA_TYPE in accept:
+                    media_type = BINARY_MEDIA_TYPE
+                    chunks = iter_dash_vtk(job.mesh)
+                else:
+                    media_type = "application/json"
+                    chunks = iter_dash_vtk_json(job.mesh)
+                encoding = accepted_encoding(accept_encoding)
+                headers = {"Vary": "Accept-Encoding"}
+                if encoding is not None:
+                    headers["Content-Encoding"] = encoding
+                response = StreamingResponse(
+                    compress_chunks(chunks, encoding),
+                    media_type=media_type,
+                    headers=headers,
+                )
             except Exception as e:
                 raise HTTPException(
                     status_code=500,
                     headers={"toast": f"Error while generating mesh: {e}"},
                 )
+            # the response holds its own reference to the mesh
+            release_job(id)
+            return response
+        elif job.status in [JobStatus.NOTFOUND, JobStatus.EXPIRED]:
+            raise HTTPException(
+                status_code=404,
+                headers={
+                    "toast": f"Job {id.split('-')[0]} has status {job.status.value}, "
+                    "please try re-submitting"
+                },
+            )
         else:
             raise HTTPException(
                 status_code=500,
@@ -111,8 +428,32 @@ class Manager(SingletonThread):
                 },
             )
 
-    def wait_for_job(self, id: str) -> Job:
-        try:
-            return self.runners[id].wait()
-        except KeyError:
+    def wait_for_job(self, id: str, timeout: float = TIMEOUT) -> Job:
+        if self._dispatcher.future(id) is not None:
+            job = self._dispatcher.wait(id, timeout)
+            if job is not None:
+                return job
+        # finished jobs, including those served from the result cache
+        job = get_job(id)
+        if job.status in [JobStatus.NOTFOUND, JobStatus.EXPIRED]:
             raise KeyError(f"Job with id {id.split('-')[0]} is not running")
+        return job
+
+
+def batch_status(jobs: list[MeshJob]) -> JobStatus:
+    """Single status for a batch of jobs
+
+    COMPLETE once every job has completed, ERROR once every job has finished but not
+    all completed, RUNNING while any job has started or finished and SUBMITTED
+    otherwise.
+    """
+    statuses = [job.status for job in jobs]
+    if all(status == JobStatus.COMPLETE for status in statuses):
+        return JobStatus.COMPLETE
+    if all(status in FINAL_STATUSES for status in statuses):
+        return JobStatus.ERROR
+    if any(
+        status == JobStatus.RUNNING or status in FINAL_STATUSES for status in statuses
+    ):
+        return JobStatus.RUNNING
+    return JobStatus.SUBMITTED
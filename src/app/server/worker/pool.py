@@ -0,0 +1,248 @@
+"""Pool of gmsh worker processes
+
+gmsh keeps global state so meshing runs in separate processes rather than threads. Each
+worker has its own in and out queues, jobs are dispatched to the worker with the fewest
+jobs in flight and a crashed worker is replaced without affecting the others.
+"""
+from multiprocessing.queues import Queue
+import os
+import pickle
+import queue
+import threading
+
+from .jobs.job import Job
+from .transport import remove_worker_meshes
+from .worker import MAX_WORKER_RSS, Worker, WorkerException
+from ..cache.cache import FINISHED
+from ...constants import WORKERS
+from ...modelling.mesher.session import MAX_SESSION_JOBS, available_cpus
+
+JOIN_TIMEOUT = 5  # seconds to wait for a recycled worker to exit
+DRAIN_TIMEOUT = 0.05  # seconds to wait for another item when draining a queue
+
+
+def default_pool_size() -> int:
+    """Number of workers from the environment, otherwise the number of cpus"""
+    if WORKERS in os.environ:
+        return max(1, int(os.environ[WORKERS]))
+    return available_cpus()
+
+
+def drain_queue(items: Queue) -> list:
+    """Remove and return everything which can be read from a queue"""
+    drained = []
+    while True:
+        try:
+            # wait briefly for items still being flushed by a feeder thread
+            drained.append(items.get(timeout=DRAIN_TIMEOUT))
+        except queue.Empty:
+            return drained
+        except (EOFError, OSError, ValueError, pickle.UnpicklingError):
+            # a worker killed while writing can leave a partial item
+            return drained
+
+
+class WorkerPool:
+    def __init__(
+        self,
+        size: int | None = None,
+        persistent: bool = True,
+        max_rss: int = MAX_WORKER_RSS,
+        max_jobs: int = MAX_SESSION_JOBS,
+    ):
+        if size is None:
+            size = default_pool_size()
+        if size < 1:
+            raise ValueError(f"Worker pool size must be at least 1, got {size}")
+        self._persistent = persistent
+        self._max_rss = max_rss
+        self._max_jobs = max_jobs
+        # cpus are shared between the workers for gmsh threads
+        self._threads = max(1, available_cpus() // size)
+        self._workers = [self._new_worker() for _ in range(size)]
+        self._jobs: list[set[str]] = [set() for _ in range(size)]  # job ids in flight
+        self._owners: dict[str, int] = {}  # job id to worker index
+        # jobs in flight by id, a worker's in queue cannot always be read once it exits
+        self._submitted: dict[str, Job] = {}
+        self._stopping = False
+        self._lock = threading.RLock()
+
+    @property
+    def size(self) -> int:
+        return len(self._workers)
+
+    @property
+    def workers(self) -> list[Worker]:
+        return self._workers
+
+    @property
+    def threads(self) -> int:
+        """gmsh threads of each worker"""
+        return self._threads
+
+    @property
+    def max_rss(self) -> int:
+        """Bytes of memory each worker may use while meshing"""
+        return self._max_rss
+
+    def _new_worker(self) -> Worker:
+        return Worker(self._persistent, self._max_rss, self._threads, self._max_jobs)
+
+    @property
+    def load(self) -> list[int]:
+        """Number of jobs in flight on each worker"""
+        with self._lock:
+            return [len(jobs) for jobs in self._jobs]
+
+    def start(self):
+        self._stopping = False
+        for worker in self._workers:
+            worker.start()
+
+    def stop(self):
+        with self._lock:
+            self._stopping = True
+            for worker in self._workers:
+                worker.stop()
+            for jobs in self._jobs:
+                jobs.clear()
+            self._owners.clear()
+            self._submitted.clear()
+
+    def has_capacity(self, depth: int) -> bool:
+        """True if a running worker has fewer than depth jobs in flight"""
+        with self._lock:
+            return any(
+                worker.is_alive() and len(jobs) < depth
+                for worker, jobs in zip(self._workers, self._jobs)
+            )
+
+    def is_alive(self) -> bool:
+        return any(worker.is_alive() for worker in self._workers)
+
+    def submit(self, job: Job) -> Job:
+        """Submit job to the least loaded running worker"""
+        with self._lock:
+            # a job moved from a crashed worker is no longer tracked there
+            self.finish(job.id)
+            alive = [i for i, worker in enumerate(self._workers) if worker.is_alive()]
+            idx = min(alive or range(self.size), key=lambda i: len(self._jobs[i]))
+            self._jobs[idx].add(job.id)
+            self._owners[job.id] = idx
+            self._submitted[job.id] = job
+            return self._workers[idx].submit(job)
+
+    def outqueue(self, job_id: str) -> Queue | None:
+        """Output queue of the worker running job_id"""
+        with self._lock:
+            if job_id not in self._owners:
+                return None
+            return self._workers[self._owners[job_id]].outqueue
+
+    def finish(self, job_id: str):
+        """Stop tracking a job once its output has been received"""
+        with self._lock:
+            idx = self._owners.pop(job_id, None)
+            self._submitted.pop(job_id, None)
+            if idx is not None:
+                self._jobs[idx].discard(job_id)
+
+    def jobs(self, idx: int) -> set[str]:
+        """Ids of jobs in flight on a worker"""
+        with self._lock:
+            return set(self._jobs[idx])
+
+    def owner(self, job_id: str) -> int | None:
+        """Index of the worker job_id was submitted to"""
+        with self._lock:
+            return self._owners.get(job_id)
+
+    def remove_queued(self, job_id: str) -> bool:
+        """Remove a job which a worker has not started yet
+
+        Returns:
+            True if the job was removed, False if it was not queued
+        """
+        with self._lock:
+            idx = self._owners.get(job_id)
+            if idx is None:
+                return False
+            inqueue = self._workers[idx].inqueue
+            removed = False
+            for item in drain_queue(inqueue):
+                if isinstance(item, Job) and item.id == job_id:
+                    removed = True
+                else:
+                    inqueue.put(item)
+            if removed:
+                self.finish(job_id)
+            return removed
+
+    def recycle(self, idx: int) -> Worker:
+        """Replace a worker which exited to be recycled
+
+        Jobs still queued on the old worker are submitted to its replacement.
+        """
+        with self._lock:
+            if not self._workers[idx].recycling:
+                raise WorkerException(f"Worker {idx} is not being recycled")
+            worker, _ = self._replace(idx)
+            return worker
+
+    def kill(self, idx: int) -> list[Job]:
+        """Terminate a worker, ending the job it is meshing, and replace it
+
+        Jobs in flight on the old worker which it did not finish are submitted to its
+        replacement.
+
+        Returns:
+            outputs put by the old worker which had not been read, other than those of
+            the jobs submitted again
+        """
+        with self._lock:
+            self._workers[idx].terminate()
+            _, outputs = self._replace(idx)
+            return outputs
+
+    def _replace(self, idx: int) -> tuple[Worker, list[Job]]:
+        old = self._workers[idx]
+        old.join(JOIN_TIMEOUT)
+        if old.is_alive():
+            old.kill()
+            old.join()
+        worker = self._new_worker()
+        self._workers[idx] = worker
+        if not self._stopping:
+            worker.start()
+        # a worker which exits or is killed while waiting in inqueue.get() keeps the
+        # queue's read lock, so queued jobs are taken from the pool rather than the
+        # old in queue
+        outputs = [job for job in drain_queue(old.outqueue) if isinstance(job, Job)]
+        finished = {job.id for job in outputs if job.status in FINISHED}
+        resubmitted = self._jobs[idx] - finished
+        for job_id in resubmitted:
+            worker.submit(self._submitted[job_id])
+        return worker, [job for job in outputs if job.id not in resubmitted]
+
+    def recover(self) -> list[tuple[Worker, set[str]]]:
+        """Replace crashed workers
+
+        Returns:
+            list of (replacement worker, ids of jobs which were on the crashed worker)
+        """
+        recovered = []
+        with self._lock:
+            if self._stopping:
+                return recovered
+            for idx, worker in enumerate(self._workers):
+                # recycled workers are replaced once their outputs have been read
+                if worker.is_alive() or worker.recycling:
+                    continue
+                # outputs left on the crashed worker's queue are never read
+                remove_worker_meshes(worker.pid)
+                worker = self._new_worker()
+                self._workers[idx] = worker
+                worker.start()
+                # jobs keep their owner so outputs are read from the replacement queue
+                recovered.append((worker, set(self._jobs[idx])))
+        return recovered
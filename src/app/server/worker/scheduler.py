@@ -0,0 +1,119 @@
+"""Order jobs waiting for a worker
+
+Jobs are held here until a worker is free rather than queued on the workers, so the
+order they are meshed in can be chosen:
+
+1. Interactive jobs are meshed before bulk jobs
+2. Within a priority class, clients take turns in proportion to the predicted cost of
+   the jobs already meshed for them, so one large batch does not block other clients
+3. Each client's jobs are meshed shortest predicted job first
+"""
+from enum import IntEnum
+import heapq
+import itertools
+import threading
+
+from .jobs.job import Job
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BULK = 1
+
+
+class Scheduler:
+    def __init__(self):
+        # priority to client to heap of (cost, sequence, job id)
+        self._queues: dict[Priority, dict[str, list[tuple[float, int, str]]]] = {
+            priority: {} for priority in Priority
+        }
+        self._jobs: dict[str, Job] = {}
+        # job id to the priority and client it is waiting under
+        self._placement: dict[str, tuple[Priority, str]] = {}
+        # waiting client to cost of its jobs scheduled, dropped once it stops waiting
+        self._served: dict[str, float] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def __contains__(self, job_id: str) -> bool:
+        with self._lock:
+            return job_id in self._jobs
+
+    def push(
+        self,
+        job: Job,
+        priority: Priority = Priority.INTERACTIVE,
+        client: str = "",
+        cost: float = 1.0,
+    ):
+        with self._lock:
+            clients = self._queues[priority]
+            if client not in self._served or not self._is_waiting(client):
+                # a client that starts waiting joins level with the waiting clients
+                # rather than being owed for the time it was idle
+                self._served[client] = max(
+                    self._served.get(client, 0.0), self._least_served()
+                )
+            heapq.heappush(
+                clients.setdefault(client, []), (cost, next(self._sequence), job.id)
+            )
+            self._jobs[job.id] = job
+            self._placement[job.id] = (priority, client)
+
+    def pop(self) -> Job | None:
+        """Next job to mesh, None if no jobs are waiting"""
+        with self._lock:
+            for priority in Priority:
+                clients = self._queues[priority]
+                if clients:
+                    client = min(
+                        clients, key=lambda c: (self._served[c], clients[c][0])
+                    )
+                    cost, _, job_id = heapq.heappop(clients[client])
+                    if not clients[client]:
+                        del clients[client]
+                    del self._placement[job_id]
+                    self._served[client] += cost
+                    self._forget(client)
+                    return self._jobs.pop(job_id)
+            return None
+
+    def remove(self, job_id: str) -> bool:
+        """Remove a waiting job
+
+        Returns:
+            True if the job was waiting
+        """
+        with self._lock:
+            if self._jobs.pop(job_id, None) is None:
+                return False
+            priority, client = self._placement.pop(job_id)
+            clients = self._queues[priority]
+            queue = [entry for entry in clients[client] if entry[2] != job_id]
+            if queue:
+                heapq.heapify(queue)
+                clients[client] = queue
+            else:
+                del clients[client]
+            self._forget(client)
+            return True
+
+    def _forget(self, client: str):
+        # a client which returns is levelled with the waiting clients by push
+        if not self._is_waiting(client):
+            del self._served[client]
+
+    def _is_waiting(self, client: str) -> bool:
+        return any(client in clients for clients in self._queues.values())
+
+    def _least_served(self) -> float:
+        waiting = [
+            self._served[client]
+            for clients in self._queues.values()
+            for client in clients
+        ]
+        return min(waiting, default=0.0)
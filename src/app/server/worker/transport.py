@@ -0,0 +1,81 @@
+"""Hand finished meshes from worker processes to the API process
+
+Putting a mesh on a queue pickles every value through a pipe. Instead the worker writes
+the mesh in the binary container format to a file in shared memory and puts a small
+SharedMesh descriptor on its out queue. The API process maps the file and decodes the
+arrays as views of the mapping, the file is removed as soon as it is mapped and the
+memory is returned once the last array is released.
+"""
+import glob
+import mmap
+import os
+import tempfile
+from typing import NamedTuple
+
+from ...converters.binary import decode_dash_vtk, encode_dash_vtk
+from ...interfaces import DashVtkModel, NpDashVtkModel
+
+# memory backed on linux, otherwise a regular file which the os will mostly cache
+SHARED_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+PREFIX = "joint-model-mesh"
+
+
+class SharedMesh(NamedTuple):
+    path: str
+    size: int  # bytes
+
+
+def _shared_path(job_id: str, pid: int | str) -> str:
+    return os.path.join(SHARED_DIR, f"{PREFIX}-{pid}-{job_id}")
+
+
+def share_mesh(job_id: str, model: DashVtkModel | NpDashVtkModel) -> SharedMesh:
+    """Write a mesh to shared memory
+
+    Returns:
+        descriptor to put on a queue in place of the mesh
+    """
+    path = _shared_path(job_id, os.getpid())
+    size = 0
+    try:
+        with open(path, "wb") as file:
+            for section in encode_dash_vtk(model):
+                size += file.write(section)
+    except BaseException:
+        discard_mesh(SharedMesh(path, size))
+        raise
+    return SharedMesh(path, size)
+
+
+def attach_mesh(shared: SharedMesh) -> NpDashVtkModel:
+    """Map a shared mesh into this process
+
+    The arrays are read only views of the mapping, the shared file is removed.
+
+    Raises:
+        OSError if the mesh cannot be mapped
+        DashVtkFormatError if the mesh is incomplete
+    """
+    try:
+        with open(shared.path, "rb") as file:
+            # the mapping stays valid once the file is closed and removed
+            buffer = mmap.mmap(file.fileno(), shared.size, access=mmap.ACCESS_READ)
+    finally:
+        discard_mesh(shared)
+    return decode_dash_vtk(buffer)
+
+
+def discard_mesh(shared: SharedMesh):
+    """Remove a shared mesh which will not be attached"""
+    try:
+        os.remove(shared.path)
+    except FileNotFoundError:
+        pass
+
+
+def remove_worker_meshes(pid: int | None):
+    """Remove meshes left by a worker process which was stopped or killed"""
+    if pid is None:
+        return
+    for path in glob.glob(_shared_path("*", pid)):
+        discard_mesh(SharedMesh(path, 0))
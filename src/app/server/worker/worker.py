@@ -1,9 +1,18 @@
 from multiprocessing import Queue, Event, RLock, Condition, Process
+import os
+import queue
+import threading
+from typing import Callable
 
 from .jobs.job import Job, JobStatus
-from ...converters.model import convert_model_to_dash_vtk
+from .transport import SharedMesh, discard_mesh, share_mesh
+from ...converters.model import convert_model_to_np_dash_vtk
+from ...modelling.mesher.session import MAX_SESSION_JOBS, GmshSession, process_rss
 
 SENTINEL = "STOP"
+RECYCLE = "RECYCLE"  # put on the out queue before a worker exits to be recycled
+MAX_WORKER_RSS = 4 * 1024**3  # bytes of resident memory allowed while meshing
+WATCH_INTERVAL = 0.1  # seconds between memory checks
 DELAY = 5  # ms
 
 
@@ -11,15 +20,67 @@ class WorkerException(Exception):
     pass
 
 
+class MemoryWatchdog(threading.Thread):
+    """Call on_exceeded if the process uses more than limit bytes
+
+    gmsh releases the GIL while meshing so the watchdog keeps running.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        on_exceeded: Callable[[int], None],
+        interval: float = WATCH_INTERVAL,
+    ):
+        super(MemoryWatchdog, self).__init__(daemon=True)
+        self._limit = limit
+        self._on_exceeded = on_exceeded
+        self._interval = interval
+        self._stop_event = threading.Event()
+
+    def __enter__(self) -> "MemoryWatchdog":
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop_event.set()
+        self.join()
+
+    def run(self):
+        while not self._stop_event.wait(self._interval):
+            rss = process_rss()
+            if rss > self._limit:
+                self._on_exceeded(rss)
+                return
+
+
 class Worker(Process):
-    def __init__(self):
+    """Process meshing jobs from inqueue
+
+    With persistent set gmsh is initialized once for the process rather than for
+    each job, the process exits after putting RECYCLE on the out queue once the
+    session has meshed too many jobs or uses too much memory.
+    """
+
+    def __init__(
+        self,
+        persistent: bool = True,
+        max_rss: int = MAX_WORKER_RSS,
+        threads: int | None = None,
+        max_jobs: int = MAX_SESSION_JOBS,
+    ):
         super(Worker, self).__init__()
-        if not hasattr(self, "_inqueue"):
-            self._inqueue = Queue()
-            self._outqueue = Queue()
-            self._stop_event = Event()
-            self._lock = RLock()
-            self._notify = Condition()
+        self._inqueue = Queue()
+        self._outqueue = Queue()
+        self._stop_event = Event()
+        self._recycle_event = Event()
+        self._lock = RLock()
+        self._notify = Condition()
+        self._persistent = persistent
+        self._max_rss = max_rss
+        # gmsh threads for jobs which do not set them
+        self._threads = threads
+        self._max_jobs = max_jobs
 
     @property
     def inqueue(self):
@@ -29,6 +90,11 @@ class Worker(Process):
     def outqueue(self):
         return self._outqueue
 
+    @property
+    def recycling(self) -> bool:
+        """True once the worker has chosen to exit so it can be replaced"""
+        return self._recycle_event.is_set()
+
     def submit(self, job: Job) -> Job:
         with self._lock:
             job.status = JobStatus.SUBMITTED
@@ -47,14 +113,47 @@ class Worker(Process):
         with self._lock:
             if not self._stop_event.is_set():
                 self._stop_event.set()
-            while self.inqueue.qsize() > 0:
-                self.inqueue.get_nowait()
+            self._drain(self.inqueue)
             self.inqueue.put(SENTINEL)
-            while self.outqueue.qsize() > 0:
-                self.outqueue.get_nowait()
+            self._drain(self.outqueue)
             self.terminate()
 
+    @staticmethod
+    def _drain(items: Queue):
+        # qsize can count items which are not yet readable
+        while items.qsize() > 0:
+            try:
+                item = items.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, Job) and isinstance(item.mesh, SharedMesh):
+                discard_mesh(item.mesh)
+
     def run(self):
+        session = GmshSession(self._max_jobs) if self._persistent else None
+        if session is not None:
+            session.start()
+        try:
+            self._run(session)
+        finally:
+            if session is not None:
+                session.stop()
+
+    def _fail_on_memory(self, job: Job, rss: int):
+        """Fail job and exit so the memory is returned, the worker is recycled"""
+        job.error = (
+            f"Job used {rss / 1024**2:.0f} MB which is more than the worker limit "
+            f"of {self._max_rss / 1024**2:.0f} MB"
+        )
+        self._recycle_event.set()
+        self.outqueue.put(job)
+        self.outqueue.put(RECYCLE)
+        # flush the queue since os._exit skips the normal shutdown
+        self.outqueue.close()
+        self.outqueue.join_thread()
+        os._exit(1)
+
+    def _run(self, session: GmshSession | None):
         while True:
             if self._stop_event.is_set():
                 break
@@ -77,13 +176,30 @@ class Worker(Process):
                 continue
 
             try:
-                # flag to runner that job has started
+                # flag to dispatcher that job has started
                 job.status = JobStatus.RUNNING
-                self.outqueue.put(job)
+                # queues pickle in a background thread so put a copy which is not
+                # changed by the meshing below
+                self.outqueue.put(job.snapshot())
+                specs = job.specs
+                if specs.threads is None and self._threads is not None:
+                    specs = specs.copy(update={"threads": self._threads})
                 # do meshing
-                job.mesh = convert_model_to_dash_vtk(job.data)
+                with MemoryWatchdog(
+                    self._max_rss, lambda rss: self._fail_on_memory(job, rss)
+                ):
+                    # only a descriptor of the shared mesh is pickled onto the queue
+                    job.mesh = share_mesh(
+                        job.id,
+                        convert_model_to_np_dash_vtk(job.data, specs, session),
+                    )
                 job.status = JobStatus.COMPLETE
             except Exception as e:
                 job.error = str(e)
                 job.status = JobStatus.ERROR
             self.outqueue.put(job)
+
+            if session is not None and session.should_recycle():
+                self._recycle_event.set()
+                self.outqueue.put(RECYCLE)
+                break
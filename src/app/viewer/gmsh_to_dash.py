@@ -1,9 +1,9 @@
 import dash_vtk
 
-from ..interfaces import DashVtkModel
+from ..interfaces import DashVtkModel, NpDashVtkModel
 
 
-def vtk_to_dash(model: DashVtkModel) -> dash_vtk.PolyData:
+def vtk_to_dash(model: DashVtkModel | NpDashVtkModel) -> dash_vtk.PolyData:
     return dash_vtk.PolyData(
         points=model.mesh.points,
         lines=model.mesh.lines,
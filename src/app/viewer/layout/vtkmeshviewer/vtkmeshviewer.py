@@ -9,7 +9,7 @@ from ..ids import Ids
 from ..toast import make_toast
 from ...gmsh_to_dash import vtk_to_dash
 from ...requests.exceptions import MeshApiHttpError
-from ...requests.requests import monitor_job, submit_job, get_mesh
+from ...requests.requests import get_mesh, submit_job, wait_job
 from ....interfaces import Model
 from ....interfaces.validation import validate_and_convert_json
 from ....server.worker.jobs.interfaces import MeshJob
@@ -23,6 +23,10 @@ LOADING_STYLE = {
     "display": "none",
     "background": "white",
 }
+MONITOR_INTERVAL = 1000  # ms between requests for the status of a job
+# seconds each request waits for the job to finish, less than the interval so the
+# requests of one viewer do not overlap
+WAIT_TIMEOUT = 0.8 * MONITOR_INTERVAL / 1000
 
 
 class VtkMeshViewerAIO(html.Div):
@@ -54,7 +58,9 @@ class VtkMeshViewerAIO(html.Div):
             children
             + [  # Equivalent to `html.Div([...])`
                 dcc.Interval(
-                    id=self.ids.interval(aio_id), interval=1000, max_intervals=0
+                    id=self.ids.interval(aio_id),
+                    interval=MONITOR_INTERVAL,
+                    max_intervals=0,
                 ),
                 make_toast(id=self.ids.submittoast(aio_id), header="Job submission"),
                 make_toast(id=self.ids.monitortoast(aio_id), header="Job monitor"),
@@ -153,6 +159,22 @@ class VtkMeshViewerAIO(html.Div):
                 "danger",
                 10000,
             )
+        if job.status == JobStatus.EXPIRED:
+            return (
+                no_update,
+                True,
+                f"Job {job.id} has expired, please try re-submitting",
+                "danger",
+                10000,
+            )
+        if job.status in [JobStatus.CANCELLED, JobStatus.TIMEOUT]:
+            return (
+                no_update,
+                True,
+                f"Job {job.id} was stopped with status {job.status.value}",
+                "danger",
+                10000,
+            )
         return no_update
 
     @callback(
@@ -168,7 +190,8 @@ class VtkMeshViewerAIO(html.Div):
             return no_update
         job = MeshJob(**job)
         try:
-            job: MeshJob = asyncio.run(monitor_job(job))
+            # returns as soon as the job finishes rather than at the next interval
+            job: MeshJob = asyncio.run(wait_job(job, WAIT_TIMEOUT))
             return job.dict(), no_update, no_update
         except MeshApiHttpError as e:
             return no_update, True, e.toast_message
@@ -212,7 +235,14 @@ class VtkMeshViewerAIO(html.Div):
         if job is None:
             return no_update
         job = MeshJob(**job)
-        if job.status in [JobStatus.COMPLETE, JobStatus.ERROR, JobStatus.NOTFOUND]:
+        if job.status in [
+            JobStatus.COMPLETE,
+            JobStatus.ERROR,
+            JobStatus.NOTFOUND,
+            JobStatus.EXPIRED,
+            JobStatus.CANCELLED,
+            JobStatus.TIMEOUT,
+        ]:
             LOADING_STYLE["display"] = "none"
             return 0, LOADING_STYLE, job.dict()
         else:
@@ -1,4 +1,3 @@
-import io
 import json
 import os
 import requests
@@ -6,7 +5,8 @@ import requests
 from app.server.worker.jobs.interfaces import MeshJob
 
 from .exceptions import MeshApiHttpError
-from ...interfaces import Model, DashVtkModel
+from ...converters.binary import MEDIA_TYPE as BINARY_MEDIA_TYPE, decode_dash_vtk
+from ...interfaces import Model, DashVtkModel, NpDashVtkModel
 from ...interfaces.validation import validate_and_convert_json
 from ...constants import RESTAPI_URL
 from ...server.worker.jobs.interfaces import MeshJob
@@ -51,18 +51,37 @@ async def monitor_job(job: MeshJob) -> MeshJob:
     return MeshJob(**json.loads(job_str))
 
 
-async def get_mesh(job: MeshJob) -> DashVtkModel:
+async def wait_job(job: MeshJob, timeout: float) -> MeshJob:
+    """Gets the status of a job once it has finished or after timeout seconds"""
+    url = _get_url()
+    with requests.get(
+        f"{url}/meshmodel/wait/{job.id}", params={"timeout": timeout}
+    ) as r:
+        try:
+            r.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            raise MeshApiHttpError(r)
+        job_str = r.content.decode("utf-8")
+    return MeshJob(**json.loads(job_str))
+
+
+async def get_mesh(job: MeshJob) -> DashVtkModel | NpDashVtkModel:
     """Gets the mesh from a server hosting Joint Mesh FastAPI
 
-    Uses environment variable VTK_MESHER_URL to make request.
+    Uses environment variable VTK_MESHER_URL to make request. The binary mesh format
+    is requested and decoded into numpy arrays without copying, json is used as a
+    fallback if the server does not support it.
 
     Returns:
-        DashVtkModel returned from response
+        NpDashVtkModel (or DashVtkModel for json responses) returned from response
     """
     # os.environ[RESTAPI_URL] = "http://127.0.0.1:8000"
     url = _get_url()
-    out = io.BytesIO()
-    with requests.get(f"{url}/meshmodel/mesh/{job.id}", stream=True) as r:
+    out = bytearray()
+    headers = {"Accept": f"{BINARY_MEDIA_TYPE}, application/json;q=0.9"}
+    with requests.get(
+        f"{url}/meshmodel/mesh/{job.id}", headers=headers, stream=True
+    ) as r:
         try:
             r.raise_for_status()
         except requests.exceptions.HTTPError as e:
@@ -72,8 +91,10 @@ async def get_mesh(job: MeshJob) -> DashVtkModel:
             # If you have chunk encoded response uncomment if
             # and set chunk_size parameter to None.
             # if chunk:
-            out.write(chunk)
-    out.seek(0)
+            out += chunk
+        content_type = r.headers.get("content-type", "")
 
-    json_out = json.loads(out.read().decode("utf-8"))
+    if content_type.startswith(BINARY_MEDIA_TYPE):
+        return decode_dash_vtk(out)
+    json_out = json.loads(out.decode("utf-8"))
     return DashVtkModel.parse_obj(json_out)
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+import struct
+import sys
+
+sys.path.append("src")
+
+from app.converters.binary import (
+    DashVtkFormatError,
+    HEADER_FORMAT,
+    decode_dash_vtk,
+    encode_dash_vtk,
+    iter_dash_vtk,
+)
+from app.interfaces import *
+from app.interfaces.mapper import map_to_np
+
+
+@pytest.fixture
+def model() -> DashVtkModel:
+    return DashVtkModel(
+        name="Two quads",
+        mesh=DashVtkMesh(
+            points=[0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0, 2.0, 0.5, 0.1],
+            polys=[4, 0, 1, 2, 3, 3, 1, 4, 2],
+            lines=[5, 0, 1, 2, 3, 0, 4, 1, 4, 2, 1],
+        ),
+    )
+
+
+def _encode(model) -> bytes:
+    return b"".join(bytes(section) for section in encode_dash_vtk(model))
+
+
+class TestBinaryDashVtk:
+    def test_round_trip(self, model: DashVtkModel):
+        decoded = decode_dash_vtk(_encode(model))
+        assert isinstance(decoded, NpDashVtkModel)
+        assert decoded.name == model.name
+        assert decoded.mesh.points.tolist() == model.mesh.points
+        assert decoded.mesh.polys.tolist() == model.mesh.polys
+        assert decoded.mesh.lines.tolist() == model.mesh.lines
+
+    def test_round_trip_numpy_model(self, model: DashVtkModel):
+        decoded = decode_dash_vtk(_encode(map_to_np(model)))
+        assert decoded.mesh.points.tolist() == model.mesh.points
+
+    def test_decode_is_zero_copy(self, model: DashVtkModel):
+        buffer = bytearray(_encode(model))
+        decoded = decode_dash_vtk(buffer)
+        assert not decoded.mesh.points.flags.owndata
+        # changes to the buffer are visible through the decoded arrays
+        offset = len(buffer) - decoded.mesh.lines.nbytes
+        buffer[offset : offset + 4] = struct.pack("<i", 42)
+        assert decoded.mesh.lines[0] == 42
+
+    def test_little_endian_int32_indices(self, model: DashVtkModel):
+        decoded = decode_dash_vtk(_encode(model))
+        assert decoded.mesh.points.dtype == np.dtype("<f8")
+        assert decoded.mesh.polys.dtype == np.dtype("<i4")
+
+    def test_large_indices_use_int64(self, model: DashVtkModel):
+        model.mesh.polys[1] = 2**31
+        decoded = decode_dash_vtk(_encode(model))
+        assert decoded.mesh.polys.dtype == np.dtype("<i8")
+        assert decoded.mesh.polys[1] == 2**31
+
+    def test_chunks(self, model: DashVtkModel):
+        chunks = list(iter_dash_vtk(model, chunk_size=16))
+        assert all(len(chunk) <= 16 for chunk in chunks)
+        assert b"".join(chunks) == _encode(model)
+
+    def test_empty_mesh(self):
+        empty = DashVtkModel(name="", mesh=DashVtkMesh(points=[], polys=[], lines=[]))
+        decoded = decode_dash_vtk(_encode(empty))
+        assert decoded.mesh.points.size == 0
+
+    def test_bad_magic(self, model: DashVtkModel):
+        buffer = bytearray(_encode(model))
+        buffer[:4] = b"JSON"
+        with pytest.raises(DashVtkFormatError):
+            decode_dash_vtk(buffer)
+
+    def test_truncated(self, model: DashVtkModel):
+        with pytest.raises(DashVtkFormatError):
+            decode_dash_vtk(_encode(model)[:-1])
+        with pytest.raises(DashVtkFormatError):
+            decode_dash_vtk(_encode(model)[: struct.calcsize(HEADER_FORMAT) - 1])
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import sys
 
@@ -23,3 +24,28 @@ class TestMeshToDashVtk:
 
         assert isinstance(dash_data, DashVtkMesh)
         assert dash_data == DashVtkMesh.parse_obj(dash_data.dict())
+
+    def test_mesh_to_dash_vtk_matches_per_element(self, mesh_specs):
+        model = EXAMPLE_MODELS["TJoint"]
+        with mesh_model(model, mesh_specs) as mesh:
+            dash_data = mesh_to_dash_vtk(mesh, ElementType.QUADRANGLE)
+            elementType = mesh.getElementType(ElementType.QUADRANGLE.value, 1)
+            elementTags, _ = mesh.getElementsByType(elementType)
+            # reference conversion using per element / per node lookups
+            nid2pointidx = {}
+            points, polys, lines = [], [], []
+            for element in elementTags:
+                node_ids = mesh.getElement(element)[1]
+                poly = [len(node_ids)]
+                for nid in node_ids:
+                    if nid not in nid2pointidx:
+                        coords = mesh.getNode(nid)[0]
+                        points += coords.tolist()
+                        nid2pointidx[nid] = len(points) // 3 - 1
+                    poly.append(nid2pointidx[nid])
+                polys += poly
+                lines += [poly[0] + 1] + poly[1:] + [poly[1]]
+
+        assert dash_data.polys == polys
+        assert dash_data.lines == lines
+        assert np.allclose(dash_data.points, points)
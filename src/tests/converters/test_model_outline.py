@@ -0,0 +1,32 @@
+import numpy as np
+import sys
+
+sys.path.append("src")
+
+from app.interfaces import *
+from app.converters.outline import convert_model_to_outline, convert_models_to_outlines
+from app.modelling.geometry.outline import joint_outline
+from app.interfaces.examples.joints import EXAMPLE_MODELS
+
+
+class TestConvertModelToOutline:
+    def test_convert_model_to_outline(self):
+        model = EXAMPLE_MODELS["KJoint"]
+        outline = convert_model_to_outline(model)
+        assert isinstance(outline, ModelOutline)
+        assert outline == ModelOutline.parse_obj(outline.dict())
+        expected = joint_outline(model.joint)
+        assert [slave.name for slave in outline.slaves] == list(expected)
+        for slave in outline.slaves:
+            np.testing.assert_array_equal(
+                np.array(slave.weld).reshape(-1, 3), expected[slave.name].weld
+            )
+            np.testing.assert_array_equal(
+                np.array(slave.hole).reshape(-1, 3), expected[slave.name].hole
+            )
+
+    def test_convert_models_to_outlines(self):
+        models = list(EXAMPLE_MODELS.values())
+        outlines = convert_models_to_outlines(models)
+        assert [outline.name for outline in outlines] == [m.name for m in models]
+        assert outlines[0] == convert_model_to_outline(models[0])
@@ -0,0 +1,96 @@
+import gzip
+import json
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.converters import stream
+from app.converters.encoder import NpEncoder
+from app.converters.stream import (
+    BROTLI,
+    GZIP,
+    accepted_encoding,
+    compress_chunks,
+    iter_dash_vtk_json,
+)
+from app.interfaces import *
+from app.interfaces.mapper import map_to_np
+
+
+@pytest.fixture
+def model() -> DashVtkModel:
+    return DashVtkModel(
+        name="Two quads",
+        mesh=DashVtkMesh(
+            points=[0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.1, 2.0, 0.5, 0.1],
+            polys=[4, 0, 1, 2, 3, 3, 1, 4, 2],
+            lines=[5, 0, 1, 2, 3, 0, 4, 1, 4, 2, 1],
+        ),
+    )
+
+
+class TestIterDashVtkJson:
+    @pytest.mark.parametrize("chunk_items", [1, 4, 1000])
+    def test_matches_json_dumps(self, model: DashVtkModel, chunk_items: int):
+        encoded = b"".join(iter_dash_vtk_json(model, chunk_items))
+        assert encoded.decode("utf-8") == json.dumps(model.dict())
+
+    def test_numpy_model(self, model: DashVtkModel):
+        encoded = b"".join(iter_dash_vtk_json(map_to_np(model), 4))
+        assert encoded.decode("utf-8") == json.dumps(model.dict(), cls=NpEncoder)
+
+    def test_empty_arrays(self):
+        model = DashVtkModel(
+            name="Empty", mesh=DashVtkMesh(points=[], polys=[], lines=[])
+        )
+        encoded = b"".join(iter_dash_vtk_json(model))
+        assert json.loads(encoded) == model.dict()
+
+    def test_chunks_are_bounded(self, model: DashVtkModel):
+        chunks = list(iter_dash_vtk_json(model, 2))
+        assert max(len(chunk) for chunk in chunks) < 40
+
+
+class TestCompression:
+    def test_no_compression(self, model: DashVtkModel):
+        chunks = list(iter_dash_vtk_json(model))
+        assert list(compress_chunks(chunks, None)) == chunks
+
+    def test_gzip(self, model: DashVtkModel):
+        compressed = b"".join(compress_chunks(iter_dash_vtk_json(model, 2), GZIP))
+        assert json.loads(gzip.decompress(compressed)) == model.dict()
+
+    def test_gzip_chunks_decode_as_they_arrive(self, model: DashVtkModel):
+        first = next(compress_chunks(iter_dash_vtk_json(model), GZIP))
+        decompressor = gzip.zlib.decompressobj(16 + gzip.zlib.MAX_WBITS)
+        assert decompressor.decompress(first) == b'{"name": "Two quads", "mesh": {'
+
+    def test_brotli(self, model: DashVtkModel):
+        brotli = pytest.importorskip("brotli")
+        compressed = b"".join(compress_chunks(iter_dash_vtk_json(model, 2), BROTLI))
+        assert json.loads(brotli.decompress(compressed)) == model.dict()
+
+    def test_unsupported_encoding(self, model: DashVtkModel):
+        with pytest.raises(ValueError):
+            list(compress_chunks(iter_dash_vtk_json(model), "compress"))
+
+
+class TestAcceptedEncoding:
+    @pytest.mark.parametrize("header", [None, "", "identity", "gzip;q=0", "deflate"])
+    def test_uncompressed(self, header):
+        assert accepted_encoding(header) is None
+
+    def test_gzip(self, monkeypatch):
+        monkeypatch.setattr(stream, "brotli", None)
+        assert accepted_encoding("gzip, deflate, br") == GZIP
+
+    def test_prefers_brotli(self):
+        pytest.importorskip("brotli")
+        assert accepted_encoding("gzip, deflate, br") == BROTLI
+        assert accepted_encoding("gzip;q=1.0, br;q=0.5") == GZIP
+
+    def test_wildcard(self, monkeypatch):
+        monkeypatch.setattr(stream, "brotli", None)
+        assert accepted_encoding("*") == GZIP
+        assert accepted_encoding("gzip;q=0, *") is None
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.modelling.geometry.context import GeometryContext, pair_geometry
+from app.modelling.geometry.intersections import flat_tube_intersection
+from app.modelling.geometry.weld import get_weld_intersect_array
+from app.interfaces import *
+from app.interfaces.mapper import map_to_np
+
+
+@pytest.fixture
+def master():
+    return map_to_np(
+        Tubular(
+            name="master",
+            axis=Axis3D(point=Point3D(x=0, y=0, z=-2), vector=Vector3D(x=0, y=0, z=4)),
+            diameter=2.0,
+        )
+    )
+
+
+@pytest.fixture
+def slave():
+    return map_to_np(
+        Tubular(
+            name="slave",
+            axis=Axis3D(
+                point=Point3D(x=1.0, y=0.5, z=0.2), vector=Vector3D(x=4.0, y=1.0, z=2.0)
+            ),
+            diameter=0.8,
+        )
+    )
+
+
+class TestGeometryContext:
+    def test_pair_computed_once(self, master, slave):
+        context = GeometryContext()
+        first = context.pair(master, slave)
+        second = context.pair(master, slave)
+        assert first is second
+        assert context.stats == {"pairs": 1, "hits": 1, "misses": 1}
+
+    def test_moved_slave_is_new_pair(self, master, slave):
+        context = GeometryContext()
+        context.pair(master, slave)
+        moved = slave.copy(deep=True)
+        moved.axis.point.array = moved.axis.point.array + np.array([0.0, 0.0, 0.5])
+        context.pair(master, moved)
+        assert context.stats["pairs"] == 2
+
+    def test_flat_intersect(self, master, slave):
+        expected = flat_tube_intersection(master, slave)
+        np.testing.assert_array_equal(
+            pair_geometry(master, slave).flat_intersect, expected
+        )
+
+    def test_read_only(self, master, slave):
+        pair = pair_geometry(master, slave)
+        with pytest.raises(ValueError):
+            pair.intersect[0] = 0.0
+        with pytest.raises(ValueError):
+            pair.flat_intersect[0] = 0.0
+
+    def test_weld_unchanged(self, master, slave):
+        context = GeometryContext()
+        expected = get_weld_intersect_array(master, slave)
+        np.testing.assert_array_equal(
+            get_weld_intersect_array(master, slave, context=context), expected
+        )
+        np.testing.assert_array_equal(
+            get_weld_intersect_array(master, slave, context=context), expected
+        )
+        assert context.stats["misses"] == 1
@@ -6,9 +6,17 @@ import sys
 
 sys.path.append("src")
 
-from app.modelling.geometry.intersections import intersection, arc_angle_signed
+from app.modelling.geometry.intersections import (
+    intersection,
+    arc_angle_signed,
+    circle_intersect,
+    flat_tube_intersection,
+    IntersectionError,
+    NpCircle,
+)
 from app.interfaces import *
 from app.interfaces.mapper import map_to_np
+from app.interfaces.examples.joints import EXAMPLE_MODELS
 
 
 @pytest.fixture
@@ -38,6 +46,11 @@ def circle(master):
     return sympy.Circle(master.axis.point.array[:2], master.diameter / 2.0)
 
 
+@pytest.fixture
+def npcircle(master):
+    return NpCircle(master.axis.point.array[:2], master.diameter / 2.0)
+
+
 class TestIntersections:
     """
             |
@@ -121,3 +134,69 @@ class TestArcAngleSigned:
         )
         assert abs(angle) - math.pi / 4 < 1e-12
         assert angle < 0
+
+    def test_npcircle_matches_sympy(self, circle, npcircle):
+        for target in np.linspace(-math.pi, math.pi, 13):
+            point = np.array([math.cos(target), math.sin(target), 0.0])
+            expected = float(arc_angle_signed(circle, point))
+            assert math.isclose(arc_angle_signed(npcircle, point), expected, abs_tol=1e-12)
+
+
+def _slave_pairs():
+    for name, model in EXAMPLE_MODELS.items():
+        for slave in model.joint.slaves:
+            yield pytest.param(model.joint.master, slave, id=f"{name}-{slave.name}")
+
+
+class TestSympyParity:
+    @pytest.mark.parametrize("master,slave", _slave_pairs())
+    def test_intersection(self, master: Tubular, slave: Tubular):
+        expected = intersection(map_to_np(master), map_to_np(slave), use_sympy=True)
+        got = intersection(map_to_np(master), map_to_np(slave))
+        assert got.dtype == np.float64
+        assert np.allclose(got, expected, rtol=0.0, atol=1e-12)
+
+    @pytest.mark.parametrize("master,slave", _slave_pairs())
+    def test_flat_tube_intersection(self, master: Tubular, slave: Tubular):
+        expected = flat_tube_intersection(
+            map_to_np(master), map_to_np(slave), use_sympy=True
+        )
+        got = flat_tube_intersection(map_to_np(master), map_to_np(slave))
+        assert np.allclose(got, expected, rtol=0.0, atol=1e-12)
+
+    @pytest.mark.parametrize("master,slave", _slave_pairs())
+    def test_circle_intersect(self, master: Tubular, slave: Tubular):
+        npmaster, npslave = map_to_np(master), map_to_np(slave)
+        args = (
+            npmaster.axis.point.array,
+            npmaster.diameter,
+            npslave.axis.point.array,
+            npslave.axis.vector.array,
+        )
+        expected = circle_intersect(*args, use_sympy=True)
+        got = circle_intersect(*args)
+        assert got.shape == expected.shape
+        assert np.allclose(got, expected, rtol=0.0, atol=1e-12)
+
+    def test_circle_intersect_miss(self):
+        args = (np.zeros(3), 1.0, np.array([2.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]))
+        assert len(circle_intersect(*args, use_sympy=True)) == 0
+        assert len(circle_intersect(*args)) == 0
+
+    def test_circle_intersect_tangent(self):
+        args = (np.zeros(3), 2.0, np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]))
+        expected = circle_intersect(*args, use_sympy=True)
+        got = circle_intersect(*args)
+        assert got.shape == expected.shape == (1, 2)
+        assert np.allclose(got, expected)
+
+    def test_no_intersection_raises(self, master: NpTubular, slave: NpTubular):
+        slave.axis.point.array = np.array([5.0, 0.0, 0.0])
+        for use_sympy in [True, False]:
+            with pytest.raises(IntersectionError):
+                intersection(master, slave, use_sympy=use_sympy)
+
+    def test_vertical_slave_raises(self, master: NpTubular, slave: NpTubular):
+        slave.axis.vector.array = np.array([0.0, 0.0, 1.0])
+        with pytest.raises(IntersectionError):
+            intersection(master, slave)
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+import subprocess
+import sys
+
+sys.path.append("src")
+
+from app.modelling.geometry.intersections import (
+    IntersectionError,
+    flat_tube_intersection,
+    intersection,
+)
+from app.modelling.geometry.outline import (
+    joint_outline,
+    joint_outlines,
+    pair_outlines,
+)
+from app.modelling.geometry.weld import get_weld_intersect_array
+from app.interfaces import *
+from app.interfaces.examples.joints import EXAMPLE_MODELS
+from app.interfaces.mapper import map_to_np
+
+
+def random_slave(rng, i) -> Tubular:
+    angle = rng.uniform(0, 2 * np.pi)
+    x, y = 2 * np.cos(angle), 2 * np.sin(angle)
+    return Tubular(
+        name=f"slave{i}",
+        axis=Axis3D(
+            point=Point3D(x=x, y=y, z=rng.uniform(-1, 1)),
+            vector=Vector3D(
+                x=x + rng.uniform(-0.1, 0.1),
+                y=y + rng.uniform(-0.1, 0.1),
+                z=rng.uniform(-1, 1),
+            ),
+        ),
+        diameter=rng.uniform(0.05, 0.25),
+    )
+
+
+@pytest.fixture
+def joint():
+    return EXAMPLE_MODELS["KJoint"].joint
+
+
+class TestOutline:
+    @pytest.mark.parametrize("modelname", list(EXAMPLE_MODELS))
+    def test_matches_weld(self, modelname):
+        joint = EXAMPLE_MODELS[modelname].joint
+        outlines = joint_outline(joint)
+        npmaster = map_to_np(joint.master)
+        for slave in joint.slaves:
+            npslave = map_to_np(slave)
+            outline = outlines[slave.name]
+            np.testing.assert_allclose(
+                outline.intersect, intersection(npmaster, npslave), atol=1e-12
+            )
+            np.testing.assert_allclose(
+                outline.flat_intersect,
+                flat_tube_intersection(npmaster, npslave),
+                atol=1e-12,
+            )
+            np.testing.assert_allclose(
+                outline.weld, get_weld_intersect_array(npmaster, npslave), atol=1e-12
+            )
+            np.testing.assert_array_equal(outline.hole, outline.weld[:-1])
+
+    def test_matches_weld_random(self, joint):
+        rng = np.random.default_rng(0)
+        slaves = [random_slave(rng, i) for i in range(50)]
+        outlines = pair_outlines([joint.master] * len(slaves), slaves, angle_inc=15)
+        assert outlines.weld.shape == (50, 24, 3)
+        npmaster = map_to_np(joint.master)
+        for slave, weld in zip(slaves, outlines.weld):
+            np.testing.assert_allclose(
+                weld,
+                get_weld_intersect_array(npmaster, map_to_np(slave), angle_inc=15),
+                atol=1e-12,
+            )
+
+    def test_joint_outlines(self):
+        joints = [model.joint for model in EXAMPLE_MODELS.values()]
+        outlines = joint_outlines(joints)
+        assert len(outlines) == len(joints)
+        for joint, outline in zip(joints, outlines):
+            assert list(outline) == [slave.name for slave in joint.slaves]
+            expected = joint_outline(joint)
+            for name, values in outline.items():
+                np.testing.assert_array_equal(values.weld, expected[name].weld)
+
+    def test_empty(self):
+        assert joint_outlines([]) == []
+
+    def test_no_intersection(self, joint):
+        slave = joint.slaves[1].copy(deep=True)
+        slave.axis.point.x += 100.0
+        joint = joint.copy(update={"slaves": [joint.slaves[0], slave]})
+        with pytest.raises(IntersectionError, match=slave.name):
+            joint_outline(joint)
+
+    def test_gmsh_not_imported(self):
+        code = (
+            "import sys; sys.path.append('src'); sys.path.append('.');"
+            "from app.converters.outline import convert_model_to_outline;"
+            "from app.interfaces.examples.joints import EXAMPLE_MODELS;"
+            "convert_model_to_outline(EXAMPLE_MODELS['TJoint']);"
+            "assert 'gmsh' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.modelling.geometry.partition import band_index, hole_extent, partition_cuts
+
+
+class TestPartitionCuts:
+    def test_no_holes(self):
+        assert partition_cuts([], 0.0, 10.0) == []
+
+    def test_single_hole(self):
+        assert partition_cuts([(4.0, 6.0)], 0.0, 10.0) == []
+
+    def test_cut_between_holes(self):
+        cuts = partition_cuts([(6.0, 8.0), (1.0, 3.0)], 0.0, 10.0)
+        assert cuts == [4.5]
+
+    def test_overlapping_holes_are_not_cut(self):
+        assert partition_cuts([(1.0, 3.0), (2.0, 5.0), (7.0, 8.0)], 0.0, 10.0) == [6.0]
+
+    def test_margin(self):
+        extents = [(1.0, 3.0), (3.5, 5.0)]
+        assert partition_cuts(extents, 0.0, 10.0, margin=0.2) == [3.25]
+        assert partition_cuts(extents, 0.0, 10.0, margin=0.3) == []
+
+    def test_cuts_inside_tube(self):
+        assert partition_cuts([(-3.0, -2.0), (-1.0, 1.0)], 0.0, 10.0) == []
+
+
+class TestBandIndex:
+    @pytest.mark.parametrize(
+        "extent, band", [((1.0, 3.0), 0), ((6.0, 8.0), 1), ((12.0, 13.0), 2)]
+    )
+    def test_band_index(self, extent, band):
+        assert band_index([4.5, 10.0], extent) == band
+
+    def test_hole_extent(self):
+        hole = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 2.0]])
+        ring = np.array([[0.0, 0.0, 0.5], [1.0, 0.0, 2.5]])
+        assert hole_extent([hole, ring]) == (0.5, 2.5)
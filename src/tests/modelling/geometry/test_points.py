@@ -16,6 +16,7 @@ from app.modelling.geometry.line import (
     rotate_points,
     ellipse_points,
     ellipse_quadrant_points,
+    ellipse_quadrant_array,
 )
 
 
@@ -84,6 +85,11 @@ class TestLinePoints:
         with pytest.raises(ValueError):
             list(line_points([square[0]], interval=10))
 
+    def test_size_larger_than_segment(self, square):
+        pnts = list(line_points(square, size=20))
+        assert len(pnts) == 5
+        assert np.array_equal(pnts[0], pnts[-1])
+
 
 class TestEllipseSegmentAngle:
     def test_ellipse_point_intersect_true(self, circle):
@@ -115,7 +121,6 @@ class TestEllipseSegmentAngle:
 
 
 class TestEllipsePoint:
-    @pytest.mark.skip("Skipped since long running")
     def test_ellipse_quad_on_circle(self, circle: sympy.Ellipse):
         size = 0.05
         points = list(
@@ -129,7 +134,6 @@ class TestEllipsePoint:
         )
         assert len(points) == math.ceil(circle.circumference.evalf() / size / 4)
 
-    @pytest.mark.skip("Skipped since long running")
     def test_ellipse_quad_offset_circle(self, offset_circle: sympy.Ellipse):
         size = 0.05
         points = list(
@@ -143,6 +147,46 @@ class TestEllipsePoint:
         )
         assert len(points) == math.ceil(offset_circle.circumference.evalf() / size / 4)
 
+    def test_ellipse_quad_equal_chords(self, ellipse: sympy.Ellipse):
+        size = 0.1
+        points = ellipse_quadrant_array(
+            np.array([0.0, 0.0]), radius_x=1.0, radius_y=2.0, size=size, rtol=1e-8
+        )
+        chords = np.linalg.norm(np.diff(points, axis=0), axis=1)
+        assert np.allclose(chords, size, atol=1e-8)
+
+    def test_ellipse_quad_returns_end_point(self):
+        generator = ellipse_quadrant_points(
+            np.array([1.0, 1.0]), radius_x=1.0, radius_y=2.0, interval=4
+        )
+        with pytest.raises(StopIteration) as stop:
+            while True:
+                next(generator)
+        assert np.allclose(stop.value.value, np.array([1.0, 3.0]))
+
+    def test_ellipse_quad_matches_sympy(self, ellipse: sympy.Ellipse):
+        kwargs = dict(radius_x=1.0, radius_y=2.0, interval=3, rtol=1e-6)
+        centre = np.array([0.0, 0.0])
+        expected = list(ellipse_quadrant_points(centre, use_sympy=True, **kwargs))
+        got = list(ellipse_quadrant_points(centre, **kwargs))
+        assert len(got) == len(expected)
+        assert np.allclose(got, expected, atol=1e-5)
+
+    def test_ellipse_points_mirrors_quadrant(self):
+        quadrant = ellipse_quadrant_array(
+            np.array([0.0, 0.0]), radius_x=1.0, radius_y=2.0, interval=5
+        )
+        points = np.array(
+            list(ellipse_points(np.array([0.0, 0.0]), 1.0, 2.0, interval=5))
+        )
+        assert len(points) == 4 * len(quadrant)
+        assert np.allclose(points[: len(quadrant)], quadrant)
+        assert np.allclose(points[len(quadrant)], np.array([0.0, 2.0]))
+        assert np.allclose(points[2 * len(quadrant)], np.array([-1.0, 0.0]))
+        assert np.allclose(points[3 * len(quadrant)], np.array([0.0, -2.0]))
+        # the ellipse is symmetric so every point mirrors another about both axes
+        assert np.allclose(np.sort(points[:, 0]), np.sort(-points[:, 0]))
+
 
 class TestRotatePoints:
     def test_rotate_points(self):
@@ -0,0 +1,134 @@
+from copy import deepcopy
+import math
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.modelling.geometry.radials import (
+    radial_candidate_pairs,
+    radial_rings,
+    resolve_radial_overlaps,
+)
+from app.modelling.geometry.intersections import flat_tube_intersection
+from app.modelling.geometry.weld import get_weld_intersect_array
+from app.interfaces import *
+from app.interfaces.mapper import map_to_np
+from app.interfaces.examples.joints import EXAMPLE_MODELS
+
+
+def _multi_brace_joint(num_levels: int, num_around: int, spacing: float) -> Joint:
+    master = Tubular(
+        name="Chord",
+        axis=Axis3D(point=Point3D(x=0, y=0, z=-5), vector=Vector3D(x=0, y=0, z=10)),
+        diameter=1.0,
+    )
+    slaves = []
+    for level in range(num_levels):
+        z = (level - (num_levels - 1) / 2.0) * spacing
+        for idx in range(num_around):
+            angle = math.pi / 2.0 + (idx - (num_around - 1) / 2.0) * 0.6
+            x, y = math.cos(angle), math.sin(angle)
+            slaves.append(
+                Tubular(
+                    name=f"Brace{level}_{idx}",
+                    axis=Axis3D(
+                        point=Point3D(x=0.5 * x, y=0.5 * y, z=z),
+                        vector=Vector3D(x=2 * x, y=2 * y, z=math.copysign(1.0, z)),
+                    ),
+                    diameter=0.2,
+                )
+            )
+    return Joint(name="Node", master=master, slaves=slaves)
+
+
+def _radials(joint: Joint) -> tuple[dict, dict]:
+    master = map_to_np(joint.master)
+    radial_lines, centers = {}, {}
+    for slave in joint.slaves:
+        npslave = map_to_np(slave)
+        center = flat_tube_intersection(master, npslave)
+        points = get_weld_intersect_array(master, npslave, 10)
+        radial_lines[slave.name] = radial_rings(points, center)
+        centers[slave.name] = center
+    return radial_lines, centers
+
+
+def _brute_force(radial_lines: dict, centers: dict) -> None:
+    """Original all pairs implementation from add_flat_tube"""
+    num_radials = len(list(radial_lines.values())[0])
+    for idx in range(num_radials, 0, -1):
+        line_idx = idx - 1
+        for this, this_lines in radial_lines.items():
+            this_line = this_lines[line_idx]
+            for other, other_lines in radial_lines.items():
+                other_line = other_lines[line_idx]
+                if this == other:
+                    continue
+                diff_center = (centers[this] + centers[other]) / 2.0
+                this_center_distances = np.linalg.norm(this_line - centers[this], axis=1).max()
+                this_diff_center_distances = np.linalg.norm(this_line - diff_center, axis=1).min()
+                other_center_distances = np.linalg.norm(other_line - centers[other], axis=1).max()
+                other_diff_center_distances = np.linalg.norm(other_line - diff_center, axis=1).min()
+                if (
+                    this_center_distances < this_diff_center_distances
+                    and other_center_distances < other_diff_center_distances
+                ):
+                    continue
+                this_diff_y_direction = np.sign(diff_center[0] - centers[this][0])
+                other_diff_y_direction = np.sign(diff_center[0] - centers[other][0])
+                this_no_change = np.sign(diff_center[0] - this_line[:, 0]) == this_diff_y_direction
+                other_no_change = np.sign(diff_center[0] - other_line[:, 0]) == other_diff_y_direction
+                this_average_y = this_line[:, 0] * this_no_change + diff_center[0] * (this_no_change == False)
+                other_average_y = other_line[:, 0] * other_no_change + diff_center[0] * (other_no_change == False)
+                radial_lines[this][line_idx][:, 0] = this_average_y
+                radial_lines[other][line_idx][:, 0] = other_average_y
+
+
+@pytest.fixture(
+    params=[
+        EXAMPLE_MODELS["KJoint"].joint,
+        _multi_brace_joint(2, 6, 1.0),
+        _multi_brace_joint(3, 4, 0.5),
+    ],
+    ids=["KJoint", "12Braces", "Crowded"],
+)
+def joint(request) -> Joint:
+    return request.param
+
+
+class TestRadialRings:
+    def test_ring_distances(self):
+        points = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 2.0]])
+        rings = radial_rings(points, np.zeros(3), [0.5, 1.0])
+        assert len(rings) == 2
+        assert np.allclose(rings[0], [[1.5, 0.0, 0.0], [0.0, 0.0, 2.5]])
+        assert np.allclose(rings[1], [[2.0, 0.0, 0.0], [0.0, 0.0, 3.0]])
+
+
+class TestResolveRadialOverlaps:
+    def test_matches_brute_force(self, joint: Joint):
+        radial_lines, centers = _radials(joint)
+        expected = deepcopy(radial_lines)
+        _brute_force(expected, centers)
+        resolve_radial_overlaps(radial_lines, centers)
+        for name, rings in expected.items():
+            for ring_idx, ring in enumerate(rings):
+                assert np.array_equal(radial_lines[name][ring_idx], ring)
+
+    def test_distant_slaves_pruned(self):
+        ring = np.array([[0.1, 0.0, 0.0], [0.0, 0.0, 0.1], [-0.1, 0.0, 0.0]])
+        centers = [np.zeros(3), np.array([10.0, 0.0, 0.0])]
+        neighbours = radial_candidate_pairs([ring, ring + centers[1]], centers)
+        assert neighbours == [[], []]
+
+    def test_close_slaves_kept(self):
+        ring = np.array([[0.1, 0.0, 0.0], [0.0, 0.0, 0.1], [-0.1, 0.0, 0.0]])
+        centers = [np.zeros(3), np.array([0.3, 0.0, 0.0])]
+        neighbours = radial_candidate_pairs([ring, ring + centers[1]], centers)
+        assert neighbours == [[1], [0]]
+
+    def test_single_slave(self):
+        ring = np.array([[0.1, 0.0, 0.0], [0.0, 0.0, 0.1]])
+        assert radial_candidate_pairs([ring], [np.zeros(3)]) == [[]]
@@ -0,0 +1,55 @@
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.interfaces import *
+from app.modelling.geometry.sizing import (
+    DEFAULT_WELD_DISTANCE,
+    MAX_SIZE_GRADIENT,
+    mesh_sizing,
+)
+
+
+class TestMeshSizing:
+    def test_default_is_uniform(self):
+        sizing = mesh_sizing()
+        assert sizing.weld_size == sizing.far_size == DEFAULT_MESH_SPECS.size
+        assert not sizing.graded
+
+    def test_sizes_default_to_size(self):
+        sizing = mesh_sizing(MeshSpecs(size=0.2))
+        assert sizing.weld_size == sizing.far_size == 0.2
+        sizing = mesh_sizing(MeshSpecs(size=0.05, far_size=0.5))
+        assert sizing.weld_size == 0.05
+        assert sizing.far_size == 0.5
+
+    def test_graded_defaults(self):
+        sizing = mesh_sizing(MeshSpecs(weld_size=0.1, far_size=1.0))
+        assert sizing.graded
+        assert sizing.weld_distance == DEFAULT_WELD_DISTANCE
+        assert sizing.transition_distance == pytest.approx(0.9 / MAX_SIZE_GRADIENT)
+
+    def test_size_at(self):
+        sizing = mesh_sizing(
+            MeshSpecs(
+                weld_size=0.1, far_size=1.0, weld_distance=0.5, transition_distance=1.0
+            )
+        )
+        assert sizing.size_at(0.0) == pytest.approx(0.1)
+        assert sizing.size_at(0.5) == pytest.approx(0.1)
+        assert sizing.size_at(1.0) == pytest.approx(0.55)
+        assert sizing.size_at(10.0) == pytest.approx(1.0)
+
+    @pytest.mark.parametrize(
+        "specs",
+        [
+            MeshSpecs(size=0),
+            MeshSpecs(weld_size=-0.1),
+            MeshSpecs(weld_size=1.0, far_size=0.1),
+            MeshSpecs(weld_size=0.1, far_size=1.0, transition_distance=-1),
+        ],
+    )
+    def test_invalid(self, specs: MeshSpecs):
+        with pytest.raises(ValueError):
+            mesh_sizing(specs)
@@ -5,7 +5,7 @@ import sys
 
 sys.path.append("src")
 
-from app.modelling.geometry.vectors import rotate
+from app.modelling.geometry.vectors import rotate, rotate_vectors
 
 
 class TestRotate:
@@ -22,3 +22,14 @@ class TestRotate:
         expected = np.array([0.0, 1.0, 0.0])
         got = rotate(point, axis, angle)
         assert np.allclose(got, expected)
+
+
+class TestRotateVectors:
+    def test_matches_rotate(self):
+        vector = np.array([0.3, -1.2, 0.7])
+        axis = np.array([1.0, 2.0, -0.5])
+        angles = np.linspace(-math.pi, math.pi, 9)
+        got = rotate_vectors(vector, axis, angles)
+        assert got.shape == (9, 3)
+        for idx, angle in enumerate(angles):
+            assert np.allclose(got[idx], rotate(vector, axis, angle))
@@ -6,8 +6,13 @@ import sys
 
 sys.path.append("src")
 
-from app.modelling.geometry.weld import get_weld_intersect_points
+from app.modelling.geometry.weld import (
+    get_weld_intersect_points,
+    get_weld_intersect_array,
+    weld_angles,
+)
 from app.interfaces import *
+from app.interfaces.examples.joints import EXAMPLE_MODELS
 from app.interfaces.mapper import map_to_np
 
 
@@ -123,3 +128,72 @@ class TestIntersections:
         got = list(get_weld_intersect_points(master, yslave, 90))
         for idx, target in enumerate(expected):
             assert np.allclose(target, got[idx])
+
+
+# weld points of the first slave of example joints at 10 degree increments, from the
+# per-angle sympy implementation the vectorized weld ring replaced
+BASELINE_WELD_POINTS = {
+    "TAngle": {
+        0: [-0.125, 0.25, 0.0],
+        5: [-0.080348451211, 0.25, 0.135418805105],
+        14: [0.09575555539, 0.25, 0.113629869418],
+        23: [0.080348451211, 0.25, -0.135418805105],
+        31: [-0.080348451211, 0.25, -0.135418805105],
+    },
+    "TOffset": {
+        0: [-0.033506969881, 0.25, 0.0],
+        5: [0.015211863982, 0.25, 0.09575555539],
+        14: [0.207357087895, 0.25, 0.080348451211],
+        23: [0.190546559052, 0.25, -0.09575555539],
+        31: [0.015211863982, 0.25, -0.09575555539],
+    },
+    "KJoint": {
+        0: [0.110619449019, 0.3, 1.0],
+        5: [0.155270997808, 0.3, 1.117276125371],
+        14: [0.331375004409, 0.3, 1.098406353545],
+        23: [0.31596790023, 0.3, 0.882723874629],
+        31: [0.155270997808, 0.3, 0.882723874629],
+    },
+}
+
+
+class TestWeldArray:
+    @pytest.mark.parametrize("modelname", list(BASELINE_WELD_POINTS))
+    def test_array_matches_baseline(self, modelname: str):
+        joint = EXAMPLE_MODELS[modelname].joint
+        got = get_weld_intersect_array(
+            map_to_np(joint.master), map_to_np(joint.slaves[0]), 10
+        )
+        assert got.shape == (36, 3)
+        for idx, expected in BASELINE_WELD_POINTS[modelname].items():
+            assert np.allclose(got[idx], expected, atol=1e-10)
+
+    def test_array_custom_angles(self, master: NpTubular, yslave: NpTubular):
+        angles = np.array([0.0, math.pi / 2.0])
+        got = get_weld_intersect_array(master, yslave, angles=angles)
+        expected = get_weld_intersect_array(master, yslave, 90)[:2]
+        assert np.allclose(got, expected)
+
+    def test_fractional_angle_increment(self, master: NpTubular, yslave: NpTubular):
+        got = get_weld_intersect_array(master, yslave, 7.5)
+        assert got.shape == (48, 3)
+        # points lie on the slave circle on the flattened plane
+        radii = np.linalg.norm(got[:, [0, 2]] - got[:, [0, 2]].mean(axis=0), axis=1)
+        assert np.allclose(radii, yslave.diameter / 2.0)
+
+
+class TestWeldAngles:
+    def test_whole_degrees(self):
+        assert np.allclose(np.degrees(weld_angles(90)), [0.0, 90.0, 180.0, 270.0])
+
+    def test_uneven_increment_excludes_full_turn(self):
+        degrees = np.degrees(weld_angles(7))
+        assert len(degrees) == len(range(0, 360, 7))
+        assert degrees[-1] < 360.0
+
+    def test_fractional_degrees(self):
+        assert len(weld_angles(0.5)) == 720
+
+    def test_invalid_increment(self):
+        with pytest.raises(ValueError):
+            weld_angles(0)
@@ -0,0 +1,73 @@
+from types import NoneType
+import gmsh
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.modelling.mesher.builder import GeometryBuilder
+
+
+@pytest.fixture
+def square() -> np.ndarray:
+    return np.array(
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0]]
+    )
+
+
+@pytest.fixture
+def mesh_context() -> NoneType:
+    try:
+        gmsh.initialize()
+        yield
+    finally:
+        gmsh.finalize()
+
+
+class TestGeometryBuilderPlan:
+    def test_repeated_closing_point_merged(self, square):
+        builder = GeometryBuilder()
+        builder.add_loop(np.vstack([square, square[:1]]))
+        points, _, segments, signed = builder.plan()
+        assert len(points) == 4
+        assert len(segments) == 4
+        assert signed[0].tolist() == [1, 2, 3, 4]
+
+    def test_shared_points_and_segments(self, square):
+        builder = GeometryBuilder()
+        builder.add_loop(square)
+        builder.add_loop(square[::-1])
+        points, loop_ids, segments, signed = builder.plan()
+        assert len(points) == 4
+        assert len(segments) == 4
+        assert loop_ids[1].tolist() == [3, 2, 1, 0]
+        # reversed loop reuses the same segments in the opposite direction
+        assert signed[1].tolist() == [-3, -2, -1, -4]
+
+    def test_coincident_points_dropped(self, square):
+        builder = GeometryBuilder()
+        loop = np.insert(square, 2, square[1] + 1e-12, axis=0)
+        builder.add_loop(loop)
+        points, _, segments, _ = builder.plan()
+        assert len(points) == 4
+        assert len(segments) == 4
+
+    def test_too_few_points(self, square):
+        with pytest.raises(ValueError):
+            GeometryBuilder().add_loop(square[:1])
+
+
+@pytest.mark.usefixtures("mesh_context")
+class TestGeometryBuilderBuild:
+    def test_build_loops(self, square):
+        builder = GeometryBuilder()
+        outer = builder.add_loop(square * 4.0 - 1.0)
+        hole = builder.add_loop(square)
+        loops = builder.build()
+        assert len(loops) == 2
+        surface = gmsh.model.occ.addPlaneSurface([loops[outer], loops[hole]])
+        gmsh.model.occ.synchronize()
+        assert len(gmsh.model.getEntities(0)) == 8
+        assert len(gmsh.model.getEntities(1)) == 8
+        assert surface > 0
@@ -0,0 +1,56 @@
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.interfaces import *
+from app.interfaces.examples.joints import EXAMPLE_MODELS
+from app.modelling.mesher.estimate import (
+    BASE_RSS,
+    element_size,
+    estimate_mesh,
+)
+
+
+@pytest.fixture
+def model() -> Model:
+    return EXAMPLE_MODELS["TJoint"].copy(deep=True)
+
+
+class TestEstimateMesh:
+    def test_estimate_positive(self, model: Model):
+        estimate = estimate_mesh(model)
+        assert estimate.elements > 0
+        assert estimate.nodes >= estimate.elements
+        assert estimate.rss > BASE_RSS
+
+    def test_finer_mesh_is_larger(self, model: Model):
+        coarse = estimate_mesh(model, MeshSpecs(size=0.1))
+        fine = estimate_mesh(model, MeshSpecs(size=0.05))
+        assert fine.elements > 3 * coarse.elements
+        assert fine.rss > coarse.rss
+
+    def test_slaves_add_elements(self, model: Model):
+        single = estimate_mesh(model)
+        model.joint.slaves = model.joint.slaves * 3
+        assert estimate_mesh(model).elements > single.elements
+
+    def test_longer_master_is_larger(self, model: Model):
+        short = estimate_mesh(model)
+        model.joint.master.axis.vector.z *= 2
+        model.joint.master.axis.vector.x *= 2
+        model.joint.master.axis.vector.y *= 2
+        assert estimate_mesh(model).elements > short.elements
+
+    def test_size_follows_specs(self):
+        assert element_size(MeshSpecs(size=1.0)) == 1.0
+        assert element_size(MeshSpecs(size=0.1, far_size=0.5)) == 0.5
+
+    def test_graded_mesh_is_smaller(self, model: Model):
+        uniform = estimate_mesh(model, MeshSpecs(size=0.05))
+        graded = estimate_mesh(model, MeshSpecs(weld_size=0.05, far_size=0.5))
+        assert graded.elements < uniform.elements / 10
+
+    def test_invalid_size(self, model: Model):
+        with pytest.raises(ValueError):
+            estimate_mesh(model, MeshSpecs(size=0))
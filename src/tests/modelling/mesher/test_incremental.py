@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.interfaces import *
+from app.interfaces.examples.joints import EXAMPLE_MODELS
+from app.modelling.mesher.incremental import (
+    GeometryCache,
+    joint_geometry,
+    slave_geometry,
+)
+
+
+@pytest.fixture
+def joint() -> Joint:
+    return EXAMPLE_MODELS["KJoint"].joint.copy(deep=True)
+
+
+@pytest.fixture
+def cache() -> GeometryCache:
+    return GeometryCache()
+
+
+class TestGeometryCache:
+    def test_first_joint_is_generated(self, cache: GeometryCache, joint: Joint):
+        geometry = cache.joint_geometry(joint)
+        assert set(geometry) == {slave.name for slave in joint.slaves}
+        assert cache.stats == {
+            "joints": 1,
+            "reused": 0,
+            "generated": len(joint.slaves),
+        }
+
+    def test_unchanged_slaves_reused(self, cache: GeometryCache, joint: Joint):
+        first = cache.joint_geometry(joint)
+        moved = joint.slaves[0].name
+        joint.slaves[0].axis.point.z += 0.1
+        second = cache.joint_geometry(joint)
+        assert second[moved] is not first[moved]
+        for slave in joint.slaves[1:]:
+            assert second[slave.name] is first[slave.name]
+        assert cache.stats["reused"] == len(joint.slaves) - 1
+        assert cache.stats["generated"] == len(joint.slaves) + 1
+
+    def test_changed_master_regenerates(self, cache: GeometryCache, joint: Joint):
+        cache.joint_geometry(joint)
+        joint.master.diameter += 0.1
+        cache.joint_geometry(joint)
+        assert cache.stats["reused"] == 0
+
+    def test_matches_fresh_geometry(self, cache: GeometryCache, joint: Joint):
+        cache.joint_geometry(joint)
+        joint.slaves[0].axis.point.z += 0.1
+        cached = cache.joint_geometry(joint)
+        fresh = joint_geometry(joint)
+        for name, geometry in fresh.items():
+            np.testing.assert_array_equal(cached[name].hole, geometry.hole)
+            np.testing.assert_array_equal(cached[name].center, geometry.center)
+
+    def test_max_joints(self, joint: Joint):
+        cache = GeometryCache(max_joints=1)
+        cache.joint_geometry(joint)
+        other = joint.copy(deep=True)
+        other.name = "Other"
+        cache.joint_geometry(other)
+        assert cache.stats["joints"] == 1
+
+    def test_geometry_is_read_only(self, joint: Joint):
+        geometry = slave_geometry(joint.master, joint.slaves[0])
+        with pytest.raises(ValueError):
+            geometry.radials[0][0, 0] = 0.0
@@ -45,3 +45,11 @@ class TestMeshModel:
     def test_mesh_model(self, model, mesh_specs):
         with mesh_model(model, mesh_specs) as mesh:
             assert mesh is not None
+
+    def test_graded_mesh_is_coarser(self, model, mesh_specs):
+        with mesh_model(model, mesh_specs) as mesh:
+            uniform = len(mesh.getElementsByType(mesh.getElementType("Quadrangle", 1))[0])
+        graded_specs = MeshSpecs(weld_size=0.1, far_size=1.0)
+        with mesh_model(model, graded_specs) as mesh:
+            graded = len(mesh.getElementsByType(mesh.getElementType("Quadrangle", 1))[0])
+        assert 0 < graded < uniform / 2
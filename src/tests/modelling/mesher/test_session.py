@@ -0,0 +1,45 @@
+import gmsh
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.interfaces.examples.joints import EXAMPLE_MODELS
+from app.interfaces import MeshSpecs
+from app.modelling.mesher.mesh import mesh_model
+from app.modelling.mesher.session import GmshSession, MESH_OPTIONS, process_rss
+
+
+@pytest.fixture
+def session() -> GmshSession:
+    session = GmshSession(max_jobs=2)
+    session.start()
+    yield session
+    session.stop()
+
+
+class TestGmshSession:
+    def test_options_applied(self, session: GmshSession):
+        for name, value in MESH_OPTIONS.items():
+            assert gmsh.option.getNumber(name) == value
+
+    def test_session_stays_initialized(self, session: GmshSession):
+        with mesh_model(EXAMPLE_MODELS["TJoint"], MeshSpecs(size=0.1), session):
+            pass
+        assert session.is_running
+        assert session.jobs == 1
+
+    def test_reset_clears_model(self, session: GmshSession):
+        gmsh.model.occ.addPoint(0, 0, 0)
+        gmsh.model.occ.synchronize()
+        session.reset()
+        assert gmsh.model.getEntities() == []
+
+    def test_should_recycle(self, session: GmshSession):
+        assert not session.should_recycle()
+        session.reset()
+        session.reset()
+        assert session.should_recycle()
+
+    def test_process_rss(self):
+        assert process_rss() > 0
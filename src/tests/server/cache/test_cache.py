@@ -3,18 +3,44 @@ import sys
 
 sys.path.append("src")
 
+from app.interfaces import *
 from app.interfaces.examples.joints import EXAMPLE_MODELS
 from app.server.worker.jobs.job import Job, JobStatus
-from app.server.cache.cache import Cache, get_job, store_job
+from app.server.cache.cache import (
+    JOB_TTL,
+    LIST_ITEM_SIZE,
+    MEMORY_BUDGET,
+    Cache,
+    get_job,
+    get_job_status,
+    mesh_size,
+    pin_job,
+    release_job,
+    store_job,
+    unpin_job,
+)
 
 
 @pytest.fixture
 def cache() -> Cache:
     cache = Cache()
+    cache.clear()
     yield cache
+    cache.ttl = JOB_TTL
+    cache.budget = MEMORY_BUDGET
     del cache
 
 
+def _complete_job(num_points: int) -> Job:
+    job = Job(EXAMPLE_MODELS["TJoint"])
+    job.mesh = DashVtkModel(
+        name="TJoint",
+        mesh=DashVtkMesh(points=[0.0] * num_points, polys=[], lines=[]),
+    )
+    job.status = JobStatus.COMPLETE
+    return job
+
+
 @pytest.fixture
 def job() -> Job:
     yield Job(EXAMPLE_MODELS["TJoint"])
@@ -40,3 +66,94 @@ class TestCache:
         assert other_job.id == job.id
         assert other_job.status == job.status
         assert other_job is not job
+
+    def test_get_job_shares_mesh(self, cache: Cache):
+        job = _complete_job(30)
+        store_job(job)
+        other_job = get_job(job.id)
+        assert other_job.mesh is job.mesh
+        other_job.error = "changed"
+        assert get_job(job.id).status == JobStatus.COMPLETE
+        assert get_job(job.id).error is None
+
+    def test_get_job_status(self, cache: Cache, job: Job):
+        store_job(job)
+        assert get_job_status(job.id) == job.status
+        assert get_job_status("missing") == JobStatus.NOTFOUND
+        release_job(job.id)
+        assert get_job_status(job.id) == JobStatus.EXPIRED
+
+
+class TestCacheEviction:
+    def test_mesh_size(self):
+        assert mesh_size(None) == 0
+        assert mesh_size(_complete_job(30).mesh) == 30 * LIST_ITEM_SIZE
+
+    def test_footprint(self, cache: Cache):
+        before = cache.footprint
+        job = _complete_job(30)
+        store_job(job)
+        assert cache.footprint == before + 30 * LIST_ITEM_SIZE
+        release_job(job.id)
+        assert cache.footprint == before
+
+    def test_missing_job_not_found(self, cache: Cache):
+        assert get_job("missing").status == JobStatus.NOTFOUND
+
+    def test_released_job_expired(self, cache: Cache):
+        job = _complete_job(30)
+        store_job(job)
+        release_job(job.id)
+        assert get_job(job.id).status == JobStatus.EXPIRED
+
+    def test_ttl_expires_finished_jobs(self, cache: Cache):
+        finished = _complete_job(30)
+        running = Job(EXAMPLE_MODELS["TJoint"])
+        running.status = JobStatus.RUNNING
+        store_job(finished)
+        store_job(running)
+        cache.ttl = 0
+        assert get_job(finished.id).status == JobStatus.EXPIRED
+        assert get_job(running.id).status == JobStatus.RUNNING
+
+    def test_budget_evicts_oldest(self, cache: Cache):
+        old, new = _complete_job(30), _complete_job(30)
+        store_job(old)
+        store_job(new)
+        cache.budget = cache.footprint - 1
+        assert get_job(old.id).status == JobStatus.EXPIRED
+        assert get_job(new.id).status == JobStatus.COMPLETE
+
+    def test_pinned_jobs_kept(self, cache: Cache):
+        pinned, other = _complete_job(30), _complete_job(30)
+        store_job(pinned)
+        store_job(other)
+        pin_job(pinned.id)
+        release_job(pinned.id)
+        cache.ttl = 0
+        cache.budget = 0
+        assert get_job(pinned.id).status == JobStatus.COMPLETE
+        assert get_job(other.id).status == JobStatus.EXPIRED
+        unpin_job(pinned.id)
+        assert get_job(pinned.id).status == JobStatus.EXPIRED
+
+
+class TestCacheWatch:
+    def test_watch_status_changes(self, cache: Cache, job: Job):
+        statuses = []
+        store_job(job)
+        assert cache.watch(job.id, statuses.append) == job.status
+        running = job.snapshot()
+        running.status = JobStatus.RUNNING
+        store_job(running)
+        # unchanged status is not notified
+        store_job(running.snapshot())
+        release_job(job.id)
+        assert statuses == [JobStatus.RUNNING, JobStatus.EXPIRED]
+
+    def test_unwatch(self, cache: Cache, job: Job):
+        statuses = []
+        cache.watch(job.id, statuses.append)
+        cache.unwatch(job.id, statuses.append)
+        store_job(job)
+        assert statuses == []
@@ -0,0 +1,155 @@
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.interfaces import *
+from app.interfaces.examples.joints import EXAMPLE_MODELS
+from app.server.worker.jobs.job import Job, JobStatus
+from app.server.cache.cache import (
+    MEMORY_BUDGET,
+    Cache,
+    mesh_size,
+    release_job,
+    store_job,
+)
+from app.server.cache.results import (
+    ResultCache,
+    get_result,
+    result_key,
+    store_result,
+)
+
+
+@pytest.fixture
+def cache() -> ResultCache:
+    cache = ResultCache()
+    cache.clear()
+    yield cache
+    cache.max_size = 32
+    cache.clear()
+
+
+@pytest.fixture
+def jobs() -> Cache:
+    jobs = Cache()
+    jobs.clear()
+    yield jobs
+    jobs.budget = MEMORY_BUDGET
+    jobs.clear()
+
+
+@pytest.fixture
+def model() -> Model:
+    return EXAMPLE_MODELS["KJoint"].copy(deep=True)
+
+
+@pytest.fixture
+def specs() -> MeshSpecs:
+    return MeshSpecs(size=0.1)
+
+
+def _mesh(name: str, num_points: int = 0) -> DashVtkModel:
+    return DashVtkModel(
+        name=name, mesh=DashVtkMesh(points=[0.0] * num_points, polys=[], lines=[])
+    )
+
+
+def _complete_job(mesh: DashVtkModel) -> Job:
+    job = Job(EXAMPLE_MODELS["TJoint"])
+    job.mesh = mesh
+    job.status = JobStatus.COMPLETE
+    return job
+
+
+class TestResultKey:
+    def test_key_is_stable(self, model, specs):
+        assert result_key(model, specs) == result_key(model.copy(deep=True), specs)
+
+    def test_slave_order_ignored(self, model, specs):
+        other = model.copy(deep=True)
+        other.joint.slaves = other.joint.slaves[::-1]
+        assert result_key(model, specs) == result_key(other, specs)
+
+    def test_float_noise_ignored(self, model, specs):
+        other = model.copy(deep=True)
+        other.joint.master.diameter += 1e-12
+        assert result_key(model, specs) == result_key(other, specs)
+
+    def test_geometry_changes_key(self, model, specs):
+        other = model.copy(deep=True)
+        other.joint.slaves[0].diameter += 0.01
+        assert result_key(model, specs) != result_key(other, specs)
+
+    def test_specs_change_key(self, model, specs):
+        assert result_key(model, specs) != result_key(model, MeshSpecs(size=0.2))
+
+    def test_threads_do_not_change_key(self, model, specs):
+        threaded = specs.copy(update={"threads": 4})
+        assert result_key(model, specs) == result_key(model, threaded)
+
+
+class TestResultCache:
+    def test_cache_single_instance(self, cache):
+        assert cache is ResultCache()
+
+    def test_miss_then_hit(self, cache, model, specs):
+        assert get_result(model, specs) is None
+        mesh = _mesh(model.name)
+        store_result(model, specs, mesh)
+        assert get_result(model, specs) is mesh
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+        assert cache.stats["size"] == 1
+
+    def test_lru_eviction(self, cache):
+        cache.max_size = 2
+        cache.put("a", _mesh("a"))
+        cache.put("b", _mesh("b"))
+        # touch a so b is least recently used
+        assert cache.get("a") is not None
+        cache.put("c", _mesh("c"))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats["size"] == 2
+
+    def test_shrinking_evicts(self, cache):
+        for name in "abc":
+            cache.put(name, _mesh(name))
+        cache.max_size = 1
+        assert cache.stats["size"] == 1
+        assert cache.get("c") is not None
+
+
+class TestResultBudget:
+    def test_results_charged_to_budget(self, cache, jobs):
+        mesh = _mesh("a", 30)
+        cache.put("a", mesh)
+        assert jobs.footprint == mesh_size(mesh)
+        # a job sharing the mesh is counted once
+        job = _complete_job(mesh)
+        store_job(job)
+        assert jobs.footprint == mesh_size(mesh)
+        # released jobs whose mesh is still cached stay in the footprint
+        release_job(job.id)
+        assert jobs.footprint == mesh_size(mesh)
+        cache.clear()
+        assert jobs.footprint == 0
+
+    def test_lru_eviction_uncharged(self, cache, jobs):
+        cache.max_size = 1
+        cache.put("a", _mesh("a", 30))
+        cache.put("b", _mesh("b", 30))
+        assert jobs.footprint == mesh_size(cache.get("b"))
+
+    def test_budget_evicts_results_first(self, cache, jobs):
+        job = _complete_job(_mesh("job", 30))
+        store_job(job)
+        cache.put("old", _mesh("old", 30))
+        cache.put("new", _mesh("new", 30))
+        jobs.budget = jobs.footprint - 1
+        assert cache.get("old") is None
+        assert cache.get("new") is not None
+        assert jobs.get(job.id).status == JobStatus.COMPLETE
+        assert jobs.footprint <= jobs.budget
@@ -0,0 +1,66 @@
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.interfaces import *
+from app.interfaces.examples.joints import EXAMPLE_MODELS
+from app.server.cache.cache import get_job
+from app.server.worker.dispatcher import Dispatcher
+from app.server.worker.jobs.job import Job, JobStatus
+from app.server.worker.manager import Manager
+from app.server.worker.pool import WorkerPool
+
+
+@pytest.fixture
+def dispatcher() -> Dispatcher:
+    # not started, outputs are dispatched directly
+    return Dispatcher(WorkerPool(1))
+
+
+@pytest.fixture
+def manager() -> Manager:
+    manager = Manager()
+    manager.start()
+    yield manager
+    manager.stop()
+
+
+@pytest.fixture
+def job() -> Job:
+    return Job(EXAMPLE_MODELS["KJoint"])
+
+
+class TestDispatcher:
+    def test_finished_output_resolves_future(self, dispatcher: Dispatcher, job: Job):
+        future = dispatcher.track(job.id)
+        job.error = "failed"
+        dispatcher.dispatch(job)
+        assert future.done()
+        assert future.result().status == JobStatus.ERROR
+        assert dispatcher.pending == 0
+        assert get_job(job.id).error == "failed"
+
+    def test_running_output_is_stored(self, dispatcher: Dispatcher, job: Job):
+        future = dispatcher.track(job.id)
+        job.status = JobStatus.RUNNING
+        dispatcher.dispatch(job)
+        assert not future.done()
+        assert dispatcher.pending == 1
+        assert get_job(job.id).status == JobStatus.RUNNING
+
+    def test_wait_untracked_job(self, dispatcher: Dispatcher):
+        assert dispatcher.wait("missing", 0) is None
+
+    def test_wait_timeout(self, dispatcher: Dispatcher, job: Job):
+        dispatcher.track(job.id)
+        assert dispatcher.wait(job.id, 0) is None
+
+
+class TestDispatcherRunsJob:
+    def test_dispatcher_success(self, manager: Manager, job: Job):
+        job_in = manager.submit_job(job.data)
+        job_out = manager.wait_for_job(job_in.id)
+        assert job_out.status == JobStatus.COMPLETE
+        assert job_out.mesh is not None
+        assert manager.dispatcher.pending == 0
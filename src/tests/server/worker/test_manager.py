@@ -1,3 +1,6 @@
+import asyncio
+import json
+import numpy as np
 import pytest
 import sys
 
@@ -5,11 +8,16 @@ sys.path.append("src")
 
 from app.interfaces.examples.joints import EXAMPLE_MODELS
 from app.server.worker.jobs.job import Job, JobStatus
-from app.server.worker.manager import Manager
+from app.server.worker.jobs.interfaces import MeshJob
+from app.server.worker.manager import Manager, batch_status
+from app.server.cache.results import ResultCache
+from app.converters.binary import MEDIA_TYPE, decode_dash_vtk
 
 
 @pytest.fixture
 def manager():
+    # meshes of other tests would complete jobs straight from the result cache
+    ResultCache().clear()
     manager = Manager()
     manager.start()
     yield manager
@@ -18,7 +26,8 @@ def manager():
 
 class TestManagerStartStop:
     def test_manager_start_stop(self, manager):
-        assert manager.worker.is_alive()
+        assert manager.pool.is_alive()
+        assert all(worker.is_alive() for worker in manager.pool.workers)
 
 
 class TestManagerSingleton:
@@ -37,3 +46,119 @@ class TestManagerRunsJob:
         job_out = manager.wait_for_job(job_in.id)
         assert job_out.status == JobStatus.COMPLETE
         assert job_out.error is None
+
+
+class TestManagerGetsMesh:
+    @staticmethod
+    def _read(response) -> list:
+        async def read():
+            return [chunk async for chunk in response.body_iterator]
+
+        return asyncio.run(read())
+
+    def test_manager_binary_mesh(self, manager: Manager):
+        job_in = manager.submit_job(EXAMPLE_MODELS["TJoint"])
+        job_out = manager.wait_for_job(job_in.id)
+        response = manager.get_job(job_in.id, f"{MEDIA_TYPE}, application/json;q=0.9")
+        assert response.media_type == MEDIA_TYPE
+        mesh = decode_dash_vtk(b"".join(self._read(response)))
+        assert mesh.name == job_out.mesh.name
+        np.testing.assert_array_equal(mesh.mesh.points, job_out.mesh.mesh.points)
+        np.testing.assert_array_equal(mesh.mesh.polys, job_out.mesh.mesh.polys)
+
+    def test_manager_json_mesh(self, manager: Manager):
+        job_in = manager.submit_job(EXAMPLE_MODELS["TJoint"])
+        manager.wait_for_job(job_in.id)
+        response = manager.get_job(job_in.id)
+        assert response.media_type == "application/json"
+
+
+class TestManagerResultCache:
+    def test_repeat_job_served_from_cache(self, manager: Manager):
+        first = manager.submit_job(EXAMPLE_MODELS["TJoint"])
+        first_out = manager.wait_for_job(first.id)
+        second = manager.submit_job(EXAMPLE_MODELS["TJoint"])
+        assert second.status == JobStatus.COMPLETE
+        second_out = manager.wait_for_job(second.id)
+        assert second_out.mesh is first_out.mesh
+
+
+class TestManagerWatchesJob:
+    def test_long_poll_job(self, manager: Manager):
+        job_in = manager.submit_job(EXAMPLE_MODELS["KJoint"])
+        job_out = asyncio.run(manager.long_poll_job(job_in.id, 60))
+        assert job_out.status == JobStatus.COMPLETE
+
+    def test_long_poll_timeout(self, manager: Manager):
+        job_out = asyncio.run(manager.long_poll_job("missing", 0))
+        assert job_out.status == JobStatus.NOTFOUND
+
+    def test_job_events(self, manager: Manager):
+        job_in = manager.submit_job(EXAMPLE_MODELS["TAngle"])
+        response = manager.job_events(job_in.id, 60)
+        events = TestManagerGetsMesh._read(response)
+        assert all(event.startswith("event: status\ndata: ") for event in events)
+        assert JobStatus.COMPLETE.value in events[-1]
+
+
+class TestManagerBatch:
+    def test_batch_status(self):
+        def jobs(*statuses):
+            return [MeshJob(id=str(i), status=s) for i, s in enumerate(statuses)]
+
+        assert batch_status(jobs(JobStatus.SUBMITTED)) == JobStatus.SUBMITTED
+        assert (
+            batch_status(jobs(JobStatus.COMPLETE, JobStatus.SUBMITTED))
+            == JobStatus.RUNNING
+        )
+        assert batch_status(jobs(JobStatus.COMPLETE, JobStatus.ERROR)) == JobStatus.ERROR
+        assert (
+            batch_status(jobs(JobStatus.COMPLETE, JobStatus.COMPLETE))
+            == JobStatus.COMPLETE
+        )
+
+    def test_batch_download(self, manager: Manager):
+        models = [EXAMPLE_MODELS["TJoint"], EXAMPLE_MODELS["TOffset"]]
+        batch = manager.submit_batch(models)
+        assert len(batch.jobs) == 2
+        for job in batch.jobs:
+            manager.wait_for_job(job.id)
+        assert manager.monitor_batch(batch.id).status == JobStatus.COMPLETE
+        lines = "".join(TestManagerGetsMesh._read(manager.get_batch(batch.id)))
+        results = [json.loads(line) for line in lines.splitlines()]
+        assert {result["id"] for result in results} == {job.id for job in batch.jobs}
+        assert all(result["status"] == JobStatus.COMPLETE for result in results)
+        # each mesh has the shape of a single json mesh download
+        names = {model.name for model in models}
+        assert {result["mesh"]["name"] for result in results} == names
+        assert all(result["mesh"]["mesh"]["points"] for result in results)
+
+    def test_batch_after_download(self, manager: Manager):
+        batch = manager.submit_batch([EXAMPLE_MODELS["TJoint"]])
+        manager.wait_for_job(batch.jobs[0].id)
+        for _ in range(2):
+            lines = "".join(TestManagerGetsMesh._read(manager.get_batch(batch.id)))
+            result = json.loads(lines)
+            assert result["status"] == JobStatus.COMPLETE
+            assert result["mesh"]["mesh"]["points"]
+        assert manager.monitor_batch(batch.id).status == JobStatus.COMPLETE
+
+
+class TestManagerCancelsJob:
+    def test_cancel_job(self, manager: Manager):
+        job_in = manager.submit_job(EXAMPLE_MODELS["KJoint"])
+        assert manager.cancel_job(job_in.id).status == JobStatus.CANCELLED
+        job_out = manager.wait_for_job(job_in.id)
+        assert job_out.status == JobStatus.CANCELLED
+        assert manager.monitor_job(job_in.id).status == JobStatus.CANCELLED
+        # the pool keeps meshing other jobs
+        other = manager.submit_job(EXAMPLE_MODELS["TOffset"])
+        assert manager.wait_for_job(other.id).status == JobStatus.COMPLETE
+
+    def test_cancel_finished_job(self, manager: Manager):
+        job_in = manager.submit_job(EXAMPLE_MODELS["TJoint"])
+        manager.wait_for_job(job_in.id)
+        assert manager.cancel_job(job_in.id).status == JobStatus.COMPLETE
+
+    def test_cancel_missing_job(self, manager: Manager):
+        assert manager.cancel_job("missing").status == JobStatus.NOTFOUND
@@ -0,0 +1,115 @@
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.interfaces.examples.joints import EXAMPLE_MODELS
+from app.server.worker.jobs.job import Job, JobStatus
+from app.modelling.mesher.session import available_cpus
+from app.server.worker.pool import WorkerPool
+from app.server.worker.worker import RECYCLE
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(2)
+    pool.start()
+    yield pool
+    pool.stop()
+
+
+class TestPoolStartStop:
+    def test_pool_start_stop(self, pool):
+        assert pool.size == 2
+        assert all(worker.is_alive() for worker in pool.workers)
+
+    def test_pool_size_validated(self):
+        with pytest.raises(ValueError):
+            WorkerPool(0)
+
+    def test_pool_shares_cpus(self):
+        assert 1 <= WorkerPool(2).threads <= max(1, available_cpus() // 2)
+
+
+class TestPoolDispatch:
+    def test_least_loaded_dispatch(self, pool):
+        first = pool.submit(Job(EXAMPLE_MODELS["TJoint"]))
+        second = pool.submit(Job(EXAMPLE_MODELS["TJoint"]))
+        assert pool.load == [1, 1]
+        assert pool.outqueue(first.id) is not pool.outqueue(second.id)
+        pool.finish(first.id)
+        assert pool.load == [0, 1]
+        assert pool.outqueue(first.id) is None
+
+    def test_pool_runs_job(self, pool):
+        job = pool.submit(Job(EXAMPLE_MODELS["TJoint"]))
+        outqueue = pool.outqueue(job.id)
+        assert outqueue.get(timeout=5).status == JobStatus.RUNNING
+        output = outqueue.get(timeout=60)
+        assert output.id == job.id
+        assert output.status == JobStatus.COMPLETE
+
+
+class TestPoolRecovery:
+    def test_only_crashed_worker_replaced(self, pool):
+        job = pool.submit(Job(EXAMPLE_MODELS["TJoint"]))
+        crashed = pool.workers[0]
+        survivor = pool.workers[1]
+        crashed.terminate()
+        crashed.join()
+        recovered = pool.recover()
+        assert len(recovered) == 1
+        worker, job_ids = recovered[0]
+        assert job_ids == {job.id}
+        assert worker.is_alive()
+        assert pool.workers[0] is worker
+        assert pool.workers[1] is survivor
+        assert pool.outqueue(job.id) is worker.outqueue
+
+    def test_recycle_moves_queued_jobs(self):
+        # the session recycles its worker after each job
+        pool = WorkerPool(1, max_jobs=1)
+        pool.start()
+        try:
+            recycled = pool.workers[0]
+            first = pool.submit(Job(EXAMPLE_MODELS["TJoint"]))
+            queued = pool.submit(Job(EXAMPLE_MODELS["TJoint"]))
+            assert recycled.outqueue.get(timeout=5).status == JobStatus.RUNNING
+            assert recycled.outqueue.get(timeout=60).status == JobStatus.COMPLETE
+            pool.finish(first.id)
+            assert recycled.outqueue.get(timeout=5) == RECYCLE
+            recycled.join(5)
+            assert recycled.recycling
+            # recycled workers are left for the dispatcher to replace
+            assert pool.recover() == []
+            worker = pool.recycle(0)
+            assert worker is not recycled
+            assert pool.outqueue(queued.id) is worker.outqueue
+            output = worker.outqueue.get(timeout=5)
+            assert output.id == queued.id
+            assert output.status == JobStatus.RUNNING
+        finally:
+            pool.stop()
+
+
+class TestPoolStopsJobs:
+    def test_remove_queued(self):
+        # workers are not started so jobs stay queued
+        pool = WorkerPool(2)
+        first = pool.submit(Job(EXAMPLE_MODELS["TJoint"]))
+        second = pool.submit(Job(EXAMPLE_MODELS["TJoint"]))
+        assert pool.remove_queued(first.id)
+        assert not pool.remove_queued(first.id)
+        assert pool.owner(first.id) is None
+        assert pool.owner(second.id) is not None
+
+    def test_kill_replaces_worker(self, pool):
+        job = pool.submit(Job(EXAMPLE_MODELS["KJoint"]))
+        idx = pool.owner(job.id)
+        killed = pool.workers[idx]
+        survivor = pool.workers[1 - idx]
+        pool.kill(idx)
+        assert not killed.is_alive()
+        assert pool.workers[idx] is not killed
+        assert pool.workers[idx].is_alive()
+        assert pool.workers[1 - idx] is survivor
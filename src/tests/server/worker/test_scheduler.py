@@ -0,0 +1,93 @@
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.interfaces.examples.joints import EXAMPLE_MODELS
+from app.server.worker.jobs.job import Job
+from app.server.worker.scheduler import Priority, Scheduler
+
+
+def new_job() -> Job:
+    return Job(EXAMPLE_MODELS["TJoint"])
+
+
+@pytest.fixture
+def scheduler():
+    return Scheduler()
+
+
+class TestScheduler:
+    def test_empty_pop(self, scheduler):
+        assert scheduler.pop() is None
+        assert len(scheduler) == 0
+
+    def test_interactive_before_bulk(self, scheduler):
+        bulk = new_job()
+        interactive = new_job()
+        scheduler.push(bulk, Priority.BULK, "a", 1)
+        scheduler.push(interactive, Priority.INTERACTIVE, "a", 100)
+        assert scheduler.pop() is interactive
+        assert scheduler.pop() is bulk
+        assert scheduler.pop() is None
+
+    def test_shortest_job_first(self, scheduler):
+        large = new_job()
+        small = new_job()
+        scheduler.push(large, client="a", cost=100)
+        scheduler.push(small, client="a", cost=1)
+        assert scheduler.pop() is small
+        assert scheduler.pop() is large
+
+    def test_equal_cost_in_submission_order(self, scheduler):
+        jobs = [new_job() for _ in range(3)]
+        for job in jobs:
+            scheduler.push(job, client="a")
+        assert [scheduler.pop() for _ in jobs] == jobs
+
+    def test_fair_share_between_clients(self, scheduler):
+        batch = [new_job() for _ in range(5)]
+        for job in batch:
+            scheduler.push(job, Priority.BULK, "a", 10)
+        assert scheduler.pop() is batch[0]
+        assert scheduler.pop() is batch[1]
+        # a client joining later is not stuck behind the rest of the batch
+        other = new_job()
+        scheduler.push(other, Priority.BULK, "b", 10)
+        assert scheduler.pop() is batch[2]
+        assert scheduler.pop() is other
+        assert scheduler.pop() is batch[3]
+
+    def test_clients_take_turns(self, scheduler):
+        first = [new_job() for _ in range(2)]
+        second = [new_job() for _ in range(2)]
+        for a, b in zip(first, second):
+            scheduler.push(a, client="a")
+            scheduler.push(b, client="b")
+        popped = [scheduler.pop() for _ in range(4)]
+        assert popped == [first[0], second[0], first[1], second[1]]
+
+    def test_remove(self, scheduler):
+        removed = new_job()
+        kept = new_job()
+        scheduler.push(removed, client="a", cost=1)
+        scheduler.push(kept, client="a", cost=2)
+        assert removed.id in scheduler
+        assert scheduler.remove(removed.id)
+        assert removed.id not in scheduler
+        assert not scheduler.remove(removed.id)
+        assert len(scheduler) == 1
+        assert scheduler.pop() is kept
+        assert scheduler.pop() is None
+
+    def test_idle_clients_forgotten(self, scheduler):
+        popped, removed = new_job(), new_job()
+        scheduler.push(popped, client="a")
+        scheduler.push(removed, client="b")
+        scheduler.pop()
+        scheduler.remove(removed.id)
+        assert scheduler._served == {}
+        # a returning client is served again
+        job = new_job()
+        scheduler.push(job, client="a")
+        assert scheduler.pop() is job
@@ -0,0 +1,61 @@
+import numpy as np
+import os
+import pytest
+import sys
+
+sys.path.append("src")
+
+from app.interfaces import DashVtkMesh, DashVtkModel
+from app.server.worker.transport import (
+    SharedMesh,
+    attach_mesh,
+    discard_mesh,
+    remove_worker_meshes,
+    share_mesh,
+)
+
+
+@pytest.fixture
+def model() -> DashVtkModel:
+    return DashVtkModel(
+        name="Two quads",
+        mesh=DashVtkMesh(
+            points=[0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0, 2.0, 0.5, 0.1],
+            polys=[4, 0, 1, 2, 3, 3, 1, 4, 2],
+            lines=[5, 0, 1, 2, 3, 0, 4, 1, 4, 2, 1],
+        ),
+    )
+
+
+class TestSharedMesh:
+    def test_share_and_attach(self, model: DashVtkModel):
+        shared = share_mesh("job", model)
+        assert os.path.getsize(shared.path) == shared.size
+        mesh = attach_mesh(shared)
+        # the file is removed once mapped
+        assert not os.path.exists(shared.path)
+        assert mesh.name == model.name
+        np.testing.assert_array_equal(mesh.mesh.points, model.mesh.points)
+        np.testing.assert_array_equal(mesh.mesh.polys, model.mesh.polys)
+        np.testing.assert_array_equal(mesh.mesh.lines, model.mesh.lines)
+
+    def test_attached_arrays_are_read_only(self, model: DashVtkModel):
+        mesh = attach_mesh(share_mesh("job", model))
+        with pytest.raises(ValueError):
+            mesh.mesh.points[0] = 1.0
+
+    def test_attach_missing(self):
+        with pytest.raises(OSError):
+            attach_mesh(SharedMesh("/missing/mesh", 8))
+
+    def test_discard(self, model: DashVtkModel):
+        shared = share_mesh("job", model)
+        discard_mesh(shared)
+        assert not os.path.exists(shared.path)
+        # discarding twice is allowed
+        discard_mesh(shared)
+
+    def test_remove_worker_meshes(self, model: DashVtkModel):
+        shared = [share_mesh(id, model) for id in ["first", "second"]]
+        remove_worker_meshes(os.getpid())
+        assert not any(os.path.exists(mesh.path) for mesh in shared)
@@ -1,11 +1,12 @@
 import pytest
 import sys
+import time
 
 sys.path.append("src")
 
 from app.interfaces.examples.joints import EXAMPLE_MODELS
 from app.server.worker.jobs.job import Job
-from app.server.worker.worker import Worker, WorkerException
+from app.server.worker.worker import MemoryWatchdog, Worker, WorkerException
 
 
 @pytest.fixture
@@ -29,3 +30,18 @@ class TestWorkerRunsJob:
         assert jobin.id == jobout.id
         assert jobout.error is None
         assert jobin.data == jobout.data
+
+
+class TestMemoryWatchdog:
+    def test_watchdog_fires(self):
+        exceeded = []
+        with MemoryWatchdog(0, exceeded.append, interval=0.01):
+            time.sleep(0.2)
+        assert len(exceeded) == 1
+        assert exceeded[0] > 0
+
+    def test_watchdog_within_limit(self):
+        exceeded = []
+        with MemoryWatchdog(1024**5, exceeded.append, interval=0.01):
+            time.sleep(0.05)
+        assert exceeded == []